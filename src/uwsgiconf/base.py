@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from importlib import import_module
 from typing import TYPE_CHECKING, Any, Union
 
 from .utils import listify
@@ -10,12 +11,28 @@ if TYPE_CHECKING:
 class Options:
     """Options descriptor. Allows option."""
 
-    def __init__(self, opt_type: type['OptionsGroup']):
+    __slots__ = ['_opt_type', 'key']
+
+    def __init__(self, opt_type: type['OptionsGroup'] | str):
         """
-        :param opt_type:
+        :param opt_type: Options group class or its dotted path,
+            e.g. ``uwsgiconf.options.workers.Workers``.
+            Dotted path allows deferring options group module import till first access.
 
         """
-        self.opt_type = opt_type
+        self._opt_type = opt_type
+        self.key = opt_type.rpartition('.')[2] if isinstance(opt_type, str) else opt_type.__name__
+
+    @property
+    def opt_type(self) -> type['OptionsGroup']:
+        """Options group class."""
+        opt_type = self._opt_type
+
+        if isinstance(opt_type, str):
+            module_path, _, cls_name = opt_type.rpartition('.')
+            opt_type = self._opt_type = getattr(import_module(module_path), cls_name)
+
+        return opt_type
 
     def __get__(self, section: 'Section', section_cls: type['Section']) -> Union['OptionsGroup', type['OptionsGroup']]:
         """
@@ -24,7 +41,7 @@ class Options:
         :param section_cls:
 
         """
-        key = self.opt_type.__name__
+        key = self.key
 
         try:
             options_obj = section._options_objects.get(key)
@@ -64,6 +81,18 @@ class OptionKey:
         return hash(self.key)
 
 
+class OptionKeyOrdered(OptionKey):
+    """Option key which is not merged with other keys of the same name.
+
+    Allows preserving relative order of options where it matters (e.g. routing rules).
+
+    """
+    __slots__ = []
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+
 class OptionsGroup:
     """Introduces group of options.
 
@@ -119,7 +148,7 @@ class OptionsGroup:
 
     def _set(
             self,
-            key: str,
+            key: str | OptionKey,
             value: Any,
             *,
             condition: bool | str | None = True,
@@ -130,7 +159,7 @@ class OptionsGroup:
     ):
         """
 
-        :param key: Option name
+        :param key: Option name. See also ``OptionKeyOrdered``.
 
         :param value: Option value. Can be a lis if ``multi``.
 
@@ -147,7 +176,8 @@ class OptionsGroup:
         :param priority: Option priority indicator. Options with lower numbers will come first.
 
         """
-        key = OptionKey(key)
+        if not isinstance(key, OptionKey):
+            key = OptionKey(key)
 
         def set_plugin(plugin):
             self._section.set_plugins_params(plugins=plugin)
@@ -1,12 +1,13 @@
 import sys
 from contextlib import contextmanager
+from pathlib import Path
 
 import click
 
 from uwsgiconf import VERSION
 from uwsgiconf.exceptions import ConfigurationError
 from uwsgiconf.sysinit import TYPE_SYSTEMD, TYPES, get_config
-from uwsgiconf.utils import ConfModule, UwsgiRunner
+from uwsgiconf.utils import ConfModule, UwsgiRunner, compile_modules, precompress_statics
 
 
 @contextmanager
@@ -36,29 +37,113 @@ arg_conf = click.argument(
 @base.command()
 @arg_conf
 @click.option('--only', help='Configuration alias from module to run uWSGI with.')
-def run(conf, only):
+@click.option('--cached', is_flag=True, help='Use compiled configuration cache on uWSGI (re)starts.')
+def run(conf, only, cached):
     """Runs uWSGI passing to it using the default or another `uwsgiconf` configuration module.
 
     """
     with errorprint():
         config = ConfModule(conf)
-        spawned = config.spawn_uwsgi(only=only)
+        spawned = config.spawn_uwsgi(only=only, cached=cached)
 
         for alias, pid in spawned:
             click.secho(f"Spawned uWSGI for configuration aliased '{alias}'. PID {pid}", fg='green')
 
 
 @base.command()
-@arg_conf
-def compile(conf):
+@click.argument('conf', default=ConfModule.default_name)
+@click.option(
+    '--all', 'all_', is_flag=True,
+    help='Compile all modules from directory or glob (e.g. "vassals/*/uwsgicfg.py") given in CONF into .ini files.')
+@click.option('--jobs', type=int, help='Number of processes to use with --all. Default: CPU count.')
+@click.option(
+    '--target', type=click.Path(file_okay=False, writable=True),
+    help='Directory to put .ini files into with --all. Default: module directory.')
+def compile(conf, all_, jobs, target):
     """Compiles classic uWSGI configuration file using the default
     or given `uwsgiconf` configuration module.
 
+    """
+    if not all_:
+        if not Path(conf).is_file():
+            raise click.BadParameter(f"File '{conf}' does not exist.", param_hint="'CONF'")
+
+        with errorprint():
+            config = ConfModule(conf)
+            for conf in config.configurations:
+                conf.format(do_print=True)
+
+        return
+
+    failed = False
+
+    for result in compile_modules(ConfModule.find(conf), target_dir=target, jobs=jobs):
+        timing = f'[{result.duration:.3f}s]'
+
+        if result.error:
+            failed = True
+            click.secho(f'{result.module}: {result.error} {timing}', err=True, fg='red')
+            continue
+
+        click.secho(
+            f'{result.module}: {len(result.written)} written, {len(result.unchanged)} unchanged {timing}',
+            fg='green' if result.written else None)
+
+    if failed:
+        sys.exit(1)
+
+
+@base.command()
+@click.argument('dirs', nargs=-1, required=True, type=click.Path(exists=True, file_okay=False))
+@click.option('--brotli', is_flag=True, help='Also write Brotli (.br) compressed files. Requires `brotli` package.')
+@click.option('--jobs', type=int, help='Number of threads to use. Default: CPU count.')
+def precompress(dirs, brotli, jobs):
+    """Writes gzipped versions of static files from given directories
+    for uWSGI to serve them instead of compressing on the fly.
+
     """
     with errorprint():
-        config = ConfModule(conf)
-        for conf in config.configurations:
-            conf.format(do_print=True)
+        result = precompress_statics(dirs, brotli=brotli, jobs=jobs)
+
+    click.secho(
+        f'{len(result.written)} written, {result.unchanged} unchanged, {len(result.removed)} removed',
+        fg='green' if result.written else None)
+
+
+@base.command()
+@click.argument('logs', nargs=-1)
+@click.option(
+    '--conf', type=click.Path(exists=True, dir_okay=False),
+    help='Configuration module to take log format from. Default: uWSGI default log format.')
+@click.option('--only', help='Configuration alias from module to take log format from.')
+@click.option('--format', 'template', help='Log format template, e.g. "%(method) %(uri) %(status) %(msecs)".')
+@click.option('--by', type=click.Choice(['route', 'status']), default='route', help='Group statistics by.')
+@click.option('--limit', type=int, default=20, help='Number of rows to output.')
+def logstat(logs, conf, only, template, by, limit):
+    """Outputs per route or status requests statistics (latency percentiles)
+    from uWSGI requests log files (.gz supported) or stdin.
+
+    """
+    from uwsgiconf.logstat import LogParser, LogStat  # noqa: PLC0415
+
+    parser = None
+
+    if template:
+        parser = LogParser(template)
+
+    elif conf:
+        with errorprint():
+            for config in ConfModule(conf).configurations:
+                if not only or config.alias == only:
+                    parser = LogParser.from_section(config.sections[0])
+                    break
+
+    with errorprint():
+        stat = LogStat(parser)
+
+    stat.feed_files(logs or ['-'])
+
+    click.echo(stat.format_report(by=by, limit=limit))
 
 
 @base.command()
@@ -0,0 +1,265 @@
+"""Compiled configuration cache.
+
+Allows uWSGI ``exec://`` configuration loading to skip importing
+the configuration module (and everything it imports, e.g. Django settings)
+if nothing relevant has changed since the last compilation.
+
+.. warning:: This module is run by uWSGI on every start and reload,
+    so it deliberately relies only on the standard library.
+
+"""
+import hashlib
+import json
+import os
+import runpy
+import sys
+import sysconfig
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from . import VERSION
+from .settings import ENV_CONF_CACHE_DIR, ENV_CONF_CACHE_ENV, ENV_CONF_READY
+
+ENV_PREFIXES = ('UWSGICONF_', 'DJANGO_')
+"""Environment variables with these prefixes are considered relevant for compilation."""
+
+
+def get_cache_dir() -> Path:
+    """Returns a directory to store compiled configurations into."""
+    dir_ = os.environ.get(ENV_CONF_CACHE_DIR)
+
+    if not dir_:
+        dir_ = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'uwsgiconf'
+
+    return Path(dir_)
+
+
+def get_digest(data: bytes) -> str:
+    """Returns hex digest for the given data."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ConfCache:
+    """Content addressed cache for compiled (INI) configurations.
+
+    Entries are keyed by a hash of configuration module source, sources
+    of modules imported by it and relevant environment variables.
+
+    .. code-block:: python
+
+        ini = ConfCache('/here/uwsgicfg.py', alias='mine').load()
+
+    """
+    def __init__(self, fpath: str | Path, *, alias: str, cache_dir: str | Path | None = None):
+        """
+        :param fpath: Configuration module filepath.
+
+        :param alias: Configuration alias.
+
+        :param cache_dir: Directory to store cache in.
+            If not set ``UWSGICONF_CONF_CACHE_DIR`` env variable or user cache directory is used.
+
+        """
+        self.fpath = Path(fpath).absolute()
+        self.alias = alias
+        self.cache_dir = Path(cache_dir or get_cache_dir())
+
+        # Snapshot before compilation since configuration module itself may alter env.
+        self.env = self.get_env()
+
+    @property
+    def index_path(self) -> Path:
+        """Path to an index file listing configuration module dependencies."""
+        return self.cache_dir / f"{get_digest(f'{self.fpath}|{self.alias}'.encode())}.json"
+
+    @classmethod
+    def get_env(cls) -> dict[str, str]:
+        """Returns environment variables relevant for configuration compilation.
+
+        These are variables prefixed with ``ENV_PREFIXES`` and those listed
+        (comma-separated) in ``UWSGICONF_CONF_CACHE_ENV``.
+
+        """
+        environ = os.environ
+        names = {name.strip() for name in environ.get(ENV_CONF_CACHE_ENV, '').split(',') if name.strip()}
+        names.update(name for name in environ if name.startswith(ENV_PREFIXES))
+        names.discard(ENV_CONF_READY)
+
+        return {name: environ[name] for name in sorted(names) if name in environ}
+
+    def get_key(self, deps: dict[str, str]) -> str:
+        """Returns cache entry key.
+
+        :param deps: Dependencies filepaths mapped to their content hashes.
+
+        """
+        data = {
+            'version': VERSION,
+            'python': sys.version,
+            'alias': self.alias,
+            'deps': sorted(deps.items()),
+            'env': self.env,
+        }
+        return get_digest(json.dumps(data).encode())
+
+    def _read_index(self) -> dict[str, list]:
+        try:
+            return json.loads(self.index_path.read_text())
+
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, path: Path, data: str):
+        # Atomic write: concurrent vassals may compile the same configuration.
+        path_tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        path_tmp.write_text(data)
+        path_tmp.replace(path)
+
+    @classmethod
+    def _get_fingerprint(cls, fpath: str) -> list | None:
+        try:
+            stat = Path(fpath).stat()
+
+        except OSError:
+            return None
+
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def get(self) -> str | None:
+        """Returns compiled configuration from cache or None if
+        there is no valid cache entry.
+
+        """
+        index = self._read_index()
+
+        if not index:
+            return None
+
+        deps = {}
+        touched = False
+
+        for fpath, (mtime, size, digest) in index.items():
+            fingerprint = self._get_fingerprint(fpath)
+
+            if fingerprint is None:
+                return None
+
+            if fingerprint != [mtime, size]:
+                # File is touched. Check whether contents really changed.
+                digest = get_digest(Path(fpath).read_bytes())
+                index[fpath] = [*fingerprint, digest]
+                touched = True
+
+            deps[fpath] = digest
+
+        try:
+            ini = (self.cache_dir / f'{self.get_key(deps)}.ini').read_text()
+
+            if touched:
+                # Spare hashing of touched but unchanged files next time.
+                self._write(self.index_path, json.dumps(index))
+
+        except OSError:
+            return None
+
+        return ini
+
+    def put(self, ini: str, *, deps: list[str]):
+        """Puts compiled configuration into cache.
+
+        :param ini: Compiled configuration.
+
+        :param deps: Filepaths of configuration module dependencies.
+
+        """
+        index = {}
+
+        for fpath in {f'{self.fpath}', *deps}:
+            fingerprint = self._get_fingerprint(fpath)
+
+            if fingerprint is not None:
+                index[fpath] = [*fingerprint, get_digest(Path(fpath).read_bytes())]
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write(self.cache_dir / f'{self.get_key({key: val[2] for key, val in index.items()})}.ini', ini)
+            self._write(self.index_path, json.dumps(index))
+
+        except OSError:
+            # Cache is an optimization. Unwritable cache directory should not break configuration.
+            pass
+
+    def compile(self) -> str:
+        """Compiles configuration running configuration module
+        the same way uWSGI does it with ``exec://`` and caches the result.
+
+        """
+        fpath = self.fpath
+        modules_before = set(sys.modules)
+
+        argv, path = sys.argv, sys.path
+        sys.argv = [f'{fpath}', '--conf', self.alias]
+        sys.path = [f'{fpath.parent}', *path]
+
+        out = StringIO()
+
+        try:
+            with redirect_stdout(out):
+                runpy.run_path(f'{fpath}', run_name='__main__')
+
+        finally:
+            sys.argv, sys.path = argv, path
+
+        ini = out.getvalue()
+
+        if ini:
+            self.put(ini, deps=self.get_deps(set(sys.modules) - modules_before))
+
+        return ini
+
+    @classmethod
+    def get_deps(cls, module_names: set[str]) -> list[str]:
+        """Returns filepaths of the given modules excluding standard library ones.
+
+        :param module_names:
+
+        """
+        stdlib = tuple({sysconfig.get_path('stdlib'), sysconfig.get_path('platstdlib')})
+        deps = []
+
+        for name in module_names:
+            fpath = getattr(sys.modules.get(name), '__file__', None)
+
+            if fpath and not fpath.startswith(stdlib):
+                deps.append(fpath)
+
+        return deps
+
+    def load(self) -> str:
+        """Returns compiled configuration either from cache
+        or compiling it if required.
+
+        """
+        ini = self.get()
+
+        if ini is None:
+            ini = self.compile()
+
+        return ini
+
+
+def main(argv: list[str] | None = None):
+    """Loader entry point. Prints out compiled configuration.
+
+    Usage: python -m uwsgiconf.confcache uwsgicfg.py --conf <alias>
+
+    :param argv:
+
+    """
+    fpath, _, alias = (argv or sys.argv[1:])[:3]
+    sys.stdout.write(ConfCache(fpath, alias=alias).load())
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,3 @@
-import inspect
 import os
 import sys
 from collections.abc import Callable
@@ -7,16 +6,17 @@ from datetime import datetime, timezone
 from functools import partial
 from itertools import chain
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Any, ClassVar, TypeVar, Union
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, Union
 
 from .base import Options, OptionsGroup
 from .exceptions import ConfigurationError
 from .formatters import FORMATTERS, format_print_text
-from .options import *
 from .typehints import Pathlist, Strlist, Strpath
 from .utils import UwsgiRunner, listify
 
+if TYPE_CHECKING:
+    from .options import *
+
 TypeSection = TypeVar('TypeSection', bound='Section')
 
 
@@ -49,58 +49,61 @@ class Section(OptionsGroup):
                 )
 
     """
-    alarms: Alarms = Options(Alarms)
+    alarms: 'Alarms' = Options('uwsgiconf.options.alarms.Alarms')
     """Alarms options group."""
 
-    applications: Applications = Options(Applications)
+    applications: 'Applications' = Options('uwsgiconf.options.applications.Applications')
     """Applications options group."""
 
-    caching: Caching = Options(Caching)
+    caching: 'Caching' = Options('uwsgiconf.options.caching.Caching')
     """Caching options group."""
 
-    cheapening: Cheapening = Options(Cheapening)
+    cheapening: 'Cheapening' = Options('uwsgiconf.options.workers.Cheapening')
     """Cheapening options group."""
 
-    empire: Empire = Options(Empire)
+    empire: 'Empire' = Options('uwsgiconf.options.empire.Empire')
     """Emperor and vassals options group."""
 
-    locks: Locks = Options(Locks)
+    locks: 'Locks' = Options('uwsgiconf.options.locks.Locks')
     """Locks options group."""
 
-    logging: Logging = Options(Logging)
+    logging: 'Logging' = Options('uwsgiconf.options.logging.Logging')
     """Logging options group."""
 
-    main_process: MainProcess = Options(MainProcess)
+    main_process: 'MainProcess' = Options('uwsgiconf.options.main_process.MainProcess')
     """Main process options group."""
 
-    master_process: MasterProcess = Options(MasterProcess)
+    master_process: 'MasterProcess' = Options('uwsgiconf.options.master_process.MasterProcess')
     """Master process options group."""
 
-    monitoring: Monitoring = Options(Monitoring)
+    monitoring: 'Monitoring' = Options('uwsgiconf.options.monitoring.Monitoring')
     """Monitoring options group."""
 
-    networking: Networking = Options(Networking)
+    networking: 'Networking' = Options('uwsgiconf.options.networking.Networking')
     """Networking options group."""
 
-    queue: Queue = Options(Queue)
+    queue: 'Queue' = Options('uwsgiconf.options.queue.Queue')
     """Queue options group."""
 
-    routing: Routing = Options(Routing)
+    routing: 'Routing' = Options('uwsgiconf.options.routing.Routing')
     """Routing related options group."""
 
-    spooler: Spooler = Options(Spooler)
+    shared_area: 'SharedArea' = Options('uwsgiconf.options.sharedarea.SharedArea')
+    """Shared area options group."""
+
+    spooler: 'Spooler' = Options('uwsgiconf.options.spooler.Spooler')
     """Spooler options group."""
 
-    statics: Statics = Options(Statics)
+    statics: 'Statics' = Options('uwsgiconf.options.statics.Statics')
     """Static file serving options group."""
 
-    subscriptions: Subscriptions = Options(Subscriptions)
+    subscriptions: 'Subscriptions' = Options('uwsgiconf.options.subscriptions.Subscriptions')
     """Subscription services options group."""
 
-    workers: Workers = Options(Workers)
+    workers: 'Workers' = Options('uwsgiconf.options.workers.Workers')
     """Workers options group."""
 
-    python: Python = Options(Python)
+    python: 'Python' = Options('uwsgiconf.options.python.Python')
     """Python options group."""
 
     class embedded_plugins_presets:
@@ -118,10 +121,14 @@ class Section(OptionsGroup):
 
         @staticmethod
         def PROBE(uwsgi_binary: str | None = None):
-            """This preset allows probing real uWSGI to get actual embedded plugin list."""
+            """This preset allows probing real uWSGI to get actual embedded plugin list.
+
+            Probe results are cached (in-process and on disk) for the given uWSGI binary,
+            so that it is not run on every section construction.
 
+            """
             def probe() -> list[str]:
-                return list(chain.from_iterable(UwsgiRunner(uwsgi_binary).get_plugins()))
+                return list(chain.from_iterable(UwsgiRunner(uwsgi_binary).get_plugins(cached=True)))
 
             return probe
 
@@ -730,6 +737,8 @@ class Configuration:
 
         """
         if filepath is None:
+            from tempfile import NamedTemporaryFile  # noqa: PLC0415
+
             with NamedTemporaryFile(prefix=f'{self.alias}_', suffix='.ini', delete=False) as f:
                 filepath = f.name
 
@@ -837,7 +846,20 @@ def configure_uwsgi(configurator_func: Callable) -> list[Configuration] | None:
     else:
         # This call is from module containing uWSGI configurations.
         # Set module attribute automatically.
-        config_module = inspect.currentframe().f_back
+        from inspect import currentframe  # noqa: PLC0415
+
+        config_module = currentframe().f_back
         config_module.f_locals[CONFIGS_MODULE_ATTR] = conf_list
 
     return conf_list
+
+
+def __getattr__(name: str):
+    # Options groups classes are still available from here
+    # but imported only on demand.
+    from . import options  # noqa: PLC0415
+
+    if name in options.__all__:
+        return getattr(options, name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -107,6 +107,9 @@ class WorkersAdmin(OnePageAdmin):
             'signals': (_('Signals'), None),
             'rss': (_('RSS'), lambda val: filesizeformat(val)),
             'vsz': (_('VSZ'), lambda val: filesizeformat(val)),
+            'pss': (_('PSS'), lambda val: filesizeformat(val)),
+            'uss': (_('USS'), lambda val: filesizeformat(val)),
+            'shared': (_('Shared'), lambda val: filesizeformat(val)),
             'tx': (_('Transmitted'), lambda val: filesizeformat(val)),
             'avg_rt': (_('Avg. response'), lambda val: timedelta(microseconds=val)),
             'apps': (None, lambda val: iter_items(val, info_app_map)),
@@ -146,7 +149,13 @@ class WorkersAdmin(OnePageAdmin):
 
                     yield idx, keyname, name, value
 
-        for idx_worker, keyname_worker, name_worker, value_worker in iter_items(uwsgi.workers_info, info_worker_map):
+        workers_memory = uwsgi.workers_memory
+        workers_info = [
+            {**info, **{key: val for key, val in workers_memory.get(info['id'], {}).items() if key not in info}}
+            for info in uwsgi.workers_info
+        ]
+
+        for idx_worker, keyname_worker, name_worker, value_worker in iter_items(workers_info, info_worker_map):
 
             if keyname_worker == 'apps':
                 # Get info about applications served by worker,
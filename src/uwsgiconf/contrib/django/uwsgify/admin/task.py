@@ -26,7 +26,7 @@ class TaskAdmin(admin.ModelAdmin):
             'fields': ('name', 'info', 'active', 'released', 'duration'),
         }),
         (_('Date and time'), {
-            'fields': ('dt_created', 'dt_updated', 'dt_acquired', 'dt_released'),
+            'fields': ('dt_created', 'dt_updated', 'dt_acquired', 'dt_released', 'dt_lease'),
         }),
         (_('Context'), {
             'fields': ('owner', 'params', 'result'),
@@ -1,6 +1,10 @@
 import pickle
+from socket import gethostname
+from time import monotonic
 from typing import Any
+from uuid import uuid4
 
+from django.core.cache import caches
 from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
 from uwsgiconf.runtime.caching import Cache as _Cache
 
@@ -37,8 +41,11 @@ class UwsgiCache(BaseCache):
         )
 
     def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None) -> bool:
-        self._set(key, value, timeout=timeout, version=version)
-        return True
+        return self._cache.add(
+            self.make_and_validate_key(key, version=version),
+            pickle.dumps(value),
+            timeout=self._resolve_uwsgi_timeout(timeout)
+        )
 
     def get(self, key, default=None, version=None) -> Any:
         value = self._cache.get(
@@ -70,3 +77,140 @@ class UwsgiCache(BaseCache):
 
     def clear(self):
         self._cache.clear()
+
+
+class CacheLock:
+    """Lease lock on top of Django cache.
+
+    Acquirement is an atomic cache add of a unique owner token,
+    so that only one of the contenders succeeds. The lock expires
+    with its lease (cache entry timeout) if not released or extended.
+
+    Cheap enough to be used per request, e.g. for deduplication:
+
+    .. code-block:: python
+
+        def pay(request, order_id):
+
+            with CacheLock(f'pay-{order_id}', timeout=30, fencing=False) as acquired:
+
+                if not acquired:
+                    return HttpResponse(status=409)
+
+                ...
+
+    .. note:: The lock object holds the acquirement state,
+        so create one per acquirement (do not share between threads).
+
+    .. warning:: Requires a cache with atomic ``add()`` shared by all contenders,
+        e.g. Redis, Memcached, database cache or uWSGI cache (``UwsgiCache``).
+
+    """
+    margin: float = 1
+    """Seconds before the lease expiration to consider the lock lost.
+    Guards release and extension from interfering with the next owner
+    (cache has no atomic compare-and-delete)."""
+
+    def __init__(self, name: str, *, cache_name: str = 'default', timeout: int = 1200, fencing: bool = True):
+        """
+        :param name: Lock name (cache key).
+
+        :param cache_name: Django cache alias.
+
+        :param timeout: Lease duration (seconds).
+
+        :param fencing: Issue a fencing token on acquirement. Takes an additional cache round trip.
+            Fencing token is a number increasing with every acquirement of the lock.
+            Pass it to a storage to reject writes from an owner whose lease has expired.
+
+        """
+        self.name = name
+        self.cache_name = cache_name
+        self.timeout = timeout
+        self.fencing = fencing
+
+        self.owner: str = ''
+        """Unique token of the current owner. Empty if not acquired."""
+
+        self.token: int | None = None
+        """Fencing token of the current acquirement."""
+
+        self._expires: float = 0
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.owner:
+            self.release()
+
+    @property
+    def cache(self) -> BaseCache:
+        return caches[self.cache_name]
+
+    @property
+    def is_acquired(self) -> bool:
+        """Whether the lock is acquired and its lease is not about to expire."""
+        return bool(self.owner) and monotonic() < self._expires - self.margin
+
+    def acquire(self) -> bool:
+        """Tries to acquire the lock. Returns False if it is held by another owner."""
+        cache = self.cache
+        owner = f'{gethostname()}@{uuid4().hex}'
+        started = monotonic()
+
+        if not cache.add(self.name, owner, timeout=self.timeout):
+            return False
+
+        self.owner = owner
+        self._expires = started + self.timeout
+
+        if self.fencing:
+            self.token = self._get_token(cache)
+
+        return True
+
+    def _get_token(self, cache: BaseCache) -> int:
+        key = f'{self.name}.fence'
+
+        try:
+            return cache.incr(key)
+
+        except ValueError:
+            # First acquirement ever (or the counter is evicted).
+            cache.add(key, 0, timeout=None)
+            return cache.incr(key)
+
+    def _is_owned(self) -> bool:
+        return self.is_acquired and self.cache.get(self.name) == self.owner
+
+    def extend(self, timeout: int | None = None) -> bool:
+        """Prolongs the lease. Returns False if the lock is lost.
+
+        :param timeout: Lease duration (seconds) from now. Default: lock timeout.
+
+        """
+        timeout = timeout or self.timeout
+        started = monotonic()
+
+        if not self._is_owned() or not self.cache.touch(self.name, timeout=timeout):
+            return False
+
+        self._expires = started + timeout
+
+        return True
+
+    def release(self) -> bool:
+        """Releases the lock if it is still owned (compare-and-delete).
+        Returns False if the lock is lost.
+
+        """
+        owned = self._is_owned()
+
+        if owned:
+            self.cache.delete(self.name)
+
+        self.owner = ''
+        self._expires = 0
+
+        return owned
@@ -0,0 +1,86 @@
+from pathlib import Path
+from time import sleep, time
+
+from django.core.management.base import BaseCommand, CommandError
+from uwsgiconf.runtime.profiling import PROFILE_PREFIX, PROFILE_SUFFIX, format_profile, merge_profiles
+
+from ...toolbox import SectionMutator
+
+
+class Command(BaseCommand):
+
+    help = 'Profiles uWSGI workers and outputs merged collapsed stacks (flamegraph)'
+
+    def add_arguments(self, parser):  # pragma: nocover
+
+        super().add_arguments(parser)
+
+        parser.add_argument(
+            '--duration', type=float, default=10, dest='duration',
+            help='Profiling duration (seconds).',
+        )
+        parser.add_argument(
+            '--output', dest='output', default='',
+            help='File to write merged profile into. Default: stdout.',
+        )
+        parser.add_argument(
+            '--wait', type=float, default=5, dest='wait',
+            help='Time (seconds) to wait for workers profiles after profiling is finished.',
+        )
+
+    def handle(self, *args, **options):
+        mutator = SectionMutator.spawn()
+        trigger = mutator.get_profile_filepath()
+
+        if not trigger.exists():
+            raise CommandError(
+                'Unable to find uWSGI profiler trigger file '
+                f'for "{mutator.section.project_name}" project in {trigger}'
+            )
+
+        duration = float(options['duration'])
+        started = time()
+
+        # Workers watch for the file modification.
+        trigger.write_text(f'{duration}')
+        sleep(duration)
+
+        paths = self.collect(trigger.parent, since=started, wait=options['wait'])
+
+        if not paths:
+            raise CommandError(f'No profiles from workers found in {trigger.parent}')
+
+        profile = format_profile(merge_profiles(paths))
+
+        if output := options['output']:
+            Path(output).write_text(profile)
+            self.stderr.write(f'Merged {len(paths)} profile(s) into {output}')
+
+        else:
+            self.stdout.write(profile, ending='')
+
+    def collect(self, directory: Path, *, since: float, wait: float) -> list[Path]:
+        """Returns profiles written after the given time, waiting for them to settle.
+
+        :param directory: Directory to look for profiles in.
+
+        :param since: Timestamp.
+
+        :param wait: Seconds to wait.
+
+        """
+        paths = []
+        deadline = time() + wait
+
+        while True:
+            found = [
+                path for path in directory.glob(f'{PROFILE_PREFIX}*{PROFILE_SUFFIX}')
+                if path.stat().st_mtime >= since
+            ]
+
+            if (found and len(found) == len(paths)) or time() > deadline:
+                # No new profiles since the last check.
+                return found
+
+            paths = found
+            sleep(0.5)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uwsgify', '0003_alter_task_info'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='dt_lease',
+            field=models.DateTimeField(blank=True, db_column='dt_lease', help_text='Date and time when the lease of a running task expires, making the task available for another acquirement.', null=True, verbose_name='Lease expires at'),
+        ),
+    ]
@@ -1,24 +1,30 @@
+import atexit
 from collections.abc import Callable
-from socket import gethostname
 
-from django.core.cache import caches
-from django.utils import timezone
 from uwsgiconf.runtime.task_utils import (
     BackendBase,
     DummyBackend,  # noqa backward compat
+    LegionBackend,  # noqa available here as well
     TaskContext,
 )
 
+from ..cache import CacheLock
 from ..models import Task
+from ..utils import LOGGER
 from .models import TaskBase
 
 
 class CacheBackend(BackendBase):
     """Allows locking the execution of task function (e.g. uWSGI cron, timer)
     with the help of Django cache.
+
+    Uses ``CacheLock``: the lock is released only by its owner,
+    ``ctx.obj`` is the lock (use ``ctx.obj.extend()`` for long-running tasks)
+    and ``ctx.token`` is a fencing token.
+
     """
 
-    def __init__(self, *, cache_name: str, strict: bool = True, timeout: int = 1200):
+    def __init__(self, *, cache_name: str, strict: bool = True, timeout: int = 1200, fencing: bool = True):
         """
 
         :param cache_name: Django cache alias.
@@ -28,24 +34,27 @@ class CacheBackend(BackendBase):
 
         :param timeout: Cache entry timeout (seconds).
 
+        :param fencing: Issue a fencing token (``ctx.token``) on acquirement.
+
         """
         super().__init__(strict=strict)
         self._cache_name = cache_name
         self._timeout = timeout
+        self._fencing = fencing
 
     def _get_name(self, func: Callable) -> str:
         return f'lock_{super()._get_name(func)}'
 
     def _acquire(self, name: str) -> TaskContext | None:
-        caches[self._cache_name].add(
-            name,
-            value=f"{gethostname()}@{timezone.now()}",
-            timeout=self._timeout
-        )
-        return super()._acquire(name)
+        lock = CacheLock(name, cache_name=self._cache_name, timeout=self._timeout, fencing=self._fencing)
+
+        if not lock.acquire():
+            return None
+
+        return self._ctx(obj=lock, token=lock.token)
 
     def _release(self, *, name: str, ctx: TaskContext):
-        caches[self._cache_name].delete(name)
+        ctx.obj.release()
 
 
 class DbBackend(BackendBase):
@@ -77,3 +86,92 @@ class DbBackend(BackendBase):
 
     def _release(self, *, name: str, ctx: TaskContext):
         ctx.obj.release(result=ctx.result)
+
+
+class LeaseDbBackend(DbBackend):
+    """Allows locking the execution of task function (e.g. uWSGI cron, timer)
+    with the help of Django DB leases.
+
+    Compared to `DbBackend` this reduces database load when many application
+    instances race for frequent tasks:
+
+        * acquirement is a single conditional UPDATE (no transaction and row locks);
+        * hung up tasks are acquirable as soon as their leases expire (no need to reset stale);
+        * releases may be batched.
+
+    Long-running tasks are to prolong their leases with ``ctx.obj.heartbeat()``.
+
+    """
+
+    def __init__(
+            self,
+            *,
+            model_cls: TaskBase | None = None,
+            strict: bool = True,
+            lease: int = TaskBase.LEASE_TIMEOUT,
+            batch: int = 1,
+    ):
+        """
+        :param model_cls: Django model class.
+
+        :param strict: If False, locking exceptions are silenced,
+            effectively allowing task run without a lock.
+
+        :param lease: Lease duration (seconds).
+
+        :param batch: Number of releases to accumulate before writing them
+            into DB (one UPDATE for releases with the same result).
+            Pending releases are also written before the next acquirement
+            and on process exit. Unwritten releases do not block
+            tasks longer than their leases.
+
+        """
+        super().__init__(model_cls=model_cls, strict=strict)
+        self._lease = lease
+        self._batch = batch
+        self._pending: list[tuple[TaskBase, dict | None]] = []
+        self._atexit = False
+
+    def flush(self) -> int:
+        """Writes pending releases into DB. Returns the number of tasks released."""
+        pending = self._pending
+
+        if not pending:
+            return 0
+
+        self._pending = []
+
+        return self._model_cls.release_leases(pending)
+
+    def _acquire(self, name: str) -> TaskContext | None:
+        self.flush()
+
+        task_obj = self._model_cls.acquire_lease(name, lease=self._lease)
+
+        if not task_obj:
+            return None
+
+        return self._ctx(
+            params=task_obj.params,
+            last_result=task_obj.result,
+            obj=task_obj
+        )
+
+    def _flush_at_exit(self):
+        try:
+            self.flush()
+
+        except Exception:  # noqa: BLE001
+            LOGGER.exception('Unable to write pending task releases on exit')
+
+    def _release(self, *, name: str, ctx: TaskContext):
+        pending = self._pending
+        pending.append((ctx.obj, ctx.result))
+
+        if len(pending) >= self._batch:
+            self.flush()
+
+        elif not self._atexit:
+            # Worker recycling or exiting is not to lose pending releases.
+            atexit.register(self._flush_at_exit)
+            self._atexit = True
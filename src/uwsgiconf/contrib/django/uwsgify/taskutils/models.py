@@ -1,4 +1,7 @@
+from collections.abc import Iterable
 from datetime import timedelta
+from functools import reduce
+from operator import or_
 from socket import gethostname
 from typing import Optional
 
@@ -23,6 +26,12 @@ class TaskBase(models.Model):
     STALE_TIMEOUT = 1800  # 30 minutes
     """Timeout (seconds) to consider the task stale (hung up)."""
 
+    LEASE_TIMEOUT = 300  # 5 minutes
+    """Default lease duration (seconds) for lease-based acquirement."""
+
+    lease: int = LEASE_TIMEOUT
+    """Lease duration (seconds) the task has been acquired with."""
+
     active = models.BooleanField(
         verbose_name=_("Active"), blank=True, default=True,
         help_text=_('Task is available for the application to run. Use to temporarily disable runs.'))
@@ -56,6 +65,11 @@ class TaskBase(models.Model):
         verbose_name=_('Released at'), blank=True, null=True, db_column='dt_rel',
         help_text=_('Date and time of the latest task run finish.'))
 
+    dt_lease = models.DateTimeField(
+        verbose_name=_('Lease expires at'), blank=True, null=True, db_column='dt_lease',
+        help_text=_('Date and time when the lease of a running task expires, '
+                    'making the task available for another acquirement.'))
+
     params = models.JSONField(
         verbose_name=_('Parameters'), blank=True, default=dict,
         help_text=_('Parameters passed to the task function.'))
@@ -111,6 +125,161 @@ class TaskBase(models.Model):
 
         return acquired
 
+    @classmethod
+    def acquire_lease(cls, name: str, *, lease: int = LEASE_TIMEOUT, **kwargs) -> Optional['TaskBase']:
+        """Tries to acquire the task for a lease period. Returns `None` on fail
+        (e.g. the task has already been acquired and its lease has not expired).
+
+        Unlike `acquire()` this issues a single conditional UPDATE
+        without a transaction and row locks. The task row is fetched only when acquired.
+        Tasks with expired leases are acquired as released ones, so there is no need
+        for `reset_stale()`.
+
+        :param name: Task name
+
+        :param lease: Lease duration (seconds). Use `heartbeat()` to prolong the lease
+            for long-running tasks.
+
+        """
+        dt_now = now()
+        owner = cls(name=name)._get_owner()
+        manager = cls._get_manager()
+        kwargs = {'active': True, **kwargs}
+
+        updated = manager.filter(
+            models.Q(released=True) | models.Q(dt_lease__lt=dt_now),
+            name=name,
+            **kwargs,
+        ).update(
+            released=False,
+            owner=owner,
+            dt_acquired=dt_now,
+            dt_updated=dt_now,
+            dt_lease=dt_now + timedelta(seconds=lease),
+        )
+
+        if not updated:
+            LOGGER.debug('Task lease is NOT acquired: %s', name)
+            return None
+
+        LOGGER.debug('Task lease is acquired: %s', name)
+
+        acquired = manager.filter(name=name, owner=owner, dt_acquired=dt_now).first()
+
+        if acquired:
+            acquired.lease = lease
+
+        return acquired
+
+    def _filter_leased(self) -> models.QuerySet:
+        # Guards from updating the task which lease has expired and is acquired by another owner.
+        return self._get_manager().filter(
+            pk=self.pk, released=False, owner=self.owner, dt_acquired=self.dt_acquired)
+
+    def renew_lease(self, *, lease: int | None = None) -> bool:
+        """Prolongs the lease of the acquired task.
+        Returns False if the lease is lost (e.g. expired and acquired by another owner).
+
+        :param lease: Lease duration (seconds) from now.
+            Default: the one the task has been acquired with.
+
+        """
+        lease = lease or self.lease
+        dt_now = now()
+        dt_lease = dt_now + timedelta(seconds=lease)
+
+        if not self._filter_leased().update(dt_lease=dt_lease, dt_updated=dt_now):
+            LOGGER.debug('Task lease is lost: %s', self.name)
+            return False
+
+        self.dt_lease = dt_lease
+        self.dt_updated = dt_now
+
+        return True
+
+    def heartbeat(self, *, lease: int | None = None) -> bool:
+        """Prolongs the lease of the acquired task if less than half of the lease remains.
+        Cheap to call frequently from long-running task loops:
+        the database is only hit once in a half of the lease.
+
+        Returns False if the lease is lost, so that the task may stop.
+
+        :param lease: Lease duration (seconds) from now.
+            Default: the one the task has been acquired with.
+
+        """
+        lease = lease or self.lease
+        dt_lease = self.dt_lease
+
+        if dt_lease and dt_lease - now() > timedelta(seconds=lease / 2):
+            return True
+
+        return self.renew_lease(lease=lease)
+
+    def release_lease(self, *, result: dict | None = None) -> bool:
+        """Releases the task acquired with `acquire_lease()`.
+        Returns False if the lease is lost (task is left intact).
+        Use `None` to keep an existing result.
+
+        :param result: Result to store.
+
+        """
+        dt_now = now()
+        fields = {'released': True, 'dt_released': dt_now, 'dt_updated': dt_now, 'dt_lease': None}
+
+        if result is not None:
+            fields['result'] = result
+
+        if not self._filter_leased().update(**fields):
+            LOGGER.debug('Task lease is lost on release: %s', self.name)
+            return False
+
+        for field, value in fields.items():
+            setattr(self, field, value)
+
+        return True
+
+    @classmethod
+    def release_leases(cls, tasks: Iterable[tuple['TaskBase', dict | None]]) -> int:
+        """Releases a batch of tasks acquired with `acquire_lease()`.
+        Returns the number of tasks released.
+
+        Tasks are grouped by result, and a single UPDATE is issued for a group,
+        so releasing tasks with the same results (or `None`) takes just one query.
+        Tasks which leases are lost are left intact. Task objects are not updated.
+
+        :param tasks: Pairs of a task and its result to store (`None` to keep an existing result).
+
+        """
+        groups: list[tuple[dict | None, list[TaskBase]]] = []
+
+        for task, result in tasks:
+            for group_result, group in groups:
+                if group_result == result:
+                    group.append(task)
+                    break
+
+            else:
+                groups.append((result, [task]))
+
+        manager = cls._get_manager()
+        dt_now = now()
+        released = 0
+
+        for result, group in groups:
+            fields = {'released': True, 'dt_released': dt_now, 'dt_updated': dt_now, 'dt_lease': None}
+
+            if result is not None:
+                fields['result'] = result
+
+            # Guards from updating tasks which leases have expired and are acquired by other owners.
+            leased = reduce(or_, (
+                models.Q(pk=task.pk, owner=task.owner, dt_acquired=task.dt_acquired) for task in group))
+
+            released += manager.filter(leased, released=False).update(**fields)
+
+        return released
+
     @property
     @admin.display(description=_('Duration'))
     def duration(self) -> timedelta:
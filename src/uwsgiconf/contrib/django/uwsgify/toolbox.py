@@ -6,13 +6,16 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 from uwsgiconf.presets.nice import PythonSection
-from uwsgiconf.settings import CONFIGS_MODULE_ATTR
+from uwsgiconf.settings import CONFIGS_MODULE_ATTR, ENV_PROFILE
 from uwsgiconf.typehints import Strpath
-from uwsgiconf.utils import ConfModule, UwsgiRunner
+from uwsgiconf.utils import ConfModule, UwsgiRunner, precompress_statics
 
 if TYPE_CHECKING:
     from uwsgiconf.base import Section
 
+STATIC_HASHED_EXPIRES = 365 * 24 * 60 * 60
+"""Expiration (seconds) for static files with content hash in names."""
+
 
 def find_project_dir() -> Path:
     """Runs up the stack to find the location of manage.py
@@ -65,6 +68,14 @@ class SectionMutator:
         """Return master FIFO path for the given project."""
         return self.runtime_dir / 'uwsgi.fifo'
 
+    def get_profile_filepath(self) -> Path:
+        """Return profiler trigger file path for the given project."""
+        return self.runtime_dir / 'uwsgi.profile'
+
+    def get_precompress_dirpath(self) -> Path:
+        """Return static files precompression cache directory path for the given project."""
+        return self.runtime_dir / 'precompress'
+
     @classmethod
     def spawn(cls, options: dict | None = None, dir_base: Strpath = None) -> 'SectionMutator':
         """Alternative constructor. Creates a mutator and returns section object.
@@ -194,12 +205,27 @@ class SectionMutator:
         for url, path in static_tuples:
             path and statics.register_static_map(url, path)
 
+        static_root = settings.STATIC_ROOT
+
+        if static_root:
+            # Serve files precompressed on collection and let clients cache hashed ones.
+            statics.set_gzip_params(dirs=f'{Path(static_root)}/')
+            statics.add_expiration_rule(
+                statics.expiration_criteria.FILENAME, statics.FILENAME_HASHED, timeout=STATIC_HASHED_EXPIRES)
+
         if self.options['compile']:
             return
 
         from django.core.management import call_command  # noqa: PLC0415
         call_command('collectstatic', clear=True, interactive=False)
 
+        if static_root:
+            # Compressed files are kept out of cleared STATIC_ROOT to only compress changed ones.
+            precompress_statics(
+                static_root,
+                cache_dir=self.get_precompress_dirpath() if self.options['contribute_runtimes'] else None,
+            )
+
     def contribute_error_pages(self):
         """Contributes generic static error message pages to an existing section."""
 
@@ -275,6 +301,9 @@ class SectionMutator:
                 fifo_file=self.get_fifo_filepath(),
             )
 
+            # Profiler trigger for `uwsgi_profile` command.
+            section.env(ENV_PROFILE, f'{self.get_profile_filepath()}')
+
         if options['contribute_static']:
             self.contribute_static()
 
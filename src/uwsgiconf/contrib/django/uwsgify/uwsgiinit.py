@@ -3,7 +3,7 @@ from django.apps import apps
 from django.utils.module_loading import autodiscover_modules
 from uwsgiconf import uwsgi
 from uwsgiconf.exceptions import RuntimeConfigurationError
-from uwsgiconf.settings import FORCE_STUB
+from uwsgiconf.settings import FORCE_STUB, get_profile_path
 
 from .settings import MODULE_INIT, MODULE_INIT_DEFAULT
 
@@ -33,6 +33,7 @@ check_for_stub()
 
 
 from uwsgiconf.runtime.platform import uwsgi as uwsgi_platform  # noqa: E402
+from uwsgiconf.runtime.profiling import Profiler  # noqa: E402
 
 
 @uwsgi_platform.postfork_hooks.add()
@@ -41,6 +42,13 @@ def db_close_connections():
     db.connections.close_all()
 
 
+profiler = Profiler()
+"""Sampling profiler. Triggered by `uwsgi_profile` command."""
+
+if profile_path := get_profile_path():
+    profiler.register(profile_path)
+
+
 if apps.apps_ready:
 
     if MODULE_INIT != MODULE_INIT_DEFAULT:
@@ -0,0 +1,94 @@
+import errno
+import select
+import socket
+import time
+
+__WAIT_READ: list[int] = []
+__WAIT_WRITE: list[int] = []
+__TIMEOUT: list[float] = []
+__READY: list[int] = [-1]
+__SOCKETS: dict[int, socket.socket] = {}
+
+
+def wait_fd(*, fd: int, timeout: int | None, write: bool = False):
+    (__WAIT_WRITE if write else __WAIT_READ).append(fd)
+
+    if timeout:
+        __TIMEOUT.append(timeout)
+
+
+def sleep(*, seconds: float):
+    __TIMEOUT.append(seconds)
+
+
+def suspend() -> bool:
+    # The only emulated core blocks until registered events.
+    reads, writes = __WAIT_READ[:], __WAIT_WRITE[:]
+    timeout = min(__TIMEOUT) if __TIMEOUT else None
+
+    __WAIT_READ.clear()
+    __WAIT_WRITE.clear()
+    __TIMEOUT.clear()
+
+    ready = -1
+
+    if reads or writes:
+        ready_read, ready_write, _ = select.select(reads, writes, [], timeout)
+        ready_all = ready_read + ready_write
+
+        if ready_all:
+            ready = ready_all[0]
+
+    elif timeout:
+        time.sleep(timeout)
+
+    __READY[0] = ready
+
+    return True
+
+
+def get_ready_fd() -> int:
+    return __READY[0]
+
+
+def connect(*, address: str) -> int:
+    host, _, port = address.rpartition(':')
+
+    if port.isdigit():
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        target = (host, int(port))
+
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        target = address
+
+    sock.setblocking(False)  # noqa: FBT003
+
+    if sock.connect_ex(target) not in {0, errno.EINPROGRESS, errno.EAGAIN}:
+        sock.close()
+        return -1
+
+    fd = sock.fileno()
+    __SOCKETS[fd] = sock
+
+    return fd
+
+
+def is_connected(*, fd: int) -> bool:
+    sock = __SOCKETS.get(fd)
+
+    if sock is None:
+        return False
+
+    try:
+        sock.getpeername()
+
+    except OSError:
+        return False
+
+    return not sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+
+
+def close(*, fd: int):
+    sock = __SOCKETS.pop(fd, None)
+    sock and sock.close()
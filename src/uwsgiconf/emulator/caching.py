@@ -7,8 +7,15 @@ def clear(*, cache: str):
     __CACHES[cache].clear()
 
 
-def set_value(*, key: str, value: bytes, expires: int | None = None, cache: str | None = None):
-    __CACHES[cache][key] = value
+def set_value(*, key: str, value: bytes, expires: int | None = None, cache: str | None = None, update: bool = True):
+    values = __CACHES[cache]
+
+    if not update and key in values:
+        # As uWSGI cache set does not overwrite existing keys.
+        return False
+
+    values[key] = value
+    return True
 
 
 def do_inc(*, key: str, value: int, expires: int | None = None, cache: str | None = None):
@@ -0,0 +1,26 @@
+__LORDSHIP: dict[str, bool] = {}
+__SCROLLS: dict[str, list[bytes]] = {}
+
+
+def set_state(*, legion: str, lord: bool = True, scrolls: list[bytes] | None = None):
+    """Sets emulated legion state: whether this node is the lord and legion scrolls
+    (the first one is considered the lord scroll).
+
+    """
+    __LORDSHIP[legion] = lord
+
+    if scrolls is not None:
+        __SCROLLS[legion] = scrolls
+
+
+def is_lord(*, legion: str) -> bool:
+    return __LORDSHIP.get(legion, False)
+
+
+def get_scrolls(*, legion: str) -> list[bytes]:
+    return __SCROLLS.get(legion, [])
+
+
+def cleanup():
+    __LORDSHIP.clear()
+    __SCROLLS.clear()
@@ -1,14 +1,41 @@
+import mmap
 
-__LOCKS: set[int] = set()
+LOCKS_COUNT = 65
+
+__STATE: list = []
+
+
+def __get_state() -> tuple:
+    if not __STATE:
+        from multiprocessing import Lock  # noqa: PLC0415
+
+        # As uWSGI locks these are shared with forked processes.
+        __STATE.extend([mmap.mmap(-1, LOCKS_COUNT), [Lock() for _ in range(LOCKS_COUNT)]])
+
+    return __STATE[0], __STATE[1]
+
+
+def __check_num(lock_num: int):
+    if not 0 <= lock_num < LOCKS_COUNT:
+        raise ValueError(f'Invalid lock number {lock_num}')
 
 
 def do_lock(lock_num: int):
-    __LOCKS.add(lock_num)
+    __check_num(lock_num)
+    flags, locks = __get_state()
+    locks[lock_num].acquire()
+    flags[lock_num] = 1
 
 
 def check_locked(lock_num: int) -> bool:
-    return lock_num in __LOCKS
+    __check_num(lock_num)
+    return bool(__get_state()[0][lock_num])
 
 
 def do_unlock(lock_num: int):
-    __LOCKS.discard(lock_num)
+    __check_num(lock_num)
+    flags, locks = __get_state()
+
+    if flags[lock_num]:
+        flags[lock_num] = 0
+        locks[lock_num].release()
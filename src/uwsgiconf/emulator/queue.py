@@ -0,0 +1,145 @@
+import mmap
+import struct
+import time
+
+SIZE = 100
+BLOCK_SIZE = 8192
+
+__HEADER = struct.Struct('QQ')  # LIFO position, FIFO position
+__ITEM = struct.Struct('QQ')  # size, timestamp
+__STATE: list = []
+
+
+def __get_state() -> tuple:
+    if not __STATE:
+        from multiprocessing import Lock  # noqa: PLC0415
+
+        # Anonymous mapping is shared with forked processes as uWSGI queue is.
+        __STATE.extend([mmap.mmap(-1, __HEADER.size + SIZE * BLOCK_SIZE), Lock()])
+
+    return __STATE[0], __STATE[1]
+
+
+def __get_offset(index: int) -> int:
+    return __HEADER.size + index * BLOCK_SIZE
+
+
+def __read(mem: mmap.mmap, index: int, *, remove: bool = False) -> bytes | None:
+    offset = __get_offset(index)
+    size, _ = __ITEM.unpack_from(mem, offset)
+
+    if not size:
+        return None
+
+    if remove:
+        __ITEM.pack_into(mem, offset, 0, 0)
+
+    offset += __ITEM.size
+    return mem[offset:offset + size]
+
+
+def __write(mem: mmap.mmap, index: int, value: bytes) -> bool:
+    if not value or len(value) > BLOCK_SIZE - __ITEM.size:
+        return False
+
+    offset = __get_offset(index)
+    __ITEM.pack_into(mem, offset, len(value), int(time.time()))
+    offset += __ITEM.size
+    mem[offset:offset + len(value)] = value
+
+    return True
+
+
+def get(*, index: int) -> bytes | None:
+    mem, lock = __get_state()
+
+    if not 0 <= index < SIZE:
+        return None
+
+    with lock:
+        return __read(mem, index)
+
+
+def set_value(*, index: int, value: bytes) -> bool:
+    mem, lock = __get_state()
+
+    if not 0 <= index < SIZE:
+        return False
+
+    with lock:
+        return __write(mem, index, value)
+
+
+def get_last(*, count: int) -> list[bytes]:
+    mem, lock = __get_state()
+    items = []
+
+    with lock:
+        pos, _ = __HEADER.unpack_from(mem, 0)
+
+        for _ in range(min(count, SIZE)):
+            pos = (pos or SIZE) - 1
+            value = __read(mem, pos)
+
+            if value is None:
+                break
+
+            items.append(value)
+
+    return items
+
+
+def push(*, value: bytes) -> bool:
+    mem, lock = __get_state()
+
+    with lock:
+        pos, pull_pos = __HEADER.unpack_from(mem, 0)
+
+        if not __write(mem, pos, value):
+            return False
+
+        __HEADER.pack_into(mem, 0, (pos + 1) % SIZE, pull_pos)
+
+    return True
+
+
+def pop() -> bytes | None:
+    mem, lock = __get_state()
+
+    with lock:
+        pos, pull_pos = __HEADER.unpack_from(mem, 0)
+        pos = (pos or SIZE) - 1
+        value = __read(mem, pos, remove=True)
+
+        if value is not None:
+            __HEADER.pack_into(mem, 0, pos, pull_pos)
+
+    return value
+
+
+def pull() -> bytes | None:
+    mem, lock = __get_state()
+
+    with lock:
+        pos, pull_pos = __HEADER.unpack_from(mem, 0)
+        value = __read(mem, pull_pos, remove=True)
+
+        if value is not None:
+            __HEADER.pack_into(mem, 0, pos, (pull_pos + 1) % SIZE)
+
+    return value
+
+
+def get_slot() -> int:
+    return __HEADER.unpack_from(__get_state()[0], 0)[0]
+
+
+def get_pull_slot() -> int:
+    return __HEADER.unpack_from(__get_state()[0], 0)[1]
+
+
+def cleanup():
+    mem, lock = __get_state()
+
+    with lock:
+        mem[:] = bytes(len(mem))
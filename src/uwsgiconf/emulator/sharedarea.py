@@ -0,0 +1,103 @@
+import atexit
+import os
+import struct
+
+SIZE = 65536
+"""Emulated area size (bytes)."""
+
+__AREAS: dict = {}
+# As in uWSGI integers are signed.
+__FORMATS = {8: 'b', 16: 'h', 32: 'i', 64: 'q'}
+
+
+def __get_area(area_id: int) -> tuple:
+    area = __AREAS.get(area_id)
+
+    if area is None:
+        from multiprocessing import Lock  # noqa: PLC0415
+        from multiprocessing.shared_memory import SharedMemory  # noqa: PLC0415
+
+        # Created by the first process accessing an area and shared with its forks.
+        memory = SharedMemory(create=True, size=SIZE)
+        area = __AREAS[area_id] = (memory, Lock())
+
+        pid = os.getpid()
+
+        def release():
+            if os.getpid() != pid:
+                return
+
+            try:
+                memory.close()
+
+            except BufferError:
+                # Memoryviews are still around.
+                pass
+
+            memory.unlink()
+
+        atexit.register(release)
+
+    return area
+
+
+def __check(memory, pos: int, length: int):
+    if pos < 0 or pos + length > memory.size:
+        raise ValueError(f'Invalid position {pos} for a sharedarea of {memory.size} bytes')
+
+
+def read(*, area_id: int, pos: int, length: int = 0) -> bytes:
+    memory, _ = __get_area(area_id)
+    length = length or memory.size - pos
+    __check(memory, pos, length)
+    return bytes(memory.buf[pos:pos + length])
+
+
+def write(*, area_id: int, pos: int, data: bytes) -> int:
+    memory, _ = __get_area(area_id)
+    __check(memory, pos, len(data))
+    memory.buf[pos:pos + len(data)] = data
+    return len(data)
+
+
+def read_int(*, area_id: int, pos: int, bits: int) -> int:
+    memory, _ = __get_area(area_id)
+    fmt = __FORMATS[bits]
+    __check(memory, pos, bits // 8)
+    return struct.unpack_from(fmt, memory.buf, pos)[0]
+
+
+def write_int(*, area_id: int, pos: int, value: int, bits: int) -> bool:
+    memory, _ = __get_area(area_id)
+    fmt = __FORMATS[bits]
+    __check(memory, pos, bits // 8)
+    half = 1 << (bits - 1)
+    # Wraps around on overflow as C integers do.
+    struct.pack_into(fmt, memory.buf, pos, (value + half) % (half << 1) - half)
+    return True
+
+
+def add_int(*, area_id: int, pos: int, value: int, bits: int) -> bool:
+    _, lock = __get_area(area_id)
+
+    with lock:
+        current = read_int(area_id=area_id, pos=pos, bits=bits)
+        return write_int(area_id=area_id, pos=pos, value=current + value, bits=bits)
+
+
+def lock(*, area_id: int):
+    # Readers are emulated exclusive as writers.
+    __get_area(area_id)[1].acquire()
+
+
+def unlock(*, area_id: int):
+    __get_area(area_id)[1].release()
+
+
+def get_memoryview(*, area_id: int) -> memoryview:
+    return __get_area(area_id)[0].buf
+
+
+def cleanup():
+    for memory, _ in __AREAS.values():
+        memory.buf[:] = bytes(memory.size)
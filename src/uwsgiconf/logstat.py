@@ -0,0 +1,470 @@
+"""Requests log analyzer.
+
+Parses uWSGI requests log (in uWSGI default, custom template or JSON format,
+see ``presets.nice.Section.configure_logging_json()``) and gathers
+per route and per status statistics with latency percentiles.
+
+.. code-block:: python
+
+    stat = LogStat(LogParser.from_section(section))
+    stat.feed_files(['/var/log/uwsgi/app.log', '/var/log/uwsgi/app.log.1.gz'])
+
+    for row in stat.get_rows(by='route'):
+        print(row)
+
+"""
+import json
+import math
+import mmap
+import re
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from .exceptions import ConfigurationError
+from .typehints import Strpath
+
+if TYPE_CHECKING:
+    from .config import Section
+
+
+FORMAT_DEFAULT = (
+    '[pid: %(pid)|app: %(app)|req: %(app_req)/%(worker_req)] %(addr) (%(user)) '
+    '{%(vars) vars in %(pktsize) bytes} [%(ctime)] %(method) %(uri) => '
+    'generated %(rsize) bytes in %(msecs) msecs%(via) (%(proto) %(status)) '
+    '%(headers) headers in %(hsize) bytes (%(switches) switches on core %(core))'
+)
+"""uWSGI default requests log format (used when no ``log-format`` is configured).
+Variables not available for custom templates (e.g. ``app``) are named here for parsing purposes.
+
+"""
+
+FORMAT_JSON_MSG = '%(method) %(uri) -> %(status) in %(msecs) msecs'
+"""Default message template for ``configure_logging_json()``."""
+
+VARS_NUMERIC = {
+    'status', 'msecs', 'micros', 'size', 'rsize', 'hsize', 'headers', 'cl', 'pid', 'wid', 'core',
+    'switches', 'vars', 'pktsize', 'time', 'tmsecs', 'tmicros', 'epoch', 'rerr', 'werr', 'ioerr',
+    'rss', 'vsz', 'rssM', 'vszM', 'modifier1', 'modifier2', 'app', 'app_req', 'worker_req',
+}
+"""Variables with numeric values (parsed faster)."""
+
+FIELDS_STAT = {'method', 'uri', 'status', 'msecs', 'micros'}
+"""Variables used for statistics."""
+
+FIELDS_DURATION = {'msecs', 'micros'}
+"""Variables with request duration. At least one is required for statistics."""
+
+RE_TEMPLATE_VAR = re.compile(r'%\(([^)]+)\)')
+RE_ROUTE_ID = re.compile(r'/(?:\d+|[0-9a-fA-F-]{16,})(?=/|$)')
+
+ROUTE_OTHER = '<other>'
+
+
+class LogParser:
+    """Parses request log lines.
+
+    A regular expression is generated (and compiled once) from a log format template,
+    so that only variables required for statistics are decoded.
+
+    """
+    def __init__(
+            self,
+            template: str = FORMAT_DEFAULT,
+            *,
+            json_src: str = '',
+            fields: Iterable[str] | None = FIELDS_STAT,
+    ):
+        """
+        :param template: Log format template (``log-format`` option value)
+            with variables (e.g. ``%(uri)``). See ``Logging.vars``.
+
+        :param fields: Variables to capture. Default: those used for statistics.
+            If ``None`` all are captured.
+
+        :param json_src: If set lines are considered JSON objects
+            (see ``configure_logging_json()``) and only those with ``src``
+            of the given value are parsed. ``template`` is applied to ``msg`` then.
+
+        """
+        self.template = template
+        self.json_src = json_src
+        self.regexp = self.compile(template, fields=fields)
+
+    @classmethod
+    def compile(cls, template: str, *, fields: Iterable[str] | None = None) -> re.Pattern:
+        """Compiles the given log format template into a regular expression for bytes.
+
+        :param template:
+
+        :param fields: Variables to capture. If not set all are captured.
+
+        """
+        fields = None if fields is None else set(fields)
+        chunks = []
+        seen = set()
+        pos = 0
+        matches = list(RE_TEMPLATE_VAR.finditer(template))
+
+        for idx, match in enumerate(matches):
+            chunks.append(re.escape(template[pos:match.start()]))
+            pos = match.end()
+
+            name = match.group(1)
+            group = re.sub(r'\W', '_', name)
+            is_last = idx == len(matches) - 1 and pos == len(template)
+
+            if name in VARS_NUMERIC:
+                pattern = r'-?[\d.]+|-'
+
+            else:
+                pattern = '.*' if is_last else '.*?'
+
+            if group in seen or (fields is not None and name not in fields):
+                chunks.append(f'(?:{pattern})')
+
+            else:
+                seen.add(group)
+                chunks.append(f'(?P<{group}>{pattern})')
+
+        chunks.append(re.escape(template[pos:]))
+
+        return re.compile(''.join(chunks).encode())
+
+    @classmethod
+    def from_section(cls, section: 'Section') -> 'LogParser':
+        """Makes a parser for log format configured for the given section.
+
+        :param section:
+
+        """
+        template = ''
+        json_src = ''
+
+        for key, value in section._get_options():
+            key = f'{key}'
+
+            if key == 'log-format':
+                template = f'{value}'
+
+            elif key == 'log-req-encoder' and f'{value}'.startswith('json '):
+                json_src = 'uwsgi.req'
+
+        return cls(template or (FORMAT_JSON_MSG if json_src else FORMAT_DEFAULT), json_src=json_src)
+
+    def parse(self, line: bytes) -> dict[str, bytes] | None:
+        """Parses a log line. Returns variables dict or None if the line is not a request log line.
+
+        :param line:
+
+        """
+        if self.json_src:
+            if not line.startswith(b'{'):
+                return None
+
+            try:
+                data = json.loads(line)
+
+            except ValueError:
+                return None
+
+            if data.get('src') != self.json_src:
+                return None
+
+            line = f"{data.get('msg', '')}".encode()
+
+        match = self.regexp.search(line)
+
+        if match is None:
+            return None
+
+        return match.groupdict()
+
+
+class Sketch:
+    """Bounded memory quantiles sketch with relative accuracy guarantee.
+
+    Values are counted in logarithmic buckets (as in DDSketch),
+    so the number of buckets depends only on values range, not on values count.
+
+    """
+    __slots__ = ['buckets', 'count', 'gamma_log', 'max', 'zeros']
+
+    def __init__(self, *, accuracy: float = 0.01):
+        """
+        :param accuracy: Relative accuracy of quantiles.
+
+        """
+        self.gamma_log = math.log((1 + accuracy) / (1 - accuracy))
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.zeros = 0
+        self.max = 0.0
+
+    def add(self, value: float, *, count: int = 1):
+        self.count += count
+
+        if value > self.max:
+            self.max = value
+
+        if value <= 0:
+            self.zeros += count
+            return
+
+        idx = math.ceil(math.log(value) / self.gamma_log)
+        buckets = self.buckets
+        buckets[idx] = buckets.get(idx, 0) + count
+
+    def quantile(self, q: float) -> float:
+        """Returns an approximate value for the given quantile.
+
+        :param q: Quantile, e.g. 0.99
+
+        """
+        if not self.count:
+            return 0.0
+
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = self.zeros
+
+        if seen > rank:
+            return 0.0
+
+        for idx in sorted(self.buckets):
+            seen += self.buckets[idx]
+
+            if seen > rank:
+                # Bucket middle value.
+                return min(2 * math.exp(idx * self.gamma_log) / (1 + math.exp(self.gamma_log)), self.max)
+
+        return self.max
+
+
+class StatRow(NamedTuple):
+
+    key: str
+    count: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class LogStat:
+    """Gathers streaming statistics from request log lines."""
+
+    def __init__(self, parser: LogParser | None = None, *, max_routes: int = 1000):
+        """
+        :param parser: Parser to use. Default: uWSGI default format parser.
+
+        :param max_routes: Maximum number of distinct routes to track (bounds memory).
+            Requests to other routes are accounted under ``<other>``.
+
+        :raises ConfigurationError: If parser template has no request duration variable.
+
+        """
+        parser = parser or LogParser()
+
+        if not FIELDS_DURATION.intersection(RE_TEMPLATE_VAR.findall(parser.template)):
+            raise ConfigurationError(
+                f"Log format '{parser.template}' has no request duration: "
+                f"{' or '.join(f'%({name})' for name in sorted(FIELDS_DURATION))} is required")
+
+        self.parser = parser
+        self.max_routes = max_routes
+        self.lines = 0
+        self.requests = 0
+        self.stats: dict[str, dict[str, Sketch]] = {'route': {}, 'status': {}}
+
+    @classmethod
+    def get_route(cls, method: str, uri: str) -> str:
+        """Returns route for request: method and path with IDs replaced.
+
+        :param method:
+        :param uri:
+
+        """
+        path = uri.partition('?')[0]
+        return f"{method} {RE_ROUTE_ID.sub('/<id>', path)}"
+
+    def add(self, *, route: str, status: str, duration: float, count: int = 1):
+        """Accounts a request.
+
+        :param route:
+        :param status:
+        :param duration: Milliseconds.
+        :param count: Number of such requests.
+
+        """
+        self.requests += count
+
+        routes = self.stats['route']
+
+        if route not in routes and len(routes) >= self.max_routes:
+            route = ROUTE_OTHER
+
+        for key, stats in ((route, routes), (status, self.stats['status'])):
+            sketch = stats.get(key)
+
+            if sketch is None:
+                sketch = stats[key] = Sketch()
+
+            sketch.add(duration, count=count)
+
+    def _add_pending(self, pending: dict[tuple, int]):
+        get_route = self.get_route
+
+        for (method, path, status, msecs, micros), count in pending.items():
+
+            if msecs and msecs != b'-':
+                duration = float(msecs)
+
+            elif micros and micros != b'-':
+                duration = float(micros) / 1000
+
+            else:
+                duration = 0.0
+
+            self.add(
+                route=get_route(method.decode(errors='replace'), path.decode(errors='replace')),
+                status=(status or b'-').decode(),
+                duration=duration,
+                count=count,
+            )
+
+        pending.clear()
+
+    def feed(self, lines: Iterable[bytes]) -> int:
+        """Accounts requests from the given log lines. Returns the number of requests found.
+
+        :param lines:
+
+        """
+        parser = self.parser
+        parse = parser.parse
+        search = None if parser.json_src else parser.regexp.search
+        requests_before = self.requests
+
+        # Identical requests (by route, status and duration) are accounted in bulk.
+        pending: dict[tuple, int] = {}
+        lines_count = 0
+
+        for line in lines:
+            lines_count += 1
+
+            if search is None:
+                parsed = parse(line.rstrip(b'\r\n'))
+
+            else:
+                match = search(line)
+                parsed = None if match is None else match.groupdict()
+
+            if parsed is None:
+                continue
+
+            key = (
+                parsed.get('method') or b'',
+                (parsed.get('uri') or b'').partition(b'?')[0],
+                parsed.get('status'),
+                parsed.get('msecs'),
+                parsed.get('micros'),
+            )
+            pending[key] = pending.get(key, 0) + 1
+
+            if len(pending) > 50000:
+                self._add_pending(pending)
+
+        self._add_pending(pending)
+        self.lines += lines_count
+
+        return self.requests - requests_before
+
+    def feed_files(self, fpaths: Iterable[Strpath]) -> int:
+        """Accounts requests from the given log files. Returns the number of requests found.
+
+        :param fpaths: Log files paths. ``-`` stands for stdin.
+            Files with ``.gz`` extension are decompressed on the fly.
+
+        """
+        requests = 0
+
+        for fpath in fpaths:
+            requests += self.feed(read_lines(fpath))
+
+        return requests
+
+    def get_rows(self, *, by: str = 'route', limit: int | None = None) -> list[StatRow]:
+        """Returns statistics rows sorted by requests count.
+
+        :param by: ``route`` or ``status``.
+
+        :param limit: Maximum number of rows.
+
+        """
+        rows = [
+            StatRow(
+                key=key,
+                count=sketch.count,
+                p50=sketch.quantile(0.5),
+                p90=sketch.quantile(0.9),
+                p99=sketch.quantile(0.99),
+                max=sketch.max,
+            )
+            for key, sketch in self.stats[by].items()
+        ]
+        rows.sort(key=lambda row: row.count, reverse=True)
+        return rows[:limit]
+
+    def format_report(self, *, by: str = 'route', limit: int | None = 20) -> str:
+        """Returns a human-readable report.
+
+        :param by: ``route`` or ``status``.
+
+        :param limit: Maximum number of rows.
+
+        """
+        lines = [
+            f'Lines: {self.lines}. Requests: {self.requests}',
+            f"{'Count':>10} {'p50, ms':>10} {'p90, ms':>10} {'p99, ms':>10} {'max, ms':>10}  {by.capitalize()}",
+        ]
+
+        lines.extend(
+            f'{row.count:>10} {row.p50:>10.1f} {row.p90:>10.1f} {row.p99:>10.1f} {row.max:>10.1f}  {row.key}'
+            for row in self.get_rows(by=by, limit=limit)
+        )
+
+        return '\n'.join(lines)
+
+
+def read_lines(fpath: Strpath) -> Iterator[bytes]:
+    """Yields lines from the given file.
+
+    Regular files are memory-mapped, gzipped ones are decompressed on the fly.
+
+    :param fpath: File path. ``-`` stands for stdin.
+
+    """
+    if f'{fpath}' == '-':
+        yield from sys.stdin.buffer
+        return
+
+    fpath = Path(fpath)
+
+    if fpath.suffix == '.gz':
+        import gzip  # noqa: PLC0415
+
+        with gzip.open(fpath, 'rb') as f:
+            yield from f
+
+        return
+
+    with fpath.open('rb') as f:
+        if not fpath.stat().st_size:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from iter(mapped.readline, b'')
@@ -1,20 +1,25 @@
-from .alarms import Alarms
-from .applications import Applications
-from .caching import Caching
-from .empire import Empire
-from .locks import Locks
-from .logging import Logging
-from .main_process import MainProcess
-from .master_process import MasterProcess
-from .monitoring import Monitoring
-from .networking import Networking
-from .python import Python
-from .queue import Queue
-from .routing import Routing
-from .spooler import Spooler
-from .statics import Statics
-from .subscriptions import Subscriptions
-from .workers import Cheapening, Workers
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .alarms import Alarms
+    from .applications import Applications
+    from .caching import Caching
+    from .empire import Empire
+    from .locks import Locks
+    from .logging import Logging
+    from .main_process import MainProcess
+    from .master_process import MasterProcess
+    from .monitoring import Monitoring
+    from .networking import Networking
+    from .python import Python
+    from .queue import Queue
+    from .routing import Routing
+    from .sharedarea import SharedArea
+    from .spooler import Spooler
+    from .statics import Statics
+    from .subscriptions import Subscriptions
+    from .workers import Cheapening, Workers
 
 __all__ = [
     'Alarms',
@@ -31,8 +36,41 @@ __all__ = [
     'Python',
     'Queue',
     'Routing',
+    'SharedArea',
     'Spooler',
     'Statics',
     'Subscriptions',
     'Workers',
 ]
+
+GROUPS_MODULES = {
+    'Alarms': 'alarms',
+    'Applications': 'applications',
+    'Caching': 'caching',
+    'Cheapening': 'workers',
+    'Empire': 'empire',
+    'Locks': 'locks',
+    'Logging': 'logging',
+    'MainProcess': 'main_process',
+    'MasterProcess': 'master_process',
+    'Monitoring': 'monitoring',
+    'Networking': 'networking',
+    'Python': 'python',
+    'Queue': 'queue',
+    'Routing': 'routing',
+    'SharedArea': 'sharedarea',
+    'Spooler': 'spooler',
+    'Statics': 'statics',
+    'Subscriptions': 'subscriptions',
+    'Workers': 'workers',
+}
+"""Options groups mapped to their modules. Modules are imported on first access."""
+
+
+def __getattr__(name: str):
+    module_name = GROUPS_MODULES.get(name)
+
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    return getattr(import_module(f'.{module_name}', __name__), name)
@@ -1,6 +1,11 @@
+import json
+import re
+from math import ceil
+from pathlib import Path
+
 from ..base import OptionsGroup
 from ..typehints import Strlist, Strpath
-from ..utils import KeyValue
+from ..utils import KeyValue, write_if_changed
 
 
 class Caching(OptionsGroup):
@@ -217,3 +222,118 @@ class Caching(OptionsGroup):
         self._set('cache2', value, multi=True)
 
         return self._section
+
+    def preload_directory(
+            self,
+            path: Strpath,
+            pattern: str = '*',
+            *,
+            cache_name: str = 'statics',
+            gzip: bool = False,
+            mountpoint: str | None = None,
+            max_file_size: int = 256 * 1024,
+            block_size: int = 4096,
+            paths_cache_timeout: int | None = 60,
+            manifest: Strpath | None = None,
+    ):
+        """Creates a cache sized for files from the given directory
+        and loads the files into it on startup.
+
+        Files are stored with their absolute paths as keys.
+        If ``mountpoint`` is set, requests to it are served right from the cache,
+        that is without disk I/O. Missing files fall through (e.g. to static maps).
+
+        .. code-block:: python
+
+            section.caching.preload_directory('/var/www/static', '*.css', mountpoint='/static/')
+
+        :param path: Directory to scan.
+
+        :param pattern: Glob pattern to filter files with, e.g. ``*.css``.
+            Subdirectories are scanned too.
+
+        :param cache_name: Name for the cache to create.
+
+        :param gzip: Store files gzipped. Such files are served
+            only to clients accepting gzip encoding.
+
+        :param mountpoint: URL prefix (e.g. ``/static/``) to serve files from the cache for.
+
+        :param max_file_size: Files larger (bytes) than this are not loaded.
+
+        :param block_size: Cache block size (bytes). Cache is created in bitmap mode,
+            so that files of different sizes take the required number of blocks.
+
+        :param paths_cache_timeout: Seconds to cache URI to filesystem paths mappings
+            in the same cache for statics served from disk. See ``Statics.set_paths_caching_params()``.
+            Set to ``None`` to not use paths caching.
+
+        :param manifest: Filepath to write a manifest of loaded files (sizes and modification times) into.
+            The file is written only if the files changed since the previous run,
+            and uWSGI is set to reload on manifest changes to reload the cache.
+
+        """
+        path = Path(path).absolute()
+        files = {}
+
+        for fpath in sorted(path.rglob(pattern)):
+            if not fpath.is_file():
+                continue
+
+            stat = fpath.stat()
+
+            if stat.st_size <= max_file_size:
+                files[fpath] = stat
+
+        items = len(files)
+        # Allow a gzipped file to be a bit larger than the original for incompressible data.
+        block_count = sum(ceil((stat.st_size + 64) / block_size) for stat in files.values())
+
+        if paths_cache_timeout is not None:
+            # Paths mappings are small and take a block each.
+            items *= 2
+            block_count += len(files)
+
+        self.add_cache(
+            cache_name,
+            # The first item is internally used as NULL.
+            max_items=items + 1,
+            block_size=block_size,
+            block_count=block_count + 1,
+            mode_bitmap=True,
+        )
+
+        for fpath in files:
+            self.add_file(fpath, gzip=gzip, cache_name=cache_name)
+
+        section = self._section
+
+        if paths_cache_timeout is not None:
+            section.statics.set_paths_caching_params(timeout=paths_cache_timeout, cache_name=cache_name)
+
+        if mountpoint:
+            rule = section.routing.route_rule
+            mountpoint = re.escape(mountpoint.rstrip('/'))
+            subject = f'^{mountpoint}/(.*)'
+
+            if gzip:
+                # Also check that client accepts gzip (both are in one subject to capture file path).
+                var = rule.vars.request
+                subject = rule.subjects.custom(f"{var('HTTP_ACCEPT_ENCODING')}|{var('PATH_INFO')}").matches(
+                    f'^[^|]*gzip[^|]*\\|{mountpoint}/(.*)')
+
+            section.routing.register_route(rule(
+                rule.actions.cache(
+                    f'{path}/$1', cache_name=cache_name, mime=True, content_encoding='gzip' if gzip else None),
+                subject,
+            ))
+
+        if manifest:
+            data = {
+                fpath.relative_to(path).as_posix(): [stat.st_size, stat.st_mtime_ns]
+                for fpath, stat in files.items()
+            }
+            write_if_changed(manifest, json.dumps(data, separators=(',', ':')))
+            section.main_process.set_basic_params(touch_reload=manifest)
+
+        return section
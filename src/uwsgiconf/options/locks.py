@@ -1,5 +1,7 @@
 from ..base import OptionsGroup
+from ..settings import LOCK_METRIC, LOCK_METRIC_KINDS
 from ..typehints import Strpath
+from ..utils import listify
 
 
 class Locks(OptionsGroup):
@@ -36,6 +38,26 @@ class Locks(OptionsGroup):
 
         return self._section
 
+    def register_metrics(self, nums: int | list[int] = 0):
+        """Registers metrics for ``.runtime.locking.Lock(metrics=True)``
+        to record locks contention into:
+
+            * ``lock.<num>.acquired`` - number of acquisitions;
+            * ``lock.<num>.wait`` - time spent waiting for the lock (microseconds);
+            * ``lock.<num>.hold`` - time the lock was held (microseconds).
+
+        :param nums: Lock numbers.
+
+        """
+        monitoring = self._section.monitoring
+        monitoring.set_metrics_params(enable=True)
+
+        for num in listify(nums):
+            for kind in LOCK_METRIC_KINDS:
+                monitoring.register_metric(monitoring.metric_types.counter(LOCK_METRIC.format(num=num, kind=kind)))
+
+        return self._section
+
     def set_ipcsem_params(self, *, ftok: str | None = None, persistent: bool | None = None):
         """Sets ipcsem lock engine params.
 
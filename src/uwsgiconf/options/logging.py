@@ -1,4 +1,5 @@
 from ..base import OptionsGroup
+from ..settings import LOG_SAMPLE_METRIC, LOG_SAMPLE_VAR
 from ..typehints import Strbool, Strlist
 from ..utils import listify
 from .logging_encoders import *
@@ -279,6 +280,45 @@ class Logging(OptionsGroup):
 
         return self._section
 
+    def set_requests_sampling(
+            self,
+            rate: int = 10,
+            *,
+            slower: int | None = 1000,
+            errors: bool = True,
+    ):
+        """Logs only a sample of fast successful requests, but all slow and failed ones.
+
+        Requests logging is disabled and only enabled back for slow and failed requests.
+        Sampling of others is done by ``runtime.logging.RequestLogSampler`` WSGI middleware,
+        which needs to wrap your application.
+
+        Sample rate could be changed at runtime for all workers
+        with ``RequestLogSampler.set_rate()``. It is stored in a metric,
+        so that metrics subsystem is enabled.
+
+        Use ``Logging.vars.SAMPLE_RATE`` in log template (see ``.set_basic_params()``)
+        to put the rate a request was logged with into the log line, so that one can
+        re-weight aggregates (a request logged with rate 10 represents 10 requests).
+
+        :param rate: Log one of every N fast successful requests.
+
+        :param slower: Log all requests slower than the specified number of milliseconds.
+
+        :param errors: Log all requests with 4xx and 5xx responses.
+
+        """
+        section = self._section
+        monitoring = section.monitoring
+
+        self.set_basic_params(no_requests=True)
+        self.set_requests_filters(slower=slower, status_4xx=errors or None, status_5xx=errors or None)
+
+        monitoring.set_metrics_params(enable=True)
+        monitoring.register_metric(monitoring.metric_types.absolute(LOG_SAMPLE_METRIC, initial_value=rate))
+
+        return section
+
     def set_master_logging_params(
             self,
             *,
@@ -558,3 +598,6 @@ class Logging(OptionsGroup):
 
         request_var = VarRequestVar
         """Request variable value."""
+
+        SAMPLE_RATE = f'%(var.{LOG_SAMPLE_VAR})'
+        """Sample rate a request was logged with. See ``.set_requests_sampling()``."""
@@ -1,7 +1,8 @@
 from pathlib import Path
 
-from ..base import OptionsGroup
+from ..base import OptionKeyOrdered, OptionsGroup
 from ..exceptions import ConfigurationError
+from ..typehints import Strlist
 from ..utils import listify
 from .routing_actions import *
 from .routing_modifiers import *
@@ -93,7 +94,7 @@ class RouteRule:
         upper = ActionUpper
 
         # todo Consider adding the following and some others from sources (incl. plugins):
-        # xslt, cachestore, memcachedstore, redisstore, rpc, lua
+        # xslt, memcachedstore, redisstore, rpc, lua
 
     class actions:
         """Actions available for routing rules.
@@ -111,6 +112,10 @@ class RouteRule:
         alarm = ActionAlarm
         auth_basic = ActionAuthBasic
         auth_ldap = AuthLdap
+        cache = ActionCache
+        cache_increment = ActionCacheIncrement
+        cache_set = ActionCacheSet
+        cache_store = ActionCacheStore
         dir_change = ActionDirChange
         do_break = ActionDoBreak
         do_continue = ActionDoContinue
@@ -144,8 +149,8 @@ class RouteRule:
         signal = ActionSignal
 
         # todo Consider adding the following and some others from sources (incl. plugins):
-        # cachestore, cacheset, memcached,
-        # router_cache: cache, cache-continue, cachevar, cacheinc, cachedec, cachemul, cachediv
+        # memcached,
+        # router_cache: cachevar, cachedec, cachemul, cachediv
         # rpc,
         # rpc: call, rpcret, rpcnext, rpcraw, rpcvar,
         # access, spnego, radius
@@ -299,11 +304,146 @@ class Routing(OptionsGroup):
         """
         route_rules = listify(route_rules)
 
+        # Rules order matters, so they are not merged under the same option names.
         if route_rules and label:
-            self._set(route_rules[0].command_label, label, multi=True)
+            self._set(OptionKeyOrdered(route_rules[0].command_label), label, multi=True)
 
         for route_rule in route_rules:
-            self._set(route_rule.command, route_rule.value, multi=True)
+            self._set(OptionKeyOrdered(route_rule.command), route_rule.value, multi=True)
+
+        return self._section
+
+    def optimize_rules(
+            self,
+            *,
+            dedupe: bool = True,
+            hoist: bool = True,
+            jumps: bool = True,
+            merge: bool = True,
+            jumps_min_rules: int = 3,
+            samples: list[dict] | None = None,
+    ):
+        """Optimizes routing rules registered so far to make uWSGI evaluate them faster.
+
+        Should be called after all rules are registered.
+
+        .. code-block:: python
+
+            section.routing.optimize_rules(samples=[{'PATH_INFO': '/api/users/', 'REQUEST_METHOD': 'GET'}])
+
+        :param dedupe: Drop repeated rules which can't match if their first occurrence didn't.
+
+        :param hoist: Move rules with exact match regexps (e.g. ``^/about/$``) and terminal actions
+            (e.g. ``redirect``, ``break``) up past rules which can't match the same requests.
+
+        :param jumps: Jump (with ``goto``) over runs of rules with path regexps
+            sharing the same literal prefix (e.g. ``^/api/``) if request path doesn't start with it.
+
+        :param merge: Merge adjacent regexp rules with the same terminal action into one
+            rule with an alternation regexp (e.g. ``^/a|^/b``).
+
+        :param jumps_min_rules: Minimum number of rules with the same prefix to jump over.
+
+        :param samples: Sample requests (env dicts with ``PATH_INFO``, ``REQUEST_METHOD``, etc.)
+            to verify that optimized rules behave the same. See ``routing_evaluator.RoutingEvaluator``.
+
+        :raises ConfigurationError: If optimized rules behave differently for samples.
+
+        """
+        from .routing_evaluator import get_rules, set_rules  # noqa: PLC0415
+        from .routing_optimizer import optimize  # noqa: PLC0415
+
+        section = self._section
+
+        set_rules(section, optimize(
+            get_rules(section),
+            do_dedupe=dedupe,
+            do_hoist=hoist,
+            do_jumps=jumps,
+            do_merge=merge,
+            jumps_min_rules=jumps_min_rules,
+            samples=samples,
+        ))
+
+        return section
+
+    def configure_response_cache(
+            self,
+            *,
+            name: str = 'responses',
+            max_items: int = 1000,
+            item_size: int | None = None,
+            expires: int = 10,
+            key_vars: list[str | Var] | None = None,
+            methods: Strlist = ('GET', 'HEAD'),
+            bypass_cookies: Strlist = None,
+            subject: SubjectBuiltin | str | None = None,
+    ):
+        """Configures caching of full responses (aka microcaching) in front of the application.
+
+        Cached responses are served by uWSGI itself without passing requests to the application.
+
+        .. code-block:: python
+
+            section.routing.configure_response_cache(expires=5, bypass_cookies=['sessionid'])
+
+        * http://uwsgi.readthedocs.io/en/latest/tutorials/CachingCookbook.html
+
+        :param name: Name for a dedicated cache to create.
+            Also used to make a label (``<name>-bypass``) to jump to if caching is bypassed.
+
+        :param max_items: Maximum number of responses to cache.
+
+        :param item_size: Maximum size of a response to cache (in bytes). Default: 64k.
+
+        :param expires: Time in seconds to store a response for.
+
+        :param key_vars: Request variables to build cache key from.
+            Strings are considered request variable names. Default: REQUEST_METHOD, HTTP_HOST, REQUEST_URI.
+
+            .. note:: Router cache doesn't distinguish request methods by itself,
+                so unless REQUEST_METHOD is a part of the key, a response to HEAD
+                (with an empty body) could be served for GET and vice versa.
+
+        :param methods: Request methods allowing caching.
+            Requests with other methods bypass caching.
+
+        :param bypass_cookies: Cookie names (e.g. session cookie) which presence
+            in a request makes it bypass caching.
+
+        :param subject: Subject to limit caching to, e.g. ``'^/blog/'`` path regexp.
+            See ``RouteRule.subjects``.
+
+        """
+        rule = self.route_rule
+        label = f'{name}-bypass'
+
+        self._section.caching.add_cache(name, max_items=max_items, block_size=item_size)
+
+        key = '|'.join(
+            f'{rule.vars.request(var) if isinstance(var, str) else var}'
+            for var in key_vars or ['REQUEST_METHOD', 'HTTP_HOST', 'REQUEST_URI'])
+
+        rules = []
+
+        if methods:
+            rules.append(rule(
+                rule.actions.do_goto(label),
+                ~rule.subjects.custom(rule.vars.request('REQUEST_METHOD')).matches(f"^({'|'.join(methods)})$")
+            ))
+
+        rules.extend(
+            rule(rule.actions.do_goto(label), ~rule.subjects.custom(rule.vars.cookie(cookie)).isempty())
+            for cookie in listify(bypass_cookies or [])
+        )
+
+        rules.extend([
+            rule(rule.actions.cache(key, cache_name=name), subject),
+            rule(rule.actions.cache_store(key, cache_name=name, expires=expires), subject),
+        ])
+
+        self.register_route(rules)
+        self._set(OptionKeyOrdered(rules[0].command_label), label, multi=True)
 
         return self._section
 
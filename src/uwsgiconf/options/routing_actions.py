@@ -667,3 +667,123 @@ class ActionSetScriptFile(RouteAction):
 
         """
         super().__init__(f'{fpath}')
+
+
+class ActionCache(RouteAction):
+    """Serves a response from the cache if the given key is found there.
+
+    Stops scanning the internal routing table on hit.
+
+    * http://uwsgi.readthedocs.io/en/latest/Caching.html#caching-in-the-routing-subsystem
+
+    """
+    name = 'cache'
+    plugin = 'router_cache'
+    args_joiner = ','
+
+    def __init__(
+            self, key, *, cache_name=None, mime=None, content_type=None, content_encoding=None,
+            no_offload=None, as_num=None, do_continue=False):
+        """
+        :param str key: Cache key. Usually built from request variables,
+            e.g. ``${REQUEST_URI}``.
+
+        :param str cache_name: Cache name (see ``caching.add_cache()``).
+            If not set default cache is used.
+
+        :param bool mime: Set Content-Type header guessing it from the key (file extension).
+
+        :param str content_type: Content-Type header value.
+
+        :param str content_encoding: Content-Encoding header value.
+
+        :param bool no_offload: Do not offload serving of the response.
+
+        :param bool as_num: Serve cached value as a 64-bit number.
+
+        :param bool do_continue: Do not stop scanning the internal routing table on hit,
+            e.g. to allow transformations.
+
+        """
+        if do_continue:
+            self.name = 'cache-continue'
+
+        arg = KeyValue(
+            locals(),
+            keys=['key', 'cache_name', 'mime', 'content_type', 'content_encoding', 'no_offload', 'as_num'],
+            aliases={'cache_name': 'name'},
+            bool_keys=['mime', 'no_offload', 'as_num'],
+        )
+
+        super().__init__(arg)
+
+
+class ActionCacheStore(RouteAction):
+    """Stores the response generated by the application into the cache."""
+
+    name = 'cachestore'
+    plugin = 'router_cache'
+    args_joiner = ','
+
+    def __init__(self, key, *, cache_name=None, expires=None):
+        """
+        :param str key: Cache key. Usually built from request variables,
+            e.g. ``${REQUEST_URI}``.
+
+        :param str cache_name: Cache name (see ``caching.add_cache()``).
+            If not set default cache is used.
+
+        :param int expires: Expiration time in seconds.
+
+        """
+        arg = KeyValue(locals(), keys=['key', 'cache_name', 'expires'], aliases={'cache_name': 'name'})
+        super().__init__(arg)
+
+
+class ActionCacheSet(RouteAction):
+    """Stores the given value into the cache."""
+
+    name = 'cacheset'
+    plugin = 'router_cache'
+    args_joiner = ','
+
+    def __init__(self, key, value, *, cache_name=None, expires=None):
+        """
+        :param str key: Cache key.
+
+        :param str value: Value to store.
+
+        :param str cache_name: Cache name (see ``caching.add_cache()``).
+            If not set default cache is used.
+
+        :param int expires: Expiration time in seconds.
+
+        """
+        arg = KeyValue(locals(), keys=['key', 'value', 'cache_name', 'expires'], aliases={'cache_name': 'name'})
+        super().__init__(arg)
+
+
+class ActionCacheIncrement(RouteAction):
+    """Increments a 64-bit number stored in the cache.
+
+    Can be used e.g. for requests counting.
+
+    """
+    name = 'cacheinc'
+    plugin = 'router_cache'
+    args_joiner = ','
+
+    def __init__(self, key, *, value=None, cache_name=None, expires=None):
+        """
+        :param str key: Cache key.
+
+        :param int value: Value to increment by. Default: 1.
+
+        :param str cache_name: Cache name (see ``caching.add_cache()``).
+            If not set default cache is used.
+
+        :param int expires: Expiration time in seconds.
+
+        """
+        arg = KeyValue(locals(), keys=['key', 'value', 'cache_name', 'expires'], aliases={'cache_name': 'name'})
+        super().__init__(arg)
@@ -0,0 +1,670 @@
+"""Offline (pure Python) evaluation of internal routing rules.
+
+Allows checking what routing rules of a section will do for a given
+request without starting uWSGI.
+
+.. note:: This is an approximation of uWSGI behaviour: regular expressions
+    are handled by Python ``re`` instead of PCRE, actions are not really
+    performed but recorded (some of them also alter request variables).
+
+"""
+import re
+from base64 import b64encode
+from collections.abc import Iterable
+from dataclasses import dataclass
+from http.cookies import SimpleCookie
+from ipaddress import ip_address, ip_network
+from pathlib import Path
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, NamedTuple
+from urllib.parse import parse_qs
+
+from ..base import OptionKeyOrdered
+
+if TYPE_CHECKING:
+    from ..config import Section
+
+RESULT_NEXT = 'next'
+RESULT_CONTINUE = 'continue'
+RESULT_BREAK = 'break'
+RESULT_GOTO = 'goto'
+
+SUBJECTS_BUILTIN = {
+    '': 'PATH_INFO',
+    'uri': 'REQUEST_URI',
+    'qs': 'QUERY_STRING',
+    'remote-addr': 'REMOTE_ADDR',
+    'remote-user': 'REMOTE_USER',
+    'host': 'HTTP_HOST',
+    'referer': 'HTTP_REFERER',
+    'user-agent': 'HTTP_USER_AGENT',
+    'status': 'uwsgi[status]',
+}
+"""Builtin routing subjects mapped to request variables they check."""
+
+ACTIONS_RESULTS = {
+    'break': RESULT_BREAK,
+    'return': RESULT_BREAK,
+    'redirect': RESULT_BREAK,
+    'redirect-301': RESULT_BREAK,
+    'redirect-302': RESULT_BREAK,
+    'static': RESULT_BREAK,
+    'http': RESULT_BREAK,
+    'continue': RESULT_CONTINUE,
+    'last': RESULT_CONTINUE,
+    'rewrite-last': RESULT_CONTINUE,
+    'goto': RESULT_GOTO,
+}
+"""Actions with known results which stop (or alter) rules scanning.
+Actions not listed here are considered to go to the next rule.
+
+"""
+
+ACTIONS_VARS = {
+    'setapp': 'UWSGI_APPID',
+    'setdocroot': 'DOCUMENT_ROOT',
+    'sethome': 'UWSGI_HOME',
+    'setmethod': 'REQUEST_METHOD',
+    'setpathinfo': 'PATH_INFO',
+    'setremoteaddr': 'REMOTE_ADDR',
+    'setscheme': 'UWSGI_SCHEME',
+    'setscriptname': 'SCRIPT_NAME',
+    'seturi': 'REQUEST_URI',
+    'setuser': 'REMOTE_USER',
+}
+"""Actions setting request variables mapped to those variables."""
+
+ACTIONS_ALTERING = {*ACTIONS_VARS, 'addvar', 'rewrite', 'rewrite-last', 'fixpathinfo'}
+"""Actions altering request variables."""
+
+RE_VAR = re.compile(r'\$\{([^}\[]+)(?:\[([^}\]]*)\])?}')
+RE_BACKREF = re.compile(r'\$(\d)')
+RE_LOG_REQUEST = re.compile(r'\b([A-Z]{3,10}) (/\S*)')
+
+
+class Rule(NamedTuple):
+    """Represents a routing rule (or a label) as it is configured for uWSGI."""
+
+    stage: str
+    """Stage (chain) name. See ``RouteRule.stages``."""
+
+    kind: str
+    """Builtin subject name (see ``SUBJECTS_BUILTIN``), ``if``, ``if-not``, ``run`` or ``label``."""
+
+    subject: str
+    """Regular expression for builtin subjects, condition for ``if`` and ``if-not``,
+    label name for ``label``."""
+
+    action: str
+    """Action with arguments, e.g. ``log:message``."""
+
+    @classmethod
+    def from_option(cls, key: str, value: str) -> 'Rule | None':
+        """Makes a rule from option key and value.
+        Returns ``None`` if option is not a routing rule.
+
+        :param key: E.g. ``route-if``, ``response-route-uri``
+        :param value: E.g. ``equal:${PATH_INFO};/ log:root``
+
+        """
+        stage, _, rest = key.rpartition('route')
+
+        if not _ or (rest and not rest.startswith('-')) or stage not in {'', 'error-', 'response-', 'final-'}:
+            return None
+
+        stage = stage.rstrip('-')
+        kind = rest.lstrip('-')
+
+        if kind not in SUBJECTS_BUILTIN and kind not in {'if', 'if-not', 'run', 'label'}:
+            return None
+
+        value = f'{value}'.strip()
+
+        if kind == 'label':
+            return cls(stage=stage, kind=kind, subject=value, action='')
+
+        if kind == 'run':
+            return cls(stage=stage, kind=kind, subject='', action=value)
+
+        subject, _, action = value.partition(' ')
+
+        return cls(stage=stage, kind=kind, subject=subject, action=action.strip())
+
+    @property
+    def key(self) -> str:
+        """Option key for this rule."""
+        return f'{self.stage}-route-{self.kind}'.strip('-')
+
+    @property
+    def value(self) -> str:
+        """Option value for this rule."""
+        if self.kind == 'label':
+            return self.subject
+
+        if self.kind == 'run':
+            return self.action
+
+        return f'{self.subject} {self.action}'
+
+    @property
+    def action_name(self) -> str:
+        return self.action.partition(':')[0]
+
+    @property
+    def action_args(self) -> str:
+        return self.action.partition(':')[2]
+
+    @property
+    def action_result(self) -> str:
+        """Known result of this rule action. See ``ACTIONS_RESULTS``."""
+        return ACTIONS_RESULTS.get(self.action_name, RESULT_NEXT)
+
+    @property
+    def is_regexp(self) -> bool:
+        """Whether rule checks a builtin subject with a regular expression."""
+        return self.kind in SUBJECTS_BUILTIN
+
+    def __str__(self):
+        return f'{self.key} = {self.value}'
+
+
+def get_rules(section: 'Section') -> list[Rule]:
+    """Returns routing rules (in order) from the given section.
+
+    :param section:
+
+    """
+    rules = []
+
+    for key, value in section._get_options():
+        rule = Rule.from_option(f'{key}', value)
+
+        if rule is not None:
+            rules.append(rule)
+
+    return rules
+
+
+def set_rules(section: 'Section', rules: list[Rule]):
+    """Replaces routing rules of the given section with the given ones.
+
+    :param section:
+    :param rules:
+
+    """
+    opts = section._opts
+    opts_new = {}
+    placed = False
+
+    for key, value in opts.items():
+
+        if Rule.from_option(f'{key}', '') is None:
+            opts_new[key] = value
+            continue
+
+        if not placed:
+            placed = True
+
+            for rule in rules:
+                opts_new[OptionKeyOrdered(rule.key)] = [rule.value]
+
+    if not placed:
+        for rule in rules:
+            opts_new[OptionKeyOrdered(rule.key)] = [rule.value]
+
+    opts.clear()
+    opts.update(opts_new)
+
+
+class Evaluation(NamedTuple):
+    """Routing rules evaluation result."""
+
+    actions: list[str]
+    """Actions performed (with arguments resolved)."""
+
+    result: str
+    """Rules scanning result: next (all rules scanned), continue or break."""
+
+    env: dict
+    """Request variables after evaluation."""
+
+
+class RoutingEvaluator:
+    """Evaluates routing rules for the given requests.
+
+    .. code-block:: python
+
+        evaluator = RoutingEvaluator(section)
+        evaluation = evaluator.evaluate({'PATH_INFO': '/', 'REQUEST_METHOD': 'GET'})
+
+    """
+    def __init__(self, rules: 'Section | Iterable[Rule]', *, cache: dict | None = None):
+        """
+        :param rules: Section to evaluate routing rules from or rules themselves.
+
+        :param cache: Cache contents (keys mapped to values) to be used
+            for ``cache`` routing actions. Missing keys are considered cache misses.
+
+        """
+        if not isinstance(rules, Iterable):
+            rules = get_rules(rules)
+
+        self.rules: list[Rule] = list(rules)
+        self.cache = cache or {}
+        self._regexps: dict[str, re.Pattern] = {}
+
+    def get_regexp(self, regexp: str) -> re.Pattern:
+        compiled = self._regexps.get(regexp)
+
+        if compiled is None:
+            compiled = self._regexps[regexp] = re.compile(regexp)
+
+        return compiled
+
+    def resolve(self, value: str, env: dict, match: re.Match | None = None) -> str:
+        """Resolves variables (e.g. ``${PATH_INFO}``, ``${cookie[name]}``)
+        and regexp backreferences (e.g. ``$1``) in the given value.
+
+        :param value:
+        :param env: Request variables.
+        :param match: Last regexp match object.
+
+        """
+        def resolve_var(matched: re.Match) -> str:
+            name, arg = matched.groups()
+
+            if arg is None:
+                return f"{env.get(name, '')}"
+
+            if name == 'cookie':
+                cookie = SimpleCookie()
+                cookie.load(env.get('HTTP_COOKIE', ''))
+                morsel = cookie.get(arg)
+                return morsel.value if morsel else ''
+
+            if name == 'qs':
+                return parse_qs(env.get('QUERY_STRING', '')).get(arg, [''])[0]
+
+            funcs = {
+                'lower': str.lower,
+                'upper': str.upper,
+                'hex': lambda val: val.encode().hex(),
+                'base64': lambda val: b64encode(val.encode()).decode(),
+            }
+
+            if name in funcs:
+                return funcs[name](f"{env.get(arg, '')}")
+
+            # Other vars (e.g. time[unix], uwsgi[wid]) are expected to be in env as is.
+            return f"{env.get(f'{name}[{arg}]', '')}"
+
+        value = RE_VAR.sub(resolve_var, value)
+
+        if match is not None:
+            groups = [match.group(0), *match.groups()]
+
+            def resolve_backref(matched: re.Match) -> str:
+                idx = int(matched.group(1))
+                return (groups[idx] or '') if idx < len(groups) else ''
+
+            value = RE_BACKREF.sub(resolve_backref, value)
+
+        return value
+
+    def check_condition(self, condition: str, env: dict) -> tuple[bool, re.Match | None]:
+        """Checks ``route-if`` condition.
+
+        :param condition: E.g. ``equal:${PATH_INFO};/``
+        :param env: Request variables.
+
+        """
+        name, _, args = condition.partition(':')
+        subject, _, arg = args.partition(';')
+        subject = self.resolve(subject, env)
+        arg = self.resolve(arg, env)
+
+        def compare(func) -> bool:
+            try:
+                return func(float(subject), float(arg))
+
+            except ValueError:
+                return False
+
+        checks = {
+            ('eq', 'equal', 'isequal', '=='): lambda: subject == arg,
+            ('isnotequal', '!='): lambda: subject != arg,
+            ('startswith', 'starts_with'): lambda: subject.startswith(arg),
+            ('endswith', 'ends_with'): lambda: subject.endswith(arg),
+            ('contains', 'contain'): lambda: arg in subject,
+            ('empty', 'isempty'): lambda: not subject,
+            ('ishigher', '>'): lambda: compare(float.__gt__),
+            ('islower', '<'): lambda: compare(float.__lt__),
+            ('ishigherequal', '>='): lambda: compare(float.__ge__),
+            ('islowerequal', '<='): lambda: compare(float.__le__),
+            ('exists',): lambda: Path(subject).exists(),
+            ('isfile',): lambda: Path(subject).is_file(),
+            ('isdir',): lambda: Path(subject).is_dir(),
+            ('islink',): lambda: Path(subject).is_symlink(),
+            ('isexec',): lambda: Path(subject).is_file() and bool(Path(subject).stat().st_mode & 0o111),
+            ('lord',): lambda: False,
+        }
+
+        if name in {'regexp', 're'}:
+            match = self.get_regexp(arg).search(subject)
+            return match is not None, match
+
+        if name in {'ipv4in', 'ipv6in'}:
+            try:
+                return ip_address(subject) in ip_network(arg, strict=False), None
+
+            except ValueError:
+                return False, None
+
+        for names, check in checks.items():
+            if name in names:
+                return check(), None
+
+        return False, None
+
+    def check(self, rule: Rule, env: dict) -> tuple[bool, re.Match | None]:
+        """Checks whether the given rule matches.
+
+        :param rule:
+        :param env: Request variables.
+
+        """
+        kind = rule.kind
+
+        if kind == 'run':
+            return True, None
+
+        if kind in {'if', 'if-not'}:
+            matched, match = self.check_condition(rule.subject, env)
+            return matched != (kind == 'if-not'), match
+
+        match = self.get_regexp(rule.subject).search(f'{env.get(SUBJECTS_BUILTIN[kind], "")}')
+        return match is not None, match
+
+    def perform(self, rule: Rule, env: dict, match: re.Match | None) -> tuple[str, str]:
+        """Performs (emulates) rule action. Returns a tuple (resolved action, result).
+
+        :param rule:
+        :param env: Request variables. Could be altered by action.
+        :param match: Rule subject regexp match object.
+
+        """
+        name = rule.action_name
+        args = self.resolve(rule.action_args, env, match)
+        result = rule.action_result
+
+        if name in ACTIONS_VARS:
+            env[ACTIONS_VARS[name]] = args
+
+        elif name == 'addvar':
+            var, _, val = args.partition(' ')
+            env[var] = val
+
+        elif name in {'rewrite', 'rewrite-last'}:
+            path, _, query = args.partition('?')
+            env['PATH_INFO'] = path
+            env['QUERY_STRING'] = query
+
+        elif name == 'fixpathinfo':
+            script_name = env.get('SCRIPT_NAME', '')
+            path = env.get('PATH_INFO', '')
+
+            if script_name and path.startswith(script_name):
+                env['PATH_INFO'] = path[len(script_name):]
+
+        elif name in {'cache', 'cache-continue'}:
+            key = dict(chunk.partition('=')[::2] for chunk in args.split(',')).get('key', '')
+
+            if key in self.cache and name == 'cache':
+                result = RESULT_BREAK
+
+        return f'{name}:{args}', result
+
+    def evaluate(self, env: dict, *, stage: str = '') -> Evaluation:
+        """Evaluates routing rules for the given request.
+
+        :param env: Request variables (as in WSGI environ), e.g. PATH_INFO, REQUEST_METHOD.
+
+        :param stage: Stage (chain) to evaluate. See ``RouteRule.stages``.
+
+        """
+        env = dict(env)
+        env.setdefault('REQUEST_URI', env.get('PATH_INFO', '') + (
+            f"?{env['QUERY_STRING']}" if env.get('QUERY_STRING') else ''))
+
+        rules = [(idx, rule) for idx, rule in enumerate(self.rules) if rule.stage == stage]
+        actions = []
+        result = RESULT_NEXT
+        pos = 0
+        steps_left = len(rules) * 100  # Protect from goto loops.
+
+        while pos < len(rules) and steps_left:
+            idx, rule = rules[pos]
+            pos += 1
+            steps_left -= 1
+
+            if rule.kind == 'label':
+                continue
+
+            matched, match = self.check(rule, env)
+            self._on_check(idx, rule, matched=matched)
+
+            if not matched:
+                continue
+
+            action, result_action = self.perform(rule, env, match)
+            actions.append(action)
+
+            if result_action == RESULT_GOTO:
+                where = action.partition(':')[2]
+                pos = next(
+                    (pos_ for pos_, (_, rule_) in enumerate(rules) if rule_.kind == 'label' and rule_.subject == where),
+                    int(where) if where.isdigit() else len(rules))
+                continue
+
+            if result_action != RESULT_NEXT:
+                result = result_action
+                break
+
+        return Evaluation(actions=actions, result=result, env=env)
+
+    def _on_check(self, idx: int, rule: Rule, *, matched: bool):
+        """Hook called after every rule check.
+
+        :param idx: Rule index.
+        :param rule:
+        :param matched:
+
+        """
+
+
+@dataclass
+class RuleStats:
+    """Rule evaluation statistics."""
+
+    checks: int = 0
+    """Number of times the rule was checked."""
+
+    matches: int = 0
+    """Number of times the rule matched."""
+
+    time: int = 0
+    """Total time (nanoseconds) spent checking the rule (e.g. on regexp matching)."""
+
+    @property
+    def time_avg(self) -> float:
+        """Average time (nanoseconds) of a single check."""
+        return self.time / self.checks if self.checks else 0
+
+
+def get_request_env(log_line: str) -> dict | None:
+    """Makes request variables out of a request log line.
+    Returns ``None`` if no request is found in the line.
+
+    Both uWSGI default and Common (Combined) log formats are supported.
+
+    :param log_line: E.g. ``127.0.0.1 - - [01/Jan/2024:00:00:00] "GET /a/?b=c HTTP/1.1" 200 12``
+
+    """
+    matched = RE_LOG_REQUEST.search(log_line)
+
+    if matched is None:
+        return None
+
+    method, uri = matched.groups()
+    path, _, query = uri.partition('?')
+
+    return {
+        'REQUEST_METHOD': method,
+        'REQUEST_URI': uri,
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+    }
+
+
+class RoutingBenchmark(RoutingEvaluator):
+    """Evaluates routing rules gathering per rule statistics
+    (match counts, check timings) and recommends a better rules order.
+
+    .. code-block:: python
+
+        benchmark = RoutingBenchmark(section)
+
+        with open('/var/log/uwsgi/requests.log') as f:
+            benchmark.replay(f)
+
+        print(benchmark.format_report())
+        rules = benchmark.recommend_order()
+
+    """
+    def __init__(self, rules: 'Section | Iterable[Rule]', *, cache: dict | None = None, samples_max: int = 1000):
+        """
+        :param rules: Section to evaluate routing rules from or rules themselves.
+
+        :param cache: Cache contents. See ``RoutingEvaluator``.
+
+        :param samples_max: Maximum number of distinct requests to keep
+            to verify recommended rules order against.
+
+        """
+        super().__init__(rules, cache=cache)
+        self.stats: list[RuleStats] = [RuleStats() for _ in self.rules]
+        self.requests = 0
+        self.samples: dict[tuple, dict] = {}
+        self.samples_max = samples_max
+        self._check_time = 0
+
+    def check(self, rule: Rule, env: dict) -> tuple[bool, re.Match | None]:
+        started = perf_counter_ns()
+        result = super().check(rule, env)
+        self._check_time = perf_counter_ns() - started
+        return result
+
+    def _on_check(self, idx: int, rule: Rule, *, matched: bool):
+        stats = self.stats[idx]
+        stats.checks += 1
+        stats.matches += matched
+        stats.time += self._check_time
+
+    def evaluate(self, env: dict, *, stage: str = '') -> Evaluation:
+        self.requests += 1
+
+        samples = self.samples
+        if len(samples) < self.samples_max:
+            samples.setdefault(tuple(sorted(env.items())), env)
+
+        return super().evaluate(env, stage=stage)
+
+    def replay(self, requests: Iterable[dict | str], *, stage: str = '') -> int:
+        """Evaluates rules for every request from the given ones.
+        Returns the number of requests evaluated.
+
+        :param requests: Request variables dicts or request log lines (see ``get_request_env``).
+            Lines without requests are skipped.
+
+        :param stage: Stage (chain) to evaluate.
+
+        """
+        count = 0
+
+        for request in requests:
+            env = get_request_env(request) if isinstance(request, str) else request
+
+            if env is None:
+                continue
+
+            self.evaluate(env, stage=stage)
+            count += 1
+
+        return count
+
+    def get_hot(self, *, limit: int = 10, by: str = 'matches') -> list[tuple[Rule, RuleStats]]:
+        """Returns the hottest rules with their statistics.
+
+        :param limit: Maximum number of rules to return.
+
+        :param by: Statistics attribute to sort by: ``matches``, ``checks`` or ``time``.
+
+        """
+        hot = [(rule, stats) for rule, stats in zip(self.rules, self.stats, strict=True) if rule.kind != 'label']
+        hot.sort(key=lambda item: getattr(item[1], by), reverse=True)
+        return hot[:limit]
+
+    def format_report(self, *, limit: int = 10) -> str:
+        """Returns a human-readable report on the hottest rules.
+
+        :param limit: Maximum number of rules to report.
+
+        """
+        lines = [f'Requests: {self.requests}', 'Matches  Checks  Avg check, us  Rule']
+
+        for rule, stats in self.get_hot(limit=limit):
+            lines.append(f'{stats.matches:>7}  {stats.checks:>6}  {stats.time_avg / 1000:>13.2f}  {rule}')
+
+        return '\n'.join(lines)
+
+    def _is_disjoint(self, one: Rule, two: Rule) -> bool:
+        # Rules may be swapped only if none of the requests seen matches both of them.
+        check = super().check
+        return not any(check(one, env)[0] and check(two, env)[0] for env in self.samples.values())
+
+    def recommend_order(self) -> list[Rule]:
+        """Returns rules reordered so that frequently matched ones are checked earlier.
+
+        Only adjacent rules with terminal actions (e.g. ``break``, ``redirect``)
+        which do not alter request variables are reordered,
+        and only if no request seen matches both of the swapped rules.
+
+        .. note:: This is a recommendation based on requests seen.
+            Make sure requests replayed are representative.
+
+        """
+        def is_movable(rule: Rule) -> bool:
+            return rule.action_result in {RESULT_BREAK, RESULT_CONTINUE} and rule.action_name not in ACTIONS_ALTERING
+
+        result: list[tuple[Rule, int]] = []
+
+        for rule, stats in zip(self.rules, self.stats, strict=True):
+            pos = len(result)
+
+            if is_movable(rule):
+                while pos:
+                    prev, prev_matches = result[pos - 1]
+
+                    if (
+                        prev.stage != rule.stage
+                        or not is_movable(prev)
+                        or prev_matches >= stats.matches
+                        or not self._is_disjoint(prev, rule)
+                    ):
+                        break
+
+                    pos -= 1
+
+            result.insert(pos, (rule, stats.matches))
+
+        return [rule for rule, _ in result]
@@ -0,0 +1,339 @@
+"""Routing rules optimizer.
+
+Rewrites a chain of routing rules into a semantically equivalent one
+which is cheaper for uWSGI to evaluate per request.
+
+"""
+import re
+from collections.abc import Iterable
+from os.path import commonprefix
+
+from ..exceptions import ConfigurationError
+from .routing_evaluator import ACTIONS_ALTERING, RE_BACKREF, RESULT_NEXT, RoutingEvaluator, Rule
+
+RE_REGEXP_META = re.compile(r'[.^$*+?{}\[\]\\|()]')
+RE_REGEXP_UNMERGEABLE = re.compile(r'\\\d|\(\?(?!:)')
+
+
+def get_literal(regexp: str) -> tuple[str, bool]:
+    """Returns a tuple with literal prefix of an anchored (``^``) regexp
+    and a flag whether regexp is an exact match of that literal.
+
+    :param regexp:
+
+    """
+    if not regexp.startswith('^') or '|' in regexp:
+        return '', False
+
+    literal = []
+    pos = 1
+
+    while pos < len(regexp):
+        char = regexp[pos]
+
+        if char == '\\':
+            escaped = regexp[pos + 1:pos + 2]
+
+            if not escaped or escaped.isalnum():
+                break
+
+            literal.append(escaped)
+            pos += 2
+            continue
+
+        if RE_REGEXP_META.match(char):
+            if char in '*?{' and literal:
+                # Previous char is optional.
+                literal.pop()
+            return ''.join(literal), regexp[pos:] == '$'
+
+        literal.append(char)
+        pos += 1
+
+    return ''.join(literal), False
+
+
+def may_match(regexp: str, value: str) -> bool:
+    """Whether the given regexp may match the given value.
+
+    :param regexp:
+    :param value:
+
+    """
+    try:
+        return re.search(regexp, value) is not None
+
+    except re.error:
+        # PCRE specific regexp.
+        return True
+
+
+def is_terminal(rule: Rule) -> bool:
+    """Whether rule stops rules scanning (or jumps) when matched."""
+    return rule.action_result != RESULT_NEXT
+
+
+def is_altering(rule: Rule) -> bool:
+    """Whether rule action alters request variables."""
+    return rule.action_name in ACTIONS_ALTERING
+
+
+def dedupe(rules: list[Rule]) -> list[Rule]:
+    """Drops repeated rules with terminal actions, since those
+    can't match if their first occurrence didn't.
+
+    :param rules: Rules block (w/o labels).
+
+    """
+    result = []
+
+    def is_repeated(rule: Rule) -> bool:
+        for prev in reversed(result):
+            if prev == rule:
+                return True
+
+            if is_altering(prev):
+                # Request might have changed since the first occurrence.
+                return False
+
+        return False
+
+    for rule in rules:
+        if is_terminal(rule) and is_repeated(rule):
+            continue
+
+        result.append(rule)
+
+    return result
+
+
+def hoist(rules: list[Rule]) -> list[Rule]:
+    """Moves cheap exact match rules with terminal actions up past
+    regexp rules for the same subject which can't match them.
+
+    :param rules: Rules block (w/o labels).
+
+    """
+    result = []
+
+    for rule in rules:
+        pos = len(result)
+        literal, exact = get_literal(rule.subject) if rule.is_regexp else ('', False)
+
+        if exact and is_terminal(rule) and not RE_BACKREF.search(rule.action):
+            while pos:
+                prev = result[pos - 1]
+
+                if (
+                    prev.kind != rule.kind
+                    or is_altering(prev)
+                    or get_literal(prev.subject)[1]  # Keep exact matches order.
+                    or may_match(prev.subject, literal)
+                ):
+                    break
+
+                pos -= 1
+
+        result.insert(pos, rule)
+
+    return result
+
+
+def merge(rules: list[Rule]) -> list[Rule]:
+    """Merges adjacent regexp rules for the same subject with the same
+    terminal action into a single rule with alternation regexp.
+
+    :param rules: Rules block (w/o labels).
+
+    """
+    result = []
+
+    def is_mergeable(rule: Rule) -> bool:
+        return (
+            rule.is_regexp
+            and is_terminal(rule)
+            and not RE_BACKREF.search(rule.action)
+            and not RE_REGEXP_UNMERGEABLE.search(rule.subject)
+        )
+
+    for rule in rules:
+        prev = result[-1] if result else None
+
+        if (
+            prev is not None
+            and is_mergeable(rule) and is_mergeable(prev)
+            and (prev.stage, prev.kind, prev.action) == (rule.stage, rule.kind, rule.action)
+        ):
+            # Alternation has the lowest precedence, so no grouping required.
+            result[-1] = prev._replace(subject=f'{prev.subject}|{rule.subject}')
+            continue
+
+        result.append(rule)
+
+    return result
+
+
+def add_jumps(rules: list[Rule], *, labels: set[str], min_rules: int) -> list[Rule]:
+    """Wraps runs of PATH_INFO regexp rules sharing the same literal prefix
+    into a block which is jumped over (with ``goto``) if a request path
+    doesn't start with that prefix.
+
+    :param rules: Rules block (w/o labels).
+    :param labels: Labels already in use. Updated with new labels.
+    :param min_rules: Minimum number of rules in a run.
+
+    """
+    result = []
+    run: list[Rule] = []
+    run_prefix = ''
+
+    def get_prefix(rule: Rule) -> str:
+        if rule.kind != '':
+            return ''
+        literal, _ = get_literal(rule.subject)
+        return literal[:literal.rfind('/') + 1]
+
+    def common(one: str, two: str) -> str:
+        prefix = commonprefix([one, two])
+        return prefix[:prefix.rfind('/') + 1]
+
+    def flush():
+        if len(run) >= min_rules and len(run_prefix) > 1 and not {';', ' '} & set(run_prefix):
+            label = f'skip-{len(labels) + 1}'
+            while label in labels:
+                label += '-'
+            labels.add(label)
+
+            stage = run[0].stage
+            result.append(Rule(stage, 'if-not', f'startswith:${{PATH_INFO}};{run_prefix}', f'goto:{label}'))
+            result.extend(run)
+            result.append(Rule(stage, 'label', label, ''))
+
+        else:
+            result.extend(run)
+
+        run.clear()
+
+    for rule in rules:
+        prefix = get_prefix(rule)
+        prefix_common = common(run_prefix, prefix) if run else prefix
+
+        if prefix and len(prefix_common) > 1:
+            run.append(rule)
+            run_prefix = prefix_common
+            continue
+
+        flush()
+
+        if prefix:
+            run.append(rule)
+            run_prefix = prefix
+
+        else:
+            result.append(rule)
+
+    flush()
+
+    return result
+
+
+def optimize(
+        rules: list[Rule],
+        *,
+        do_dedupe: bool = True,
+        do_hoist: bool = True,
+        do_jumps: bool = True,
+        do_merge: bool = True,
+        jumps_min_rules: int = 3,
+        samples: Iterable[dict] | None = None,
+) -> list[Rule]:
+    """Optimizes routing rules preserving their semantics.
+
+    :param rules: Rules to optimize.
+
+    :param do_dedupe: Drop repeated rules.
+
+    :param do_hoist: Move cheap exact match rules up.
+
+    :param do_jumps: Jump over runs of rules with the same path prefix
+        if request path doesn't start with it.
+
+    :param do_merge: Merge adjacent rules with the same action into one.
+
+    :param jumps_min_rules: Minimum number of rules with the same prefix to jump over.
+
+    :param samples: Sample requests (env dicts) to verify optimization against.
+        If evaluation of optimized rules differs from the original ones ``ConfigurationError`` is raised.
+
+    """
+    labels = {rule.subject for rule in rules if rule.kind == 'label'}
+    optimized = []
+
+    def optimize_block(block: list[Rule]) -> list[Rule]:
+        if do_dedupe:
+            block = dedupe(block)
+
+        if do_hoist:
+            block = hoist(block)
+
+        if do_jumps:
+            block = add_jumps(block, labels=labels, min_rules=jumps_min_rules)
+
+        if do_merge:
+            block = merge(block)
+
+        return block
+
+    for stage in dict.fromkeys(rule.stage for rule in rules):
+        block = []
+
+        for rule in rules:
+            if rule.stage != stage:
+                continue
+
+            if rule.kind == 'label':
+                # Labels are jump targets. Optimize between them.
+                optimized.extend(optimize_block(block))
+                optimized.append(rule)
+                block = []
+                continue
+
+            block.append(rule)
+
+        optimized.extend(optimize_block(block))
+
+    if samples is not None:
+        verify(rules, optimized, samples=samples)
+
+    return optimized
+
+
+def verify(rules: list[Rule], rules_optimized: list[Rule], *, samples: Iterable[dict]):
+    """Verifies that optimized rules produce the same results as the original ones
+    for the given sample requests. Raises ``ConfigurationError`` otherwise.
+
+    :param rules: Original rules.
+    :param rules_optimized: Optimized rules.
+    :param samples: Sample requests (env dicts).
+
+    """
+    evaluator = RoutingEvaluator(rules)
+    evaluator_optimized = RoutingEvaluator(rules_optimized)
+    stages = {rule.stage for rule in rules}
+
+    # Jumps added by optimizer are not a part of the original behaviour.
+    labels = {rule.subject for rule in rules if rule.kind == 'label'}
+    jumps_added = {f'goto:{rule.subject}' for rule in rules_optimized if rule.kind == 'label'} - {
+        f'goto:{label}' for label in labels}
+
+    for sample in samples:
+        for stage in stages:
+            expected = evaluator.evaluate(sample, stage=stage)
+            actual = evaluator_optimized.evaluate(sample, stage=stage)
+            actions = [action for action in actual.actions if action not in jumps_added]
+
+            if (expected.actions, expected.result) != (actions, actual.result):
+                raise ConfigurationError(
+                    f'Optimized routing rules behave differently for {sample}: '
+                    f'{actions} ({actual.result}) instead of {expected.actions} ({expected.result})')
+
@@ -0,0 +1,45 @@
+from ..base import OptionsGroup
+from ..typehints import Strpath
+from ..utils import KeyValue
+
+
+class SharedArea(OptionsGroup):
+    """Shared area.
+
+    A raw memory region shared between all uWSGI processes (workers, mules, spoolers).
+    Areas are addressed by IDs: numbers in order of definition, starting with 0.
+
+    See ``.runtime.sharedarea.SharedArea`` for runtime access.
+
+    * http://uwsgi.readthedocs.io/en/latest/SharedArea.html
+
+    """
+
+    def add_area(
+            self,
+            *,
+            pages: int | None = None,
+            size: int | None = None,
+            file: Strpath | None = None,
+            fd: int | None = None,
+    ):
+        """Creates a shared area. Areas IDs start with 0 and follow definition order.
+
+        :param pages: Area size in memory pages.
+
+        :param size: Area size in bytes. Required if ``file`` or ``fd`` is used.
+
+        :param file: Map the given file (e.g. ``/dev/zero`` or a file to persist the area into).
+
+        :param fd: Map the given file descriptor.
+
+        """
+        if pages and size is None and file is None and fd is None:
+            value = pages
+
+        else:
+            value = KeyValue(locals(), keys=['pages', 'size', 'file', 'fd'])
+
+        self._set('sharedarea', value, multi=True)
+
+        return self._section
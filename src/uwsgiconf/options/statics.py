@@ -18,6 +18,15 @@ class Statics(OptionsGroup):
     DIR_DOCUMENT_ROOT = 'docroot'
     """Used to check for static files in the requested DOCUMENT_ROOT. Pass into ``static_dir``."""
 
+    FILENAME_HASHED = r'\.[0-9a-f]{8,32}\.\w+(\.gz)?$'
+    """Regular expression matching names of files with content hash in them
+    (e.g. ``app.3f2a1b4c5d6e.css`` as made by Django ``ManifestStaticFilesStorage``).
+
+    Such files never change and could be cached by clients for long.
+    Pass into ``.add_expiration_rule()``.
+
+    """
+
     class expiration_criteria:
         """Expiration criteria (subjects) to use with ``.add_expiration_rule()``."""
 
@@ -177,8 +186,40 @@ class Statics(OptionsGroup):
 
         return self._section
 
-    # todo consider adding:
-    # static-gzip*
+    def set_gzip_params(
+            self,
+            *,
+            all_files: bool | None = None,
+            dirs: Strlist = None,
+            extensions: Strlist = None,
+            regexps: Strlist = None,
+    ):
+        """Allows serving precompressed (gzipped) versions of static files.
+
+        If a client accepts gzip encoding and a file with ``.gz`` suffix
+        exists alongside the requested one (e.g. ``app.css.gz`` for ``app.css``)
+        it is served instead. Files are not compressed on the fly,
+        use ``uwsgiconf.utils.precompress_statics()`` to make compressed versions.
+
+        * http://uwsgi.readthedocs.io/en/latest/StaticFiles.html
+
+        :param all_files: Check for gzipped versions of all requested static files.
+
+        :param dirs: Check for gzipped versions of files in the specified directories (path prefixes).
+
+        :param extensions: Check for gzipped versions of files with the specified extensions (suffixes).
+
+            Example: ``.css``
+
+        :param regexps: Check for gzipped versions of files whose paths match the specified regular expressions.
+
+        """
+        self._set('static-gzip-all', all_files, cast=bool)
+        self._set('static-gzip-dir', dirs, multi=True)
+        self._set('static-gzip-ext', extensions, multi=True)
+        self._set('static-gzip', regexps, multi=True)
+
+        return self._section
 
     def set_paths_caching_params(self, *, timeout: int | None = None, cache_name: str | None = None):
         """Use the uWSGI caching subsystem to store mappings from URI to filesystem paths.
@@ -1,5 +1,6 @@
 
 from ..base import OptionsGroup
+from ..settings import MEMORY_METRIC
 from ..typehints import Intlist, Strlist
 from ..utils import listify
 from .workers_cheapening import *  # noqa
@@ -358,6 +359,26 @@ class Workers(OptionsGroup):
 
         return self._section
 
+    def register_memory_metrics(self, count: int):
+        """Registers metrics for ``.runtime.monitoring.MemoryWatchdog(metrics=True)``
+        to record workers memory trends into:
+
+            * ``memwatch.<worker_id>.leak`` - memory growth rate (bytes per hour);
+            * ``memwatch.<worker_id>.recycled`` - number of worker recycles.
+
+        :param count: Number of workers.
+
+        """
+        monitoring = self._section.monitoring
+        monitoring.set_metrics_params(enable=True)
+
+        for worker_id in range(1, count + 1):
+            monitoring.register_metric(monitoring.metric_types.gauge(MEMORY_METRIC.format(id=worker_id, kind='leak')))
+            monitoring.register_metric(
+                monitoring.metric_types.counter(MEMORY_METRIC.format(id=worker_id, kind='recycled')))
+
+        return self._section
+
     def set_reload_on_exception_params(
             self,
             *,
@@ -1,7 +1,11 @@
 
-from ..config import Section
-from ..typehints import Strlist
-from ..utils import filter_locals
+from pathlib import Path
+from time import time
+from typing import NamedTuple
+
+from ..config import Configuration, Section
+from ..typehints import Strlist, Strpath
+from ..utils import filter_locals, write_atomic
 
 
 class Broodlord:
@@ -84,3 +88,95 @@ class Broodlord:
             section_zerg.master_process.set_idle_params(timeout=30, exit=True)
 
         return section_emperor, section_zerg
+
+
+class VassalsSyncResult(NamedTuple):
+    created: list[Path]
+    updated: list[Path]
+    removed: list[Path]
+    unchanged: list[Path]
+
+
+class VassalsHome:
+    """Manages Emperor vassals directory contents.
+
+    Vassal files contents are compared with the desired configurations,
+    so that only changed vassals are touched (and thus reloaded by the Emperor).
+
+    .. code-block:: python
+
+        VassalsHome('/etc/vassals').sync([
+            Section().env('APP', 'one').as_configuration(alias='one'),
+            Section().env('APP', 'two').as_configuration(alias='two'),
+        ])
+
+    """
+    extension: str = '.ini'
+
+    def __init__(self, path: Strpath):
+        """
+        :param path: Vassals directory. See ``Empire.set_emperor_params(vassals_home=...)``.
+
+        """
+        self.path = Path(path)
+
+    def get_existing(self) -> dict[str, Path]:
+        """Returns existing vassal files mapped by their names."""
+        return {fpath.name: fpath for fpath in self.path.glob(f'*{self.extension}')}
+
+    def sync(
+            self,
+            configurations: list[Configuration],
+            *,
+            remove: bool = True,
+            mtime: float | None = None
+    ) -> VassalsSyncResult:
+        """Syncs vassals directory with the given configurations:
+        creates, updates and removes vassal files as needed.
+
+        Vassal files are named after configuration aliases.
+
+        Files are written atomically (through renaming a temporary file).
+
+        :param configurations: Desired vassals configurations.
+
+        :param remove: Remove vassals files not found in configurations.
+            This makes the Emperor stop those vassals.
+
+        :param mtime: Modification time (timestamp) to set for created and updated files.
+            By default, current time is used, but it is guaranteed that an updated file
+            mtime increases at least by one second, since the Emperor checks mtime with a second precision.
+
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        existing = self.get_existing()
+        created, updated, removed, unchanged = [], [], [], []
+
+        for configuration in configurations:
+            fpath = self.path / f'{configuration.alias}{self.extension}'
+            content = configuration.format(stamp=False)
+            current = existing.pop(fpath.name, None)
+
+            if current is None:
+                write_atomic(fpath, content, mtime=mtime)
+                created.append(fpath)
+                continue
+
+            if current.read_text() == content:
+                unchanged.append(fpath)
+                continue
+
+            mtime_new = mtime
+            if mtime_new is None:
+                mtime_new = max(time(), current.stat().st_mtime + 1)
+
+            write_atomic(fpath, content, mtime=mtime_new)
+            updated.append(fpath)
+
+        if remove:
+            for fpath in existing.values():
+                fpath.unlink(missing_ok=True)
+                removed.append(fpath)
+
+        return VassalsSyncResult(created=created, updated=updated, removed=removed, unchanged=unchanged)
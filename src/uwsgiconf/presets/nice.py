@@ -3,8 +3,9 @@ from collections.abc import Callable
 from pathlib import Path
 
 from ..config import Section as _Section
-from ..settings import ENV_MAINTENANCE, ENV_MAINTENANCE_INPLACE
+from ..settings import ENV_LOG_ENCODED, ENV_MAINTENANCE, ENV_MAINTENANCE_INPLACE
 from ..typehints import Strlist, Strpath
+from ..utils import listify
 
 
 class Section(_Section):
@@ -282,6 +283,9 @@ class Section(_Section):
     def configure_logging_json(self, *, tpl_msg: str = '', tpl_ctx: dict | None = None):
         """Configures uWSGI output to be json-formatted.
 
+        .. note:: ``runtime.logging.JsonFormatter`` detects this is configured
+            and puts just a message with context into a line not to encode it twice.
+
         :param tpl_msg: Custom template string for the message.
 
         :param tpl_ctx: Custom addition context template dictionary.
@@ -303,7 +307,7 @@ class Section(_Section):
         # Log essential request data to place into "msg".
         logging.set_basic_params(template=(
             tpl_msg or
-            f'{vars_req.REQ_METHOD} {vars_req.REQ_URI} -> {vars_req.RESP_STATUS}'
+            f'{vars_req.REQ_METHOD} {vars_req.REQ_URI} -> {vars_req.RESP_STATUS} in {vars_req.RESP_TIME_MS} msecs'
         ))
 
         new_line = logging.encoders.newline()
@@ -342,6 +346,9 @@ class Section(_Section):
             new_line
         ])
 
+        # Let `runtime.logging.JsonFormatter` know lines are encoded already.
+        self.env(ENV_LOG_ENCODED, 1)
+
         return self
 
 
@@ -399,3 +406,24 @@ class PythonSection(Section):
         self.python.set_wsgi_params(module=wsgi_module, callable_name=wsgi_callable)
 
         self.applications.set_basic_params(exit_if_none=require_app)
+
+    def configure_copy_on_write(self, *, warmup: Strlist = None):
+        """Configures maximization of memory shared between master and workers
+        with copy-on-write friendly preforking.
+
+        Garbage collector is disabled while the application is loaded in master,
+        then objects inherited from master are frozen (``gc.freeze()``) in workers right after fork,
+        before any collection, and garbage collection is re-enabled.
+
+        .. note:: Application is to be loaded in master: do not switch applications into lazy mode.
+
+        Memory sharing can be checked with ``.runtime.platform.uwsgi.workers_memory``
+        or on Workers page of ``uwsgify`` Django admin.
+
+        :param warmup: Modules to import in master to be shared with workers.
+
+        """
+        # uWSGI has no hooks calling Python, so a module doing the work is imported in master.
+        self.python.import_module(['uwsgiconf.runtime.prefork', *listify(warmup or [])], shared=True)
+
+        return self
@@ -118,10 +118,30 @@ class Cache:
         if not isinstance(value, bytes):
             value = f'{value}'.encode()
 
-        return uwsgi.cache_set(key, value, timeout, self.name)
+        return uwsgi.cache_update(key, value, timeout, self.name)
 
     __setitem__ = set
 
+    def add(self, key: str, value: Any, *, timeout: int | None = None) -> bool:
+        """Atomically sets the specified key value if the key does not exist.
+        Returns False if the key exists.
+
+        :param key: Cache key to set.
+
+        :param value: Value to store in cache.
+            .. note:: This value will be casted to str->bytes (as uWSGI cache works with bytes-like objects).
+
+        :param timeout: 0 not to expire. Object default is used if not set.
+
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        if not isinstance(value, bytes):
+            value = f'{value}'.encode()
+
+        return bool(uwsgi.cache_set(key, value, timeout, self.name))
+
     def delete(self, key: str):
         """Deletes the given cached key from the cache.
 
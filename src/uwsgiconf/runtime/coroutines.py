@@ -0,0 +1,216 @@
+"""Coroutines (``async def``) driven by uWSGI async cores.
+
+Awaitables here are built on top of ``.asynced`` primitives:
+while a coroutine awaits, its async core is suspended and the worker
+handles other requests. So a single worker can multiplex many requests
+waiting for slow I/O (see ``.workers.set_async_params()``).
+
+.. code-block:: python
+
+    from uwsgiconf.runtime import coroutines
+
+    @coroutines.wsgi
+    async def application(environ, start_response):
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+
+        fd = await coroutines.connect('127.0.0.1:6379', timeout=5)
+        ...
+        await coroutines.wait_for_fd_read(fd, timeout=5)
+        ...
+        return [b'done']
+
+.. warning:: This is not an ``asyncio`` integration: there is no event loop,
+    so only awaitables from this module (and coroutines awaiting them) are supported,
+    while ``asyncio`` ones (e.g. ``asyncio.sleep()``, aiohttp) are not.
+    Use uWSGI ``asyncio`` loop engine for ``asyncio`` based code.
+
+"""
+from collections.abc import Callable, Coroutine, Generator, Iterable
+from functools import wraps
+from typing import Any
+
+from .. import uwsgi
+
+
+class _Suspension:
+    # Awaiting passes control to the next async core.
+    # Result is a file descriptor which is ready or -1 on timeout.
+
+    __slots__ = []
+
+    def __await__(self) -> Generator['_Suspension', int, int]:
+        return (yield self)
+
+
+_SUSPENSION = _Suspension()
+
+
+async def wait_for_fd_read(fd: int, *, timeout: int = 0):
+    """Waits until there is something to read from the file descriptor.
+
+    :param fd: File descriptor.
+
+    :param timeout: Timeout (seconds). Default: infinite.
+
+    :raises TimeoutError:
+
+    """
+    uwsgi.wait_fd_read(fd, timeout)
+
+    if await _SUSPENSION != fd:
+        raise TimeoutError(f'Timed out waiting for fd {fd} to read')
+
+
+async def wait_for_fd_write(fd: int, *, timeout: int = 0):
+    """Waits until the file descriptor is ready for writing.
+
+    :param fd: File descriptor.
+
+    :param timeout: Timeout (seconds). Default: infinite.
+
+    :raises TimeoutError:
+
+    """
+    uwsgi.wait_fd_write(fd, timeout)
+
+    if await _SUSPENSION != fd:
+        raise TimeoutError(f'Timed out waiting for fd {fd} to write')
+
+
+async def sleep(seconds: int):
+    """Sleeps passing control to other async cores.
+
+    :param seconds:
+
+    """
+    uwsgi.async_sleep(seconds)
+    await _SUSPENSION
+
+
+async def connect(socket: str, *, timeout: int = 0) -> int:
+    """Connects to the socket. Returns a file descriptor.
+
+    :param socket: Socket address, e.g. ``127.0.0.1:6379`` or ``/tmp/my.sock``.
+
+    :param timeout: Timeout (seconds). Default: infinite.
+
+    :raises ConnectionError:
+    :raises TimeoutError:
+
+    """
+    fd = uwsgi.async_connect(socket)
+
+    if fd is None or fd < 0:
+        raise ConnectionError(f'Unable to connect to {socket}')
+
+    try:
+        await wait_for_fd_write(fd, timeout=timeout)
+
+        if not uwsgi.is_connected(fd):
+            raise ConnectionError(f'Unable to connect to {socket}')
+
+    except Exception:
+        uwsgi.close(fd)
+        raise
+
+    return fd
+
+
+def drive(coro: Coroutine) -> Generator[None, None, Any]:
+    """Runs the coroutine step by step yielding where it awaits.
+    Returns coroutine result.
+
+    :param coro:
+
+    """
+    value = None
+
+    while True:
+        try:
+            awaited = coro.send(value)
+
+        except StopIteration as e:
+            return e.value
+
+        if awaited is not _SUSPENSION:
+            coro.close()
+            raise RuntimeError(
+                f'Unsupported awaitable {awaited!r}. Only uwsgiconf.runtime.coroutines ones are supported')
+
+        yield
+
+        value = uwsgi.ready_fd()
+
+
+def run(coro: Coroutine) -> Any:
+    """Runs the coroutine on the current async core. Returns coroutine result.
+
+    .. note:: Requires a suspend engine (e.g. ``ugreen``) to switch cores in the middle of a function.
+        Use ``wsgi()`` otherwise.
+
+    :param coro:
+
+    """
+    steps = drive(coro)
+
+    try:
+        while True:
+            next(steps)
+            uwsgi.suspend()
+
+    except StopIteration as e:
+        return e.value
+
+
+def wsgi(func: Callable[[dict, Callable], Coroutine]) -> Callable[[dict, Callable], Iterable[bytes]]:
+    """Decorator turning an ``async def`` WSGI-style handler into a WSGI application
+    for uWSGI async mode.
+
+    The handler is to call ``start_response`` and return response body
+    (bytes, str or an iterable of those).
+
+    .. note:: The application is a generator yielding empty chunks on suspension
+        to pass control to uWSGI async loop. As PEP 3333 requires ``start_response``
+        to be called before anything is yielded, the handler awaiting before that
+        is suspended with ``uwsgi.suspend()`` instead, which requires
+        a suspend engine (e.g. ``ugreen``). So call ``start_response`` as early as possible.
+
+    :param func:
+
+    """
+    @wraps(func)
+    def application(environ: dict, start_response: Callable) -> Iterable[bytes]:
+        started = []
+
+        def start_response_(*args):
+            started.append(True)
+            return start_response(*args)
+
+        steps = drive(func(environ, start_response_))
+
+        try:
+            while True:
+                next(steps)
+
+                if started:
+                    # Empty chunk passes control to uWSGI async loop.
+                    yield b''
+
+                else:
+                    uwsgi.suspend()
+
+        except StopIteration as e:
+            body = e.value
+
+        if isinstance(body, str | bytes):
+            body = [body]
+
+        try:
+            for chunk in body or []:
+                yield chunk.encode() if isinstance(chunk, str) else chunk
+
+        finally:
+            close = getattr(body, 'close', None)
+            close and close()
+
+    return application
@@ -0,0 +1,71 @@
+from collections.abc import Callable
+from functools import wraps
+
+from .. import uwsgi
+from ..utils import decode, decode_deep
+
+
+class Legion:
+    """Interface for uWSGI Legion: a cluster of nodes electing a lord.
+
+    Lordship is checked in the local uWSGI instance memory
+    (no network or database round trips).
+
+    .. warning:: Legion is to be configured in uWSGI config beforehand
+        (``legion``, ``legion-node`` options).
+
+    .. code-block:: python
+
+        legion = Legion('mylegion')
+
+        @legion.lord_only
+        def cleanup():
+            ...
+
+    * http://uwsgi.readthedocs.io/en/latest/Legion.html
+
+    """
+    __slots__ = ['name']
+
+    def __init__(self, name: str):
+        """
+        :param name: Legion name.
+
+        """
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def is_lord(self) -> bool:
+        """Whether this node is the lord of the legion."""
+        return bool(uwsgi.i_am_the_lord(self.name))
+
+    @property
+    def lord_scroll(self) -> str | None:
+        """The lord scroll: arbitrary data published by the lord."""
+        scroll = uwsgi.lord_scroll(self.name)
+        return None if scroll is None else decode(scroll)
+
+    @property
+    def scrolls(self) -> list[str]:
+        """Scrolls of the legion nodes."""
+        return decode_deep(uwsgi.scrolls(self.name) or [])
+
+    def lord_only(self, func: Callable) -> Callable:
+        """Decorator. Runs the function only if this node is the lord.
+        Returns None otherwise.
+
+        :param func:
+
+        """
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+
+            if not self.is_lord:
+                return None
+
+            return func(*args, **kwargs)
+
+        return wrapper
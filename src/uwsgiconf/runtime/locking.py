@@ -1,7 +1,38 @@
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable
 from functools import wraps
+from time import monotonic, perf_counter_ns, sleep
+from zlib import crc32
 
 from .. import uwsgi
+from ..settings import LOCK_METRIC
+from .sharedarea import SharedArea
+
+
+def _wait_for(
+        check: Callable[[], bool],
+        timeout: float | None,
+        *,
+        spins: int = 100,
+        sleep_max: float = 0.01,
+) -> bool:
+    # Spin, then sleep with backoff until check passes. Returns False on timeout.
+    for _ in range(spins):
+        if check():
+            return True
+
+    deadline = None if timeout is None else monotonic() + timeout
+    interval = 0.0005
+
+    while not check():
+        remaining = interval if deadline is None else deadline - monotonic()
+
+        if remaining <= 0:
+            return False
+
+        sleep(min(interval, remaining))
+        interval = min(interval * 2, sleep_max)
+
+    return True
 
 
 class Lock:
@@ -28,14 +59,25 @@ class Lock:
                 pass
 
     """
-    __slots__ = ['num']
+    __slots__ = ['_acquired_at', 'metrics', 'num']
+
+    spins: int = 100
+    """Number of lock checks before sleeping while waiting with timeout."""
 
-    def __init__(self, num: int = 0):
+    sleep_max: float = 0.01
+    """Maximum interval (seconds) between lock checks while waiting with timeout."""
+
+    def __init__(self, num: int = 0, *, metrics: bool = False):
         """
         :param num: Lock number (0-64). 0 is always available and is used as default.
 
+        :param metrics: Record wait and hold time into uWSGI metrics.
+            Metrics need to be registered with ``.config.locks.register_metrics()``.
+
         """
         self.num = num
+        self.metrics = metrics
+        self._acquired_at = 0
 
     def __int__(self):
         return self.num
@@ -59,24 +101,69 @@ class Lock:
         """
         return uwsgi.is_locked(self.num)
 
-    def acquire(self):
-        """Sets the lock.
+    def acquire(self, *, timeout: float | None = None) -> bool:
+        """Sets the lock. Returns False if unable to do it in time.
+
+        :param timeout: Seconds to wait for the lock. Default: wait infinitely.
+
+            .. note:: The lock is checked to be released before acquiring,
+                but another process may be fast enough to set it first,
+                so acquiring may take somewhat longer than the timeout.
 
         :raises ValueError: For Spooler or invalid lock number
 
         """
+        started = perf_counter_ns() if self.metrics else 0
+
+        if timeout is not None:
+            # uWSGI has no lock acquiring with timeout.
+            is_locked = uwsgi.is_locked
+            num = self.num
+
+            if not _wait_for(lambda: not is_locked(num), timeout, spins=self.spins, sleep_max=self.sleep_max):
+                return False
+
         uwsgi.lock(self.num)
+
+        if started:
+            self._acquired_at = acquired_at = perf_counter_ns()
+            self._record(acquired=1, wait=(acquired_at - started) // 1000)
+
         return True
 
+    def try_acquire(self) -> bool:
+        """Sets the lock if it's not set. Returns False if the lock is set.
+
+        :raises ValueError: For Spooler or invalid lock number
+
+        """
+        if uwsgi.is_locked(self.num):
+            return False
+
+        return self.acquire()
+
     def release(self):
         """Unlocks the lock.
 
         :raises ValueError: For Spooler or invalid lock number
 
         """
+        acquired_at = self._acquired_at
+
+        if acquired_at:
+            self._acquired_at = 0
+            self._record(hold=(perf_counter_ns() - acquired_at) // 1000)
+
         uwsgi.unlock(self.num)
         return True
 
+    def _record(self, **values: int):
+        num = self.num
+        metric_inc = uwsgi.metric_inc
+
+        for kind, value in values.items():
+            metric_inc(LOCK_METRIC.format(num=num, kind=kind), value)
+
     __enter__ = acquire
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -85,3 +172,215 @@ class Lock:
 
 lock = Lock
 """Convenience alias for ``Lock``."""
+
+
+class StripedLock:
+    """Set of locks with keys distributed among them,
+    so that operations on different keys rarely wait for each other
+    (unlike with one lock for all).
+
+    .. code-block:: python
+
+        # Requires `.config.locks.set_basic_params(count=8)`.
+        locks = StripedLock(range(1, 9))
+
+        with locks[f'user-{user_id}']:
+            ...
+
+    .. note:: Keys are distributed with CRC32, so the same key
+        maps to the same lock in every process.
+
+    """
+    __slots__ = ['locks']
+
+    def __init__(self, nums: Iterable[int], *, metrics: bool = False):
+        """
+        :param nums: Lock numbers to use. E.g. ``range(1, 9)``.
+
+        :param metrics: Record wait and hold time into uWSGI metrics.
+
+        """
+        self.locks = [Lock(num, metrics=metrics) for num in nums]
+
+        if not self.locks:
+            raise ValueError('At least one lock number is required')
+
+    def __len__(self) -> int:
+        return len(self.locks)
+
+    def get(self, key: Hashable) -> Lock:
+        """Returns a lock for the given key.
+
+        :param key:
+
+        """
+        key = key if isinstance(key, bytes) else f'{key}'.encode()
+        locks = self.locks
+        return locks[crc32(key) % len(locks)]
+
+    __getitem__ = get
+
+
+class RWLock:
+    """Reader-writer lock: many readers at a time or one writer.
+
+    Composed of a uWSGI lock and two counters (active readers and waiting writers)
+    in a shared area. Writers are preferred: new readers let waiting writers go first,
+    yet wait for them no longer than ``starvation`` seconds.
+
+    .. code-block:: python
+
+        # Requires `.config.shared_area.add_area(pages=1)` and `.config.locks.set_basic_params(count=1)`.
+        rwlock = RWLock(1)
+
+        with rwlock.read:
+            ...
+
+        @rwlock.write
+        def update():
+            ...
+
+    .. warning:: If a process dies holding the lock for reading
+        writers will wait forever (or until their timeout).
+
+    """
+    __slots__ = ['area', 'lock', 'pos_readers', 'pos_writers', 'read', 'starvation', 'write']
+
+    def __init__(
+            self,
+            num: int = 0,
+            *,
+            area: int = 0,
+            offset: int = 0,
+            starvation: float = 1,
+            metrics: bool = False,
+    ):
+        """
+        :param num: uWSGI lock number.
+
+        :param area: Shared area ID to keep counters in.
+
+        :param offset: Counters offset (bytes) in the shared area. Counters take 16 bytes.
+
+        :param starvation: Maximum time (seconds) a new reader waits
+            for writers to go first.
+
+        :param metrics: Record wait and hold time of the uWSGI lock into uWSGI metrics.
+
+        """
+        self.lock = Lock(num, metrics=metrics)
+        self.area = SharedArea(area)
+        self.pos_readers = offset
+        self.pos_writers = offset + 8
+        self.starvation = starvation
+
+        self.read = RWLockSide(self.acquire_read, self.release_read)
+        """Reading side to be used as a context manager or a decorator."""
+
+        self.write = RWLockSide(self.acquire_write, self.release_write)
+        """Writing side to be used as a context manager or a decorator."""
+
+    @property
+    def readers(self) -> int:
+        """Number of active readers."""
+        return self.area.get_int(self.pos_readers)
+
+    @property
+    def writers(self) -> int:
+        """Number of writers waiting."""
+        return self.area.get_int(self.pos_writers)
+
+    def acquire_read(self, *, timeout: float | None = None) -> bool:
+        """Acquires the lock for reading. Returns False if unable to do it in time.
+
+        :param timeout: Seconds to wait. Default: wait infinitely.
+
+        """
+        started = monotonic()
+        area = self.area
+        pos_writers = self.pos_writers
+
+        if area.get_int(pos_writers):
+            wait = self.starvation if timeout is None else min(self.starvation, timeout)
+            _wait_for(lambda: not area.get_int(pos_writers), wait, spins=0)
+
+        if timeout is not None:
+            timeout = max(timeout - (monotonic() - started), 0)
+
+        lock = self.lock
+
+        if not lock.acquire(timeout=timeout):
+            return False
+
+        try:
+            area.inc(self.pos_readers)
+
+        finally:
+            lock.release()
+
+        return True
+
+    def release_read(self):
+        """Releases the lock acquired for reading."""
+        self.area.dec(self.pos_readers)
+
+    def acquire_write(self, *, timeout: float | None = None) -> bool:
+        """Acquires the lock for writing. Returns False if unable to do it in time.
+
+        :param timeout: Seconds to wait. Default: wait infinitely.
+
+        """
+        started = monotonic()
+        area = self.area
+        lock = self.lock
+
+        area.inc(self.pos_writers)
+
+        try:
+            if not lock.acquire(timeout=timeout):
+                return False
+
+        finally:
+            area.dec(self.pos_writers)
+
+        # New readers are held by the lock. Wait for active ones to finish.
+        pos_readers = self.pos_readers
+        remaining = None if timeout is None else max(timeout - (monotonic() - started), 0)
+
+        if not _wait_for(lambda: not area.get_int(pos_readers), remaining):
+            lock.release()
+            return False
+
+        return True
+
+    def release_write(self):
+        """Releases the lock acquired for writing."""
+        self.lock.release()
+
+
+class RWLockSide:
+    """Reading or writing side of ``RWLock``.
+    Can be used as a context manager or a decorator.
+
+    """
+    __slots__ = ['acquire', 'release']
+
+    def __init__(self, acquire: Callable[..., bool], release: Callable[[], None]):
+        self.acquire = acquire
+        self.release = release
+
+    def __call__(self, func: Callable):
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+
+            with self:
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
@@ -1,4 +1,15 @@
+import json
+import logging
+import os
+from collections import deque
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from itertools import count
+from threading import Event, Thread
+from time import perf_counter
+
 from .. import uwsgi
+from ..settings import LOG_SAMPLE_METRIC, LOG_SAMPLE_VAR, get_log_encoded
 from ..utils import decode
 
 variable_set = uwsgi.set_logvar
@@ -18,3 +29,351 @@ def variable_get(name: str) -> str:
 log_message = uwsgi.log
 
 get_current_log_size = uwsgi.logsize
+
+
+RECORD_ATTRS = {*vars(logging.makeLogRecord({})), 'message', 'asctime', 'taskName'}
+"""Standard log record attributes. Others are considered `extra` context."""
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats log records into JSON of the same structure
+    as ``presets.nice.Section.configure_logging_json()`` uses:
+
+    .. code-block:: json
+
+        {"dt": "2025-06-06T22:47:03+0700", "src": "python", "msg": "message", "ctx": {}, "ms": 1749224823443}
+
+    Logger name, level and `extra` attributes of a record are put into ``ctx``.
+
+    If uWSGI log encoder already wraps lines into JSON (see ``configure_logging_json()``),
+    only a message followed by context (``message [logger=mine level=INFO]``) is formatted,
+    so that it's put into ``msg`` as is, and not as an escaped JSON string.
+
+    """
+    def __init__(self, *, src: str = 'python', encoded: bool | None = None):
+        """
+        :param src: Value for ``src`` field.
+
+        :param encoded: Whether uWSGI log lines are json-encoded by uWSGI itself.
+            Default: detected from the environment.
+
+        """
+        super().__init__()
+        self.src = src
+        self.encoded = get_log_encoded() if encoded is None else encoded
+        self._dt_cache = (0, '')
+
+    def format_dt(self, created: float) -> str:
+        second = int(created)
+        cached_second, cached = self._dt_cache
+
+        if second != cached_second:
+            # Many records are logged within the same second. Spare formatting.
+            cached = datetime.fromtimestamp(second).astimezone().strftime('%Y-%m-%dT%H:%M:%S%z')
+            self._dt_cache = (second, cached)
+
+        return cached
+
+    def format(self, record: logging.LogRecord) -> str:
+        created = record.created
+        ctx = {
+            'logger': record.name,
+            'level': record.levelname,
+            **{key: value for key, value in record.__dict__.items() if key not in RECORD_ATTRS},
+        }
+
+        exc = self.formatException(record.exc_info) if record.exc_info else ''
+
+        if self.encoded:
+            pairs = ' '.join(f'{key}={value}' for key, value in ctx.items())
+            line = f'{record.getMessage()} [{pairs}]'
+            return f'{line}\n{exc}' if exc else line
+
+        if exc:
+            ctx['exc'] = exc
+
+        return json.dumps({
+            'dt': self.format_dt(created),
+            'src': self.src,
+            'msg': record.getMessage(),
+            'ctx': ctx,
+            'ms': int(created * 1000),
+        }, ensure_ascii=False, default=str)
+
+
+class BatchedHandler(logging.Handler):
+    """Logging handler buffering formatted records in memory
+    and writing them into uWSGI log in batches from a background thread,
+    so that request threads do not wait for log writes.
+
+    .. code-block:: python
+
+        handler = BatchedHandler(capacity=5000, interval=50)
+        handler.setFormatter(JsonFormatter())
+        logging.getLogger().addHandler(handler)
+
+    .. note:: Every worker (process) has its own buffer and flushing thread
+        started on the first record logged in the process.
+        Threads must be enabled (see ``.python.set_basic_params(enable_threads=True)``).
+
+    .. note:: Buffer appends and pops are atomic (``deque``), no locks are involved.
+
+    """
+    POLICY_DROP_NEW = 'drop_new'
+    """When the buffer is full new records are dropped."""
+
+    POLICY_DROP_OLD = 'drop_old'
+    """When the buffer is full the oldest records are dropped to make room for new ones."""
+
+    POLICY_SAMPLE = 'sample'
+    """When the buffer is full only every Nth new record is kept (see ``sample_rate``),
+    the oldest records are dropped to make room for them."""
+
+    def __init__(
+            self,
+            level: int = logging.NOTSET,
+            *,
+            capacity: int = 1000,
+            interval: int = 100,
+            policy: str = POLICY_DROP_NEW,
+            sample_rate: int = 10,
+            keep_level: int = logging.ERROR,
+            joined: bool = False,
+    ):
+        """
+        :param level: Handler level.
+
+        :param capacity: Maximum number of records in the buffer.
+            The flushing thread is woken up when the buffer is full.
+
+        :param interval: Interval (milliseconds) between buffer flushes.
+
+        :param policy: What to do with records if the buffer is full. See ``POLICY_`` constants.
+
+        :param sample_rate: Keep every Nth record with ``POLICY_SAMPLE``.
+
+        :param keep_level: Records of this or higher levels are never dropped.
+
+        :param joined: Write a batch into uWSGI log with one call.
+
+            .. warning:: uWSGI log encoders will treat the batch as one message.
+
+        """
+        super().__init__(level)
+        self.capacity = capacity
+        self.interval = interval
+        self.policy = policy
+        self.sample_rate = sample_rate
+        self.keep_level = keep_level
+        self.joined = joined
+
+        self.buffer: deque[str] = deque()
+        self.dropped = 0
+        """Number of records dropped since the last flush."""
+
+        self._full_count = 0
+        self._wakeup = Event()
+        self._closed = False
+        self._pid = 0
+
+    def _ensure_thread(self):
+        pid = os.getpid()
+
+        if self._pid == pid:
+            return
+
+        with self.lock:
+            if self._pid == pid:
+                return
+
+            if self._pid:
+                # Forked. Records from the parent are to be flushed by the parent.
+                self.buffer.clear()
+                self.dropped = 0
+
+            self._pid = pid
+            self._wakeup = Event()
+            Thread(target=self._run, name='uwsgiconf-log-flusher', daemon=True).start()
+
+    def _run(self):
+        pid = os.getpid()
+        wakeup = self._wakeup
+        interval = self.interval / 1000
+
+        while not self._closed and self._pid == pid:
+            wakeup.wait(interval)
+            wakeup.clear()
+            self.flush()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            message = self.format(record)
+
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+            return
+
+        self._ensure_thread()
+
+        buffer = self.buffer
+
+        if len(buffer) >= self.capacity and record.levelno < self.keep_level:
+            policy = self.policy
+
+            if policy == self.POLICY_DROP_NEW:
+                self.dropped += 1
+                return
+
+            if policy == self.POLICY_SAMPLE:
+                self._full_count += 1
+
+                if self._full_count % self.sample_rate:
+                    self.dropped += 1
+                    return
+
+            try:
+                buffer.popleft()
+                self.dropped += 1
+
+            except IndexError:
+                pass
+
+        buffer.append(message)
+
+        if len(buffer) >= self.capacity:
+            self._wakeup.set()
+
+    def flush(self):
+        """Writes buffered records into uWSGI log."""
+        buffer = self.buffer
+        batch = []
+
+        try:
+            while True:
+                batch.append(buffer.popleft())
+
+        except IndexError:
+            pass
+
+        dropped = self.dropped
+
+        if dropped:
+            self.dropped -= dropped
+            batch.append(f'{dropped} log record(s) dropped: buffer is full')
+
+        if not batch:
+            return
+
+        if self.joined:
+            log_message('\n'.join(batch))
+            return
+
+        for message in batch:
+            log_message(message)
+
+    def close(self):
+        self._closed = True
+        self._wakeup.set()
+        self.flush()
+        super().close()
+
+
+class RequestLogSampler:
+    """WSGI middleware deciding whether to log a request
+    for ``.logging.set_requests_sampling()`` configured requests logging.
+
+    .. code-block:: python
+
+        application = RequestLogSampler(get_wsgi_application())
+
+    .. note:: Response iterable is wrapped to detect request end,
+        so ``wsgi.file_wrapper`` responses lose sendfile() optimization.
+
+    """
+    def __init__(self, app: Callable, *, rate: int = 10, slower: int | None = 1000, errors: bool = True):
+        """
+        :param app: WSGI application to wrap.
+
+        :param rate: Default sample rate. Used if sample rate metric is not available.
+
+        :param slower: Log all requests slower than the specified number of milliseconds.
+
+        :param errors: Log all requests with 4xx and 5xx responses.
+
+        """
+        self.app = app
+        self.rate = rate
+        self.slower = slower
+        self.errors = errors
+        self._counter = count()
+
+    @classmethod
+    def set_rate(cls, rate: int) -> bool:
+        """Sets sample rate for all workers.
+
+        :param rate: Log one of every N fast successful requests.
+
+        """
+        return uwsgi.metric_set(LOG_SAMPLE_METRIC, rate)
+
+    def get_rate(self) -> int:
+        """Returns current sample rate."""
+        return uwsgi.metric_get(LOG_SAMPLE_METRIC) or self.rate
+
+    def sample(self, *, status: int, duration: float):
+        """Decides whether to log the current request.
+
+        :param status: Response status code.
+        :param duration: Request duration (milliseconds).
+
+        """
+        slower = self.slower
+
+        if (self.errors and status >= 400) or (slower is not None and duration >= slower):
+            rate = 1
+
+        else:
+            rate = self.get_rate()
+
+            if rate > 1 and next(self._counter) % rate:
+                return
+
+        uwsgi.add_var(LOG_SAMPLE_VAR, f'{rate}')
+        uwsgi.log_this_request()
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable:
+        started = perf_counter()
+        status = []
+
+        def start_response_(status_: str, headers: list, *args):
+            status[:] = [status_]
+            return start_response(status_, headers, *args)
+
+        def on_close():
+            self.sample(
+                status=int((status or ['500'])[0][:3]),
+                duration=(perf_counter() - started) * 1000,
+            )
+
+        return _ClosingIterable(self.app(environ, start_response_), on_close)
+
+
+class _ClosingIterable:
+    # Keeps the response iterable intact calling a function on close.
+
+    __slots__ = ['iterable', 'on_close']
+
+    def __init__(self, iterable: Iterable, on_close: Callable):
+        self.iterable = iterable
+        self.on_close = on_close
+
+    def __iter__(self):
+        return iter(self.iterable)
+
+    def close(self):
+        try:
+            close = getattr(self.iterable, 'close', None)
+            close and close()
+
+        finally:
+            self.on_close()
@@ -1,6 +1,14 @@
+import os
+from collections import deque
+from signal import SIGHUP
+from time import monotonic
+
 from .. import uwsgi
+from ..settings import MEMORY_METRIC
 from ..typehints import Strint
-from .signals import Signal, _get_signal_decorator
+from .caching import Cache
+from .scheduling import register_timer
+from .signals import Signal, TypeTarget, _get_signal_decorator
 from .task_utils import TaskChecker
 
 
@@ -111,3 +119,177 @@ class Metric:
 
         """
         return uwsgi.metric_div(self.name, value)
+
+
+class MemoryWatchdog:
+    """Workers memory leak watchdog.
+
+    Every worker samples its resident set size (RSS) on a timer and fits a linear growth trend.
+    When the limit is predicted to be hit within the horizon, the worker gracefully recycles itself:
+    it finishes the current request, exits and is respawned by the master.
+
+    Timer signal handlers are run by workers between requests,
+    so sampling and recycling take place when a worker is idle.
+
+    .. code-block:: python
+
+        # Requires `.config.caching.add_cache('memwatch', max_items=10)`.
+        watchdog = MemoryWatchdog(limit=512, cache='memwatch')
+        watchdog.register()
+
+    Recycle storms (workers leaking alike being reloaded at once) are prevented:
+
+        * horizons are spread across workers (``jitter``);
+        * with ``cache`` set, only one worker recycles within the ``cooldown`` period.
+
+    .. note:: Complements hard limits, e.g. ``.config.workers.set_reload_params(max_rss=...)``.
+
+    """
+    recycle_key: str = 'memwatch.recycle'
+    """Cache key used to coordinate recycles."""
+
+    def __init__(
+            self,
+            *,
+            limit: int,
+            interval: int = 30,
+            window: int = 20,
+            horizon: int = 600,
+            jitter: float = 0.5,
+            cache: str = '',
+            cooldown: int = 60,
+            metrics: bool = False,
+    ):
+        """
+        :param limit: RSS limit (megabytes) not to be hit.
+
+        :param interval: Sampling interval (seconds).
+
+        :param window: Number of latest samples to fit a trend to.
+            No recycles are made until the window is filled.
+
+        :param horizon: Recycle if the limit is predicted to be hit within this number of seconds.
+
+        :param jitter: Fraction (0-1) of the horizon to spread across workers,
+            so that workers leaking alike recycle at different times.
+
+        :param cache: uWSGI cache name to coordinate recycles of workers.
+
+        :param cooldown: Minimum interval (seconds) between recycles of any workers. Requires ``cache``.
+
+        :param metrics: Record leak rate and recycles into uWSGI metrics.
+            Metrics need to be registered with ``.config.workers.register_memory_metrics()``.
+
+        """
+        self.limit = limit
+        self.interval = interval
+        self.window = window
+        self.horizon = horizon
+        self.jitter = jitter
+        self.cache = cache
+        self.cooldown = cooldown
+        self.metrics = metrics
+        self.samples: deque[tuple[float, int]] = deque(maxlen=window)
+        """Samples: (seconds, RSS bytes) pairs."""
+
+    def register(self, target: TypeTarget = 'workers'):
+        """Registers a timer sampling memory in every worker.
+
+        :param target: Signal target. See ``register_timer()``.
+
+        """
+        def memwatch():
+            self.check()
+
+        register_timer(self.interval, target=target, checker=TaskChecker(maintenance=False))(memwatch)
+
+    def sample(self, rss: int | None = None, *, at: float | None = None):
+        """Adds a memory usage sample.
+
+        :param rss: RSS (bytes). Default: current worker RSS.
+
+        :param at: Sample time (seconds). Default: now (monotonic).
+
+        """
+        self.samples.append((monotonic() if at is None else at, uwsgi.mem()[0] if rss is None else rss))
+
+    @property
+    def leak_rate(self) -> float:
+        """RSS growth rate (bytes per second) fitted with least squares. 0 if not enough samples."""
+        samples = self.samples
+        count = len(samples)
+
+        if count < 2:
+            return 0.0
+
+        mean_at = sum(at for at, _ in samples) / count
+        mean_rss = sum(rss for _, rss in samples) / count
+        variance = sum((at - mean_at) ** 2 for at, _ in samples)
+
+        if not variance:
+            return 0.0
+
+        return sum((at - mean_at) * (rss - mean_rss) for at, rss in samples) / variance
+
+    def get_eta(self) -> float | None:
+        """Returns seconds before the limit is predicted to be hit.
+        None if memory usage is not growing.
+
+        """
+        rate = self.leak_rate
+
+        if rate <= 0:
+            return None
+
+        return max((self.limit * 1024 * 1024 - self.samples[-1][1]) / rate, 0.0)
+
+    def get_horizon(self, worker_id: int) -> float:
+        """Returns the horizon for the given worker, spread across workers with jitter.
+
+        :param worker_id:
+
+        """
+        # Golden ratio sequence spreads consecutive IDs evenly.
+        return self.horizon * (1 - self.jitter * ((worker_id * 0.6180339887) % 1))
+
+    def check(self) -> bool:
+        """Samples memory and recycles the current worker if required.
+        Returns True if the worker is being recycled.
+
+        """
+        self.sample()
+
+        worker_id = uwsgi.worker_id()
+
+        if self.metrics:
+            uwsgi.metric_set(MEMORY_METRIC.format(id=worker_id, kind='leak'), int(self.leak_rate * 3600))
+
+        if len(self.samples) < self.window:
+            return False
+
+        eta = self.get_eta()
+
+        if eta is None or eta > self.get_horizon(worker_id):
+            return False
+
+        return self.recycle()
+
+    def recycle(self) -> bool:
+        """Gracefully recycles the current worker.
+        Returns False if another worker has been recycled within the cooldown period.
+
+        """
+        worker_id = uwsgi.worker_id()
+
+        if self.cache and not Cache(self.cache).add(self.recycle_key, worker_id, timeout=self.cooldown):
+            return False
+
+        if self.metrics:
+            uwsgi.metric_inc(MEMORY_METRIC.format(id=worker_id, kind='recycled'))
+
+        self.samples.clear()
+
+        # Worker finishes the current request and exits, then master respawns it.
+        os.kill(os.getpid(), SIGHUP)
+
+        return True
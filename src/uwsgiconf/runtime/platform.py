@@ -1,4 +1,6 @@
+import gc
 from collections.abc import Callable
+from pathlib import Path
 from threading import local
 from typing import ClassVar
 
@@ -31,6 +33,49 @@ class _PostForkHooks:
 _uwsgi.post_fork_hook = _PostForkHooks.run
 
 
+def freeze_gc_on_fork():
+    """Disables garbage collection in master till fork.
+    Right after fork objects inherited from master are frozen (``gc.freeze()``)
+    and garbage collection is re-enabled, so that collections in workers
+    do not touch (hence copy) memory pages of those objects.
+
+    To be called in master before the application is loaded.
+    See ``PythonSection.configure_copy_on_write()``.
+
+    """
+    if _uwsgi.worker_id():
+        # Application is loaded by a worker (lazy mode). Nothing to share.
+        return
+
+    gc.disable()
+    _PostForkHooks.add()(_freeze_gc_forked)
+
+
+def _freeze_gc_forked():
+    gc.freeze()
+    gc.enable()
+
+
+def freeze_gc():
+    """Freezes all objects tracked by garbage collector (``gc.freeze()``)
+    and re-enables garbage collection after fork.
+
+    Can be called in master right before fork (e.g. at the end of WSGI module),
+    so that collections in workers do not touch (hence copy) memory pages
+    of objects inherited from master.
+
+    See ``freeze_gc_on_fork()``.
+
+    """
+    if _uwsgi.worker_id():
+        # Application is loaded by a worker (lazy mode). Nothing to share.
+        gc.enable()
+        return
+
+    gc.freeze()
+    _PostForkHooks.add()(gc.enable)
+
+
 class _Platform:
 
     request: type[_Request] = _Request
@@ -118,6 +163,60 @@ class _Platform:
         """Returns uWSGI clock microseconds."""
         return _uwsgi.micros()
 
+    def get_memory_details(self, pid: int = 0) -> dict[str, int]:
+        """Returns memory usage details (bytes) of a process read from ``/proc/<pid>/smaps_rollup``:
+
+            * ``rss`` - resident set size;
+            * ``pss`` - proportional set size (shared memory divided between sharing processes);
+            * ``uss`` - unique set size (private memory);
+            * ``shared`` - memory shared with other processes (e.g. by copy-on-write after fork);
+            * ``swap``.
+
+        Empty dict if details are unavailable (e.g. not Linux).
+
+        :param pid: Process ID. Default: current process.
+
+        """
+        try:
+            lines = Path(f'/proc/{pid or "self"}/smaps_rollup').read_text().splitlines()
+
+        except OSError:
+            return {}
+
+        values = {}
+
+        for line in lines[1:]:  # Skip header.
+            key, _, value = line.partition(':')
+            value = value.split()
+
+            if value and value[0].isdigit():
+                values[key] = int(value[0]) * 1024  # kB
+
+        get = values.get
+
+        return {
+            'rss': get('Rss', 0),
+            'pss': get('Pss', 0),
+            'uss': get('Private_Clean', 0) + get('Private_Dirty', 0),
+            'shared': get('Shared_Clean', 0) + get('Shared_Dirty', 0),
+            'swap': get('Swap', 0),
+        }
+
+    @property
+    def workers_memory(self) -> dict[int, dict[str, int]]:
+        """Returns memory usage details (see ``get_memory_details()``) indexed by worker ID.
+        Workers with details unavailable are omitted.
+
+        """
+        get_details = self.get_memory_details
+        result = {}
+
+        for worker in _uwsgi.workers():
+            if details := get_details(worker['pid']):
+                result[worker['id']] = details
+
+        return result
+
     def get_listen_queue(self, socket_num: int = 0) -> int:
         """Returns listen queue (backlog size) of the given socket.
 
@@ -0,0 +1,9 @@
+"""Makes preforking copy-on-write friendly (see ``platform.freeze_gc_on_fork()``).
+
+To be imported in master before the application is loaded:
+``PythonSection.configure_copy_on_write()`` does it with ``shared-python-import``.
+
+"""
+from .platform import freeze_gc_on_fork
+
+freeze_gc_on_fork()
@@ -0,0 +1,330 @@
+import sys
+from collections import Counter
+from collections.abc import Callable, Iterable
+from functools import wraps
+from itertools import count
+from os import getpid
+from pathlib import Path
+from tempfile import gettempdir
+from threading import Event, Lock, Thread, get_ident
+from time import monotonic, sleep
+from types import FrameType
+
+from .. import uwsgi
+from ..typehints import Strpath
+from .monitoring import register_file_monitor
+from .signals import TypeTarget
+from .task_utils import TaskChecker
+
+PROFILE_PREFIX = 'profile-'
+PROFILE_SUFFIX = '.collapsed'
+
+
+def get_stack(frame: FrameType | None) -> str:
+    """Returns a collapsed stack (root first, frames separated with semicolons)
+    for the given frame.
+
+    :param frame:
+
+    """
+    names = []
+
+    while frame is not None:
+        code = frame.f_code
+        names.append(f'{code.co_name} ({code.co_filename}:{code.co_firstlineno})')
+        frame = frame.f_back
+
+    return ';'.join(reversed(names))
+
+
+def read_profile(path: Strpath) -> Counter:
+    """Reads a collapsed stacks profile.
+
+    :param path:
+
+    """
+    stacks = Counter()
+
+    for line in Path(path).read_text().splitlines():
+        stack, _, count = line.rpartition(' ')
+
+        if stack and count.isdigit():
+            stacks[stack] += int(count)
+
+    return stacks
+
+
+def merge_profiles(paths: Iterable[Strpath]) -> Counter:
+    """Merges collapsed stacks profiles (e.g. from several workers).
+
+    :param paths:
+
+    """
+    stacks = Counter()
+
+    for path in paths:
+        stacks.update(read_profile(path))
+
+    return stacks
+
+
+def format_profile(stacks: Counter) -> str:
+    """Formats stacks into collapsed stacks profile
+    to be fed into flamegraph tools (e.g. flamegraph.pl, speedscope).
+
+    :param stacks:
+
+    """
+    return ''.join(f'{stack} {count}\n' for stack, count in stacks.most_common())
+
+
+class Profiler:
+    """Sampling profiler.
+
+    Once started samples Python stacks of all the threads of the current process
+    from a background thread at a fixed rate for a given time,
+    then writes collapsed stacks (flamegraph) file into the profiles directory.
+
+    No threads are run and no overhead is imposed when not profiling.
+    The only exception is ``.on_slow()``: its deadlines are checked by a single watcher thread
+    started on first use, so entering and leaving a monitored block does no thread work.
+
+    .. code-block:: python
+
+        profiler = Profiler()
+
+        # Profile every worker for N seconds written into the trigger file.
+        profiler.register('/run/myapp/uwsgi.profile')
+
+        # Profile the current worker if the block is still running after 5 seconds.
+        with profiler.on_slow(5):
+            do()
+
+    .. note:: uWSGI threads support is required (``.workers.set_thread_params(enable=True)``).
+
+    """
+    def __init__(self, *, dir: Strpath = None, interval: float = 0.01, duration: float = 10):
+        """
+        :param dir: Directory to write profiles into.
+            Default: trigger file directory (see ``.register()``) or temporary directory.
+
+        :param interval: Sampling interval (seconds).
+
+        :param duration: Default profiling duration (seconds).
+
+        """
+        self.dir = None if dir is None else Path(dir)
+        self.interval = interval
+        self.duration = duration
+        self._lock = Lock()
+        self._thread: Thread | None = None
+
+        # on_slow() registry: token -> (deadline, profiling duration).
+        self._slow: dict[int, tuple[float, float | None]] = {}
+        self._slow_tokens = count()
+        self._slow_wake = Event()
+        self._slow_wake_at = float('inf')
+        self._slow_watcher: Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether profiling is in progress."""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def start(self, duration: float | None = None) -> bool:
+        """Starts profiling in background. Returns False if already profiling.
+
+        :param duration: Profiling duration (seconds). Default: profiler default.
+
+        """
+        with self._lock:
+
+            if self.is_running:
+                return False
+
+            self._thread = thread = Thread(
+                target=self._run, args=(duration or self.duration,), name='uwsgiconf-profiler', daemon=True)
+            thread.start()
+
+        return True
+
+    def join(self):
+        """Waits for profiling to finish."""
+        thread = self._thread
+
+        if thread is not None:
+            thread.join()
+
+    def _run(self, duration: float):
+        self.write(self.sample(duration))
+
+    def sample(self, duration: float) -> Counter:
+        """Samples stacks of all the threads but the current one for the given time.
+
+        :param duration: Sampling duration (seconds).
+
+        """
+        stacks = Counter()
+        current_frames = sys._current_frames
+        own_id = get_ident()
+        interval = self.interval
+        now = monotonic()
+        deadline = now + duration
+
+        while now < deadline:
+
+            for thread_id, frame in current_frames().items():
+                if thread_id != own_id:
+                    stacks[get_stack(frame)] += 1
+
+            # Keep the rate fixed no matter how long sampling takes.
+            sleep(max(interval - (monotonic() - now), 0))
+            now = monotonic()
+
+        return stacks
+
+    def write(self, stacks: Counter) -> Path:
+        """Writes collapsed stacks into a profile file named after the worker.
+        Returns the file path.
+
+        :param stacks:
+
+        """
+        dir_profiles = self.dir or Path(gettempdir())
+        dir_profiles.mkdir(parents=True, exist_ok=True)
+
+        path = dir_profiles / f'{PROFILE_PREFIX}{uwsgi.worker_id()}-{getpid()}{PROFILE_SUFFIX}'
+        path.write_text(format_profile(stacks))
+
+        return path
+
+    def register(self, trigger: Strpath, *, target: TypeTarget = 'workers'):
+        """Registers a trigger file. Writing a number of seconds into the file
+        starts profiling for that time in every worker (or in other signal ``target``).
+
+        .. code-block:: shell
+
+            echo 30 > /run/myapp/uwsgi.profile
+
+        :param trigger: Trigger file path. The file is created if missing.
+
+        :param target: Signal target. See ``register_file_monitor()``.
+
+        """
+        trigger = Path(trigger)
+        trigger.touch(exist_ok=True)
+
+        if self.dir is None:
+            self.dir = trigger.parent
+
+        def profile():
+            try:
+                duration = float(trigger.read_text().strip() or 0)
+
+            except (OSError, ValueError):
+                duration = 0
+
+            self.start(duration or None)
+
+        register_file_monitor(f'{trigger}', target=target, checker=TaskChecker(maintenance=False))(profile)
+
+    def _slow_enter(self, after: float, duration: float | None) -> int:
+        deadline = monotonic() + after
+        token = next(self._slow_tokens)
+        self._slow[token] = (deadline, duration)
+
+        watcher = self._slow_watcher
+
+        if watcher is None or not watcher.is_alive():
+            self._slow_watch_start()
+
+        if deadline < self._slow_wake_at:
+            # The watcher sleeps past the new deadline.
+            self._slow_wake.set()
+
+        return token
+
+    def _slow_exit(self, token: int):
+        self._slow.pop(token, None)
+
+    def _slow_watch_start(self):
+        with self._lock:
+            watcher = self._slow_watcher
+
+            if watcher is None or not watcher.is_alive():
+                # Also restarts after fork, since threads do not survive it.
+                self._slow_watcher = watcher = Thread(
+                    target=self._slow_watch, name='uwsgiconf-profiler-watcher', daemon=True)
+                watcher.start()
+
+    def _slow_watch(self):
+        slow = self._slow
+        wake = self._slow_wake
+
+        while True:
+            wake.clear()
+            # Blocks registered while scanning wake us up again.
+            self._slow_wake_at = wake_at = float('inf')
+            now = monotonic()
+
+            for token, (deadline, duration) in list(slow.items()):
+
+                if deadline <= now:
+                    if slow.pop(token, None) is not None:
+                        self.start(duration)
+
+                elif deadline < wake_at:
+                    wake_at = deadline
+
+            self._slow_wake_at = wake_at
+            wake.wait(None if wake_at == float('inf') else max(wake_at - monotonic(), 0))
+
+    def on_slow(self, after: float, *, duration: float | None = None) -> 'ProfileOnSlow':
+        """Decorator and context manager. Starts profiling if a function
+        or a code block is still running after the given time.
+
+        Useful alongside with ``.control.harakiri_imposed`` to profile before timeouts.
+
+        :param after: Seconds to wait before profiling.
+
+        :param duration: Profiling duration (seconds). Default: profiler default.
+
+        """
+        return ProfileOnSlow(self, after=after, duration=duration)
+
+
+class ProfileOnSlow:
+    """Decorator and context manager starting profiling
+    if a function or a code block runs too long.
+
+    See ``Profiler.on_slow()``.
+
+    """
+    def __init__(self, profiler: Profiler, *, after: float, duration: float | None = None):
+        self._profiler = profiler
+        self._after = after
+        self._duration = duration
+        self._token: int | None = None
+
+    def __call__(self, func: Callable):
+        profiler = self._profiler
+        after = self._after
+        duration = self._duration
+
+        @wraps(func)
+        def wrapped(*args, **kwargs):
+            token = profiler._slow_enter(after, duration)
+            try:
+                return func(*args, **kwargs)
+
+            finally:
+                profiler._slow_exit(token)
+
+        return wrapped
+
+    def __enter__(self):
+        self._token = self._profiler._slow_enter(self._after, self._duration)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._profiler._slow_exit(self._token)
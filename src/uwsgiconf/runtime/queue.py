@@ -0,0 +1,191 @@
+from collections.abc import Callable, Iterable
+from time import monotonic, sleep
+
+from .. import uwsgi
+
+
+class Queue:
+    """Interface for uWSGI shared queue: a block-based array in shared memory
+    usable both as FIFO and as LIFO. Can be used as a work queue
+    between workers and mules of the same node without disk or network involved.
+
+    .. warning:: To use this helper one needs
+        to configure the queue in uWSGI config beforehand.
+
+        E.g.: ``section.queue.enable(100, block_size=4096)``
+
+    .. code-block:: python
+
+        queue = Queue()
+
+        # In a worker.
+        queue.push('{"task": "resize", "id": 10}')
+
+        # In a mule.
+        while True:
+            message = queue.pull(timeout=10)
+
+    .. note:: When the queue is full a push overwrites the oldest message.
+
+    * http://uwsgi.readthedocs.io/en/latest/Queue.html
+
+    """
+    __slots__ = ['poll_interval']
+
+    def __init__(self, *, poll_interval: float = 0.05):
+        """
+        :param poll_interval: Maximum interval (seconds) between queue checks
+            while waiting for a message (see ``timeout`` argument of ``pull()`` and ``pop()``).
+
+        """
+        self.poll_interval = poll_interval
+
+    @property
+    def size(self) -> int:
+        """Number of slots in the queue."""
+        return uwsgi.queue_size
+
+    @property
+    def slot(self) -> int:
+        """Slot to be pushed into next (LIFO position)."""
+        return uwsgi.queue_slot()
+
+    @property
+    def pull_slot(self) -> int:
+        """Slot to be pulled from next (FIFO position)."""
+        return uwsgi.queue_pull_slot()
+
+    def get(self, index: int) -> bytes | None:
+        """Returns a message from the given slot without removing it.
+
+        :param index: Slot number.
+
+        """
+        return uwsgi.queue_get(index)
+
+    __getitem__ = get
+
+    def set(self, index: int, message: str | bytes) -> bool:
+        """Puts a message into the given slot.
+
+        :param index: Slot number.
+
+        :param message:
+
+        """
+        if isinstance(message, str):
+            message = message.encode()
+
+        return uwsgi.queue_set(index, message)
+
+    __setitem__ = set
+
+    def get_last(self, count: int = 1) -> list[bytes]:
+        """Returns up to the given number of the last pushed messages (the newest first)
+        without removing them.
+
+        :param count:
+
+        """
+        return uwsgi.queue_last(count) or []
+
+    def push(self, message: str | bytes) -> bool:
+        """Pushes a message into the queue.
+        Returns False if a message is empty or doesn't fit a block.
+
+        :param message:
+
+        """
+        if isinstance(message, str):
+            message = message.encode()
+
+        return uwsgi.queue_push(message)
+
+    def push_many(self, messages: Iterable[str | bytes]) -> int:
+        """Pushes messages into the queue. Returns the number of messages pushed.
+        Stops on the first message failed to be pushed.
+
+        :param messages:
+
+        """
+        push = self.push
+        pushed = 0
+
+        for message in messages:
+            if not push(message):
+                break
+
+            pushed += 1
+
+        return pushed
+
+    def _wait(self, func: Callable[[], bytes | None], timeout: float) -> bytes | None:
+        message = func()
+
+        if message is not None or not timeout:
+            return message
+
+        # uWSGI queue has no notifications, so it is polled with increasing intervals.
+        deadline = monotonic() + timeout
+        interval = 0.001
+        interval_max = self.poll_interval
+
+        while message is None:
+            remaining = deadline - monotonic()
+
+            if remaining <= 0:
+                return None
+
+            sleep(min(interval, remaining))
+            interval = min(interval * 2, interval_max)
+            message = func()
+
+        return message
+
+    def pull(self, *, timeout: float = 0) -> bytes | None:
+        """Removes and returns the first pushed message (FIFO).
+        Returns None if the queue is empty.
+
+        :param timeout: Seconds to wait for a message if the queue is empty.
+
+            .. note:: Waiting blocks the current thread (or async core).
+
+        """
+        return self._wait(uwsgi.queue_pull, timeout)
+
+    def pull_many(self, count: int, *, timeout: float = 0) -> list[bytes]:
+        """Removes and returns up to the given number of the first pushed messages (FIFO).
+
+        :param count: Maximum number of messages.
+
+        :param timeout: Seconds to wait for the first message if the queue is empty.
+
+        """
+        message = self.pull(timeout=timeout)
+
+        if message is None:
+            return []
+
+        messages = [message]
+        pull = uwsgi.queue_pull
+
+        while len(messages) < count:
+            message = pull()
+
+            if message is None:
+                break
+
+            messages.append(message)
+
+        return messages
+
+    def pop(self, *, timeout: float = 0) -> bytes | None:
+        """Removes and returns the last pushed message (LIFO).
+        Returns None if the queue is empty.
+
+        :param timeout: Seconds to wait for a message if the queue is empty.
+
+            .. note:: Waiting blocks the current thread (or async core).
+
+        """
+        return self._wait(uwsgi.queue_pop, timeout)
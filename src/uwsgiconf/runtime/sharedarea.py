@@ -0,0 +1,239 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from struct import Struct
+
+from .. import uwsgi
+
+
+class SharedArea:
+    """Interface for uWSGI shared area: a raw memory region shared between all processes.
+
+    .. warning:: To use this helper one needs
+        to configure shared area(s) in uWSGI config beforehand.
+
+        E.g.: ``section.shared_area.add_area(pages=1)``
+
+    .. code-block:: python
+
+        area = SharedArea()
+
+        # Counters.
+        area.inc(0)
+        hits = area.get_int(0)
+
+        # Typed view (no copying, no serialization): 16 unsigned 64-bit numbers after the counter.
+        buckets = area.get_view('Q', offset=8, count=16)
+        buckets[3] += 1
+
+        # Records table.
+        flags = area.get_table('?I', offset=136, count=100)
+        with area.writing():
+            flags[5] = (True, 42)
+
+    .. note:: ``get_int()``, ``set_int()``, ``inc()``, ``dec()``, ``read()`` and ``write()``
+        are guarded by the area lock, while views and tables are not
+        (use ``reading()`` and ``writing()`` if required).
+
+    * http://uwsgi.readthedocs.io/en/latest/SharedArea.html
+
+    """
+    __slots__ = ['id']
+
+    def __init__(self, id: int = 0):
+        """
+        :param id: Area ID: number in order of definition, starting with 0.
+
+        """
+        self.id = id
+
+    @property
+    def memory(self) -> memoryview:
+        """Writable memoryview of the whole area (no copying)."""
+        return uwsgi.sharedarea_memoryview(self.id)
+
+    def read(self, pos: int = 0, length: int = 0) -> bytes:
+        """Reads bytes from the area.
+
+        :param pos: Position (offset) to read from.
+
+        :param length: Number of bytes to read. Default: up to the end of the area.
+
+        :raises ValueError: If the area or position is invalid.
+
+        """
+        return uwsgi.sharedarea_read(self.id, pos, length)
+
+    def write(self, pos: int, data: bytes):
+        """Writes bytes into the area.
+
+        :param pos: Position (offset) to write to.
+
+        :param data:
+
+        :raises ValueError: If the area or position is invalid.
+
+        """
+        return uwsgi.sharedarea_write(self.id, pos, data)
+
+    def get_int(self, pos: int, *, bits: int = 64) -> int:
+        """Reads signed integer.
+
+        :param pos: Position (offset).
+
+        :param bits: Integer size: 8, 16, 32 or 64.
+
+        :raises ValueError: If integer size is not supported.
+
+        """
+        return getattr(uwsgi, f'sharedarea_read{self._check_bits(bits)}')(self.id, pos)
+
+    def set_int(self, pos: int, value: int, *, bits: int = 64):
+        """Writes signed integer.
+
+        :param pos: Position (offset).
+
+        :param value:
+
+        :param bits: Integer size: 8, 16, 32 or 64.
+
+        :raises ValueError: If integer size is not supported.
+
+        """
+        return getattr(uwsgi, f'sharedarea_write{self._check_bits(bits)}')(self.id, pos, value)
+
+    def inc(self, pos: int, delta: int = 1, *, bits: int = 64):
+        """Atomically increments signed integer.
+
+        :param pos: Position (offset).
+
+        :param delta:
+
+        :param bits: Integer size: 32 or 64 (uWSGI has no atomic operations for smaller ones).
+
+        :raises ValueError: If integer size is not supported.
+
+        """
+        return getattr(uwsgi, f'sharedarea_inc{self._check_bits(bits, (32, 64))}')(self.id, pos, delta)
+
+    def dec(self, pos: int, delta: int = 1, *, bits: int = 64):
+        """Atomically decrements signed integer.
+
+        :param pos: Position (offset).
+
+        :param delta:
+
+        :param bits: Integer size: 32 or 64 (uWSGI has no atomic operations for smaller ones).
+
+        :raises ValueError: If integer size is not supported.
+
+        """
+        return getattr(uwsgi, f'sharedarea_dec{self._check_bits(bits, (32, 64))}')(self.id, pos, delta)
+
+    @staticmethod
+    def _check_bits(bits: int, supported: tuple[int, ...] = (8, 16, 32, 64)) -> int:
+        if bits not in supported:
+            raise ValueError(f"Unsupported integer size {bits}. Use one of: {', '.join(map(str, supported))}")
+
+        return bits
+
+    @contextmanager
+    def reading(self) -> Iterator['SharedArea']:
+        """Context manager holding the area read lock."""
+        uwsgi.sharedarea_rlock(self.id)
+
+        try:
+            yield self
+
+        finally:
+            uwsgi.sharedarea_unlock(self.id)
+
+    @contextmanager
+    def writing(self) -> Iterator['SharedArea']:
+        """Context manager holding the area write lock."""
+        uwsgi.sharedarea_wlock(self.id)
+
+        try:
+            yield self
+
+        finally:
+            uwsgi.sharedarea_unlock(self.id)
+
+    def get_view(self, fmt: str = 'Q', *, offset: int = 0, count: int | None = None) -> memoryview:
+        """Returns a typed memoryview (an array of numbers) on a part of the area (no copying).
+
+        :param fmt: Items format (native ``struct`` single item format), e.g. ``Q``, ``i``, ``d``.
+
+        :param offset: Offset (bytes) of the first item.
+
+        :param count: Number of items. Default: as many as fit into the area.
+
+        """
+        memory = self.memory[offset:]
+        size = Struct(fmt).size
+
+        if count is None:
+            count = len(memory) // size
+
+        return memory[:count * size].cast(fmt)
+
+    def get_table(self, fmt: str, *, offset: int = 0, count: int) -> 'SharedTable':
+        """Returns a table of fixed size records on a part of the area.
+
+        :param fmt: Record format (``struct`` format), e.g. ``?I`` for a flag and a number.
+
+        :param offset: Offset (bytes) of the first record.
+
+        :param count: Number of records.
+
+        """
+        return SharedTable(self.memory, fmt, offset=offset, count=count)
+
+
+class SharedTable:
+    """Table of fixed size records (``struct`` packed) in shared memory.
+    Records are accessed by index and represented by tuples.
+
+    """
+    __slots__ = ['count', 'memory', 'offset', 'struct']
+
+    def __init__(self, memory: memoryview, fmt: str, *, offset: int = 0, count: int):
+        """
+        :param memory: Memory to put records into.
+
+        :param fmt: Record format (``struct`` format).
+
+        :param offset: Offset (bytes) of the first record.
+
+        :param count: Number of records.
+
+        """
+        self.struct = Struct(fmt)
+        self.memory = memory
+        self.offset = offset
+        self.count = count
+
+        if offset + self.size > len(memory):
+            raise ValueError(f'Table of {self.size} bytes at {offset} does not fit {len(memory)} bytes')
+
+    @property
+    def size(self) -> int:
+        """Table size in bytes."""
+        return self.struct.size * self.count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _get_pos(self, index: int) -> int:
+        if not 0 <= index < self.count:
+            raise IndexError(f'Record index {index} is out of range')
+
+        return self.offset + index * self.struct.size
+
+    def __getitem__(self, index: int) -> tuple:
+        return self.struct.unpack_from(self.memory, self._get_pos(index))
+
+    def __setitem__(self, index: int, values: tuple):
+        self.struct.pack_into(self.memory, self._get_pos(index), *values)
+
+    def __iter__(self) -> Iterator[tuple]:
+        return self.struct.iter_unpack(self.memory[self.offset:self.offset + self.size])
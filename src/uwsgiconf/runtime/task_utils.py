@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, NamedTuple, Optional
 if TYPE_CHECKING:
     from uwsgiconf.runtime.locking import Lock
 
+from .. import uwsgi
 from ..settings import ENV_SKIP_TASK, get_maintenance_inplace, get_skip_task
 
 
@@ -23,17 +24,20 @@ class TaskContext:
             *,
             params: dict | None = None,
             last_result: dict | None = None,
-            obj: Any = None
+            obj: Any = None,
+            token: int | None = None,
     ):
         """
         :param params: Task parameters.
         :param last_result: Task result from the last (previous) run.
         :param obj: Raw task object (if provided by a backend).
+        :param token: Fencing token (if provided by a backend). Increases with every task acquirement.
         """
         self.params = params or {}
         self.result = None
         self.last_result = last_result or {}
         self.obj = obj
+        self.token = token
 
 
 class BackendBase:
@@ -91,6 +95,34 @@ class DummyBackend(BackendBase):
     """Dummy task backend. Does nothing."""
 
 
+class LegionBackend(BackendBase):
+    """Allows running task function (e.g. uWSGI cron, timer) exclusively
+    on the lord node of a uWSGI Legion. Other nodes skip the task.
+
+    Unlike database or cache backed locks lordship is checked in uWSGI memory,
+    so there are no round trips on every run.
+
+    """
+    def __init__(self, *, legion: str, strict: bool = True, context: type[TaskContext] | None = None):
+        """
+        :param legion: Legion name.
+
+        :param strict: If False, exceptions related to task acquirement
+            are silenced, effectively allowing task run without a lock.
+
+        :param context: Task context class. If not set, default TaskContext is used.
+
+        """
+        super().__init__(strict=strict, context=context)
+        self._legion = legion
+
+    def _acquire(self, name: str) -> TaskContext | None:
+        if not uwsgi.i_am_the_lord(self._legion):
+            return None
+
+        return super()._acquire(name)
+
+
 class TaskChecker:
     """Facilitates task execution requirements checking."""
 
@@ -100,6 +132,7 @@ class TaskChecker:
             env: str | bool = True,
             maintenance: bool = True,
             lock: Optional['Lock'] = None,
+            legion: str = '',
             checkers: Iterable[Callable[[str], bool]] | None = None,
     ):
         """
@@ -117,6 +150,9 @@ class TaskChecker:
             when new background tasks are marked not to run from a worker process (e.g. by an API request),
             and then the app is stopped itself.
 
+        :param legion: uWSGI Legion name. If set, the task execution will be skipped
+            on nodes other than the legion lord.
+
         :param checkers: Custom checking functions. Require to accept task name argument and
             return True to skip task execution.
 
@@ -136,6 +172,9 @@ class TaskChecker:
         if lock:
             checkers_.append(lambda task_name: lock.is_set)
 
+        if legion:
+            checkers_.append(lambda task_name: not uwsgi.i_am_the_lord(legion))
+
         checkers_.extend(checkers or [])
 
         self.checkers = checkers_
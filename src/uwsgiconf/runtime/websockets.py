@@ -1,5 +1,10 @@
+import os
+from collections import deque
+from collections.abc import Callable
 
 from .. import uwsgi
+from .locking import Lock
+from .signals import Signal
 
 handshake = uwsgi.websocket_handshake
 
@@ -30,3 +35,314 @@ def send(*, message: str | bytes, request_context=None):
 
     """
     return uwsgi.websocket_send(message) if isinstance(message, str) else uwsgi.websocket_send_binary(message)
+
+
+class Broadcast:
+    """Broadcast channel delivering messages to websocket connections of all workers.
+
+    Messages are published into a ring of items in uWSGI cache
+    and workers are woken up with a uWSGI signal. Every worker reads new messages
+    from the ring once and fans them out to its connections.
+
+    .. code-block:: python
+
+        # Module loaded by the master (no `lazy-apps`), so that all workers see the signal handler.
+        broadcast = Broadcast('news', cache='broadcast').register()
+
+        def application(environ, start_response):
+
+            if environ['PATH_INFO'] == '/ws/':
+                broadcast.serve()
+                return []
+
+            broadcast.publish('something happened')
+            ...
+
+    .. warning:: The cache is to be configured beforehand, e.g.:
+
+        ``section.caching.add_cache('broadcast', max_items=1001, block_size=4096)``
+
+        where ``max_items`` is at least ``size + 1`` and ``block_size``
+        fits the largest message.
+
+    .. note:: ``serve()`` relies on uWSGI async mode (see ``.workers.set_async_params()``)
+        to handle thousands of connections per worker.
+
+    """
+    def __init__(
+            self,
+            name: str = 'broadcast',
+            *,
+            cache: str = 'broadcast',
+            size: int = 1000,
+            backlog: int = 1000,
+            signal: int | None = None,
+            lock: int = 0,
+    ):
+        """
+        :param name: Channel name. Used as a prefix for cache keys.
+
+        :param cache: Cache name to keep messages ring in.
+
+        :param size: Number of messages in the ring.
+            Workers lagging behind for more than that lose oldest messages.
+
+        :param backlog: Maximum number of messages queued for a connection.
+            Oldest messages are dropped for slow clients.
+
+        :param signal: uWSGI signal number to wake workers up with.
+            If not set it will be chosen automatically.
+
+        :param lock: uWSGI lock number to guard publishing with.
+
+        """
+        self.name = name
+        self.cache = cache
+        self.size = size
+        self.backlog = backlog
+        self.signal = Signal(signal)
+        self.lock = Lock(lock)
+
+        self.key_seq = f'{name}.seq'
+        self.subscribers: set[BroadcastSubscriber] = set()
+        """Worker local connections subscribed to the channel."""
+
+        self._cursor: int | None = None
+
+    def register(self) -> 'Broadcast':
+        """Registers a signal handler to run on all workers."""
+        self.signal.register_handler(target='workers')(self._on_signal)
+        return self
+
+    def _on_signal(self, signum: int):
+        self.dispatch()
+
+    def get_last(self) -> int:
+        """Returns the number of the last message published."""
+        return uwsgi.cache_num(self.key_seq, self.cache) or 0
+
+    def publish(self, *messages: str | bytes, notify: bool = True) -> int:
+        """Publishes messages into the channel. Returns the number of the last message.
+
+        .. note:: Publishing many messages at once costs one lock and one signal.
+
+        :param messages:
+
+        :param notify: Wake workers up. If ``False`` messages will be delivered
+            along with the next notifying publish.
+
+        """
+        cache = self.cache
+        name = self.name
+        size = self.size
+        cache_update = uwsgi.cache_update
+
+        with self.lock:
+            seq = self.get_last()
+
+            for message in messages:
+                seq += 1
+
+                if isinstance(message, str):
+                    value = b'%dt:%s' % (seq, message.encode())
+
+                else:
+                    value = b'%db:%s' % (seq, message)
+
+                cache_update(f'{name}.{seq % size}', value, 0, cache)
+
+            uwsgi.cache_inc(self.key_seq, len(messages), 0, cache)
+
+        if notify:
+            self.signal.send()
+
+        return seq
+
+    def read(self, since: int) -> tuple[int, list[str | bytes]]:
+        """Reads messages published after the given one.
+        Returns a tuple with the number of the last message read and messages.
+
+        :param since: Message number.
+
+        """
+        last = self.get_last()
+        since = max(since, last - self.size)
+
+        cache = self.cache
+        name = self.name
+        size = self.size
+        cache_get = uwsgi.cache_get
+        messages = []
+
+        for seq in range(since + 1, last + 1):
+            value = cache_get(f'{name}.{seq % size}', cache)
+
+            if value is None:
+                break
+
+            head, _, payload = value.partition(b':')
+
+            if int(head[:-1]) != seq:
+                # Not written yet or already overwritten by a newer one.
+                break
+
+            messages.append(payload.decode() if head[-1:] == b't' else payload)
+            since = seq
+
+        return since, messages
+
+    def dispatch(self) -> int:
+        """Reads new messages and queues them for this worker connections.
+        Returns the number of messages read.
+
+        Called on a signal from ``publish()``.
+
+        """
+        subscribers = self.subscribers
+
+        if not subscribers:
+            # Nobody listens. Nothing to read.
+            self._cursor = None
+            return 0
+
+        cursor = self._cursor
+
+        if cursor is None:
+            cursor = self.get_last()
+
+        self._cursor, messages = self.read(cursor)
+
+        if messages:
+            for subscriber in subscribers:
+                subscriber.push(messages)
+
+        return len(messages)
+
+    def subscribe(self) -> 'BroadcastSubscriber':
+        """Subscribes a connection to the channel."""
+        if self._cursor is None:
+            self._cursor = self.get_last()
+
+        subscriber = BroadcastSubscriber(self, backlog=self.backlog)
+        self.subscribers.add(subscriber)
+
+        return subscriber
+
+    def serve(self, *, on_message: Callable[[bytes], None] | None = None, timeout: int = 30):
+        """Handles websocket connection for the current request:
+        sends channel messages to the client and passes client messages to ``on_message``.
+
+        Returns when the connection is closed.
+
+        :param on_message: Function to handle messages from the client.
+
+        :param timeout: Seconds to wait for data before a keepalive check.
+
+        """
+        handshake()
+
+        subscriber = self.subscribe()
+        fd_conn = uwsgi.connection_fd()
+        fd_sub = subscriber.fd
+
+        try:
+            while True:
+                uwsgi.wait_fd_read(fd_conn, timeout)
+                uwsgi.wait_fd_read(fd_sub)
+                uwsgi.suspend()
+
+                if uwsgi.ready_fd() == fd_sub:
+                    # All messages queued since the last wakeup are sent in one pass.
+                    for message in subscriber.drain():
+                        send(message=message)
+
+                    continue
+
+                # Also handles pings on timeouts.
+                message = recv(non_blocking=True)
+
+                if message and on_message:
+                    on_message(message)
+
+        except OSError:
+            # Connection closed.
+            pass
+
+        finally:
+            subscriber.close()
+
+
+class BroadcastSubscriber:
+    """Connection subscribed to a broadcast channel.
+
+    Keeps a queue of messages to be sent and a file descriptor
+    readable when there are any (to be waited with ``uwsgi.wait_fd_read``).
+
+    """
+    __slots__ = ['_fd_write', 'channel', 'dropped', 'fd', 'pending']
+
+    def __init__(self, channel: Broadcast, *, backlog: int = 1000):
+        """
+        :param channel:
+
+        :param backlog: Maximum number of messages in the queue.
+
+        """
+        self.channel = channel
+        self.pending: deque[str | bytes] = deque(maxlen=backlog)
+        self.dropped = 0
+        """Number of messages dropped since the queue was full."""
+
+        if hasattr(os, 'eventfd'):
+            self.fd = self._fd_write = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+
+        else:
+            self.fd, self._fd_write = os.pipe()
+            os.set_blocking(self.fd, False)
+            os.set_blocking(self._fd_write, False)
+
+    def push(self, messages: list[str | bytes]):
+        """Queues messages to be sent.
+
+        :param messages:
+
+        """
+        pending = self.pending
+        notify = not pending
+        overflow = len(pending) + len(messages) - pending.maxlen
+
+        if overflow > 0:
+            self.dropped += overflow
+
+        pending.extend(messages)
+
+        if notify:
+            # Already notified if there were pending messages.
+            try:
+                os.write(self._fd_write, b'\x01\0\0\0\0\0\0\0')
+
+            except BlockingIOError:
+                pass
+
+    def drain(self) -> list[str | bytes]:
+        """Returns queued messages clearing the queue."""
+        try:
+            os.read(self.fd, 8)
+
+        except BlockingIOError:
+            pass
+
+        pending = self.pending
+        messages = list(pending)
+        pending.clear()
+
+        return messages
+
+    def close(self):
+        """Unsubscribes from the channel."""
+        self.channel.subscribers.discard(self)
+
+        os.close(self.fd)
+
+        if self._fd_write != self.fd:
+            os.close(self._fd_write)
@@ -3,11 +3,29 @@ from os import environ
 CONFIGS_MODULE_ATTR = 'uwsgi_configuration'
 
 ENV_CONF_ALIAS = 'UWSGICONF_CONF_ALIAS'
+ENV_CONF_CACHE_DIR = 'UWSGICONF_CONF_CACHE_DIR'
+ENV_CONF_CACHE_ENV = 'UWSGICONF_CONF_CACHE_ENV'
 ENV_CONF_READY = 'UWSGICONF_READY'
 ENV_FORCE_STUB = 'UWSGICONF_FORCE_STUB'
 ENV_MAINTENANCE = 'UWSGICONF_MAINTENANCE'
 ENV_SKIP_TASK = 'UWSGICONF_SKIP_TASK_{task_name}'
 ENV_MAINTENANCE_INPLACE = 'UWSGICONF_MAINTENANCE_INPLACE'
+ENV_PROFILE = 'UWSGICONF_PROFILE'
+ENV_LOG_ENCODED = 'UWSGICONF_LOG_ENCODED'
+
+LOG_SAMPLE_METRIC = 'log_sample_rate'
+"""Metric holding requests log sample rate."""
+
+LOG_SAMPLE_VAR = 'UWSGICONF_LOG_SAMPLE'
+"""Request variable holding sample rate a request was logged with."""
+
+LOCK_METRIC = 'lock.{num}.{kind}'
+"""Lock contention metrics name template. Kinds: ``acquired``, ``wait`` and ``hold`` (microseconds)."""
+
+LOCK_METRIC_KINDS = ('acquired', 'wait', 'hold')
+
+MEMORY_METRIC = 'memwatch.{id}.{kind}'
+"""Memory watchdog metrics name template. Kinds: ``leak`` (bytes per hour) and ``recycled``."""
 
 
 FORCE_STUB = int(environ.get(ENV_FORCE_STUB, 0))
@@ -30,6 +48,23 @@ def get_maintenance_inplace() -> bool:
     return environ.get(ENV_MAINTENANCE_INPLACE, "0") != "0"
 
 
+def get_profile_path() -> str:
+    """Return the profiler trigger filepath.
+    Introduced as a function to support embedded mode.
+
+    """
+    return environ.get(ENV_PROFILE) or ''
+
+
+def get_log_encoded() -> bool:
+    """Return the flag indicating that uWSGI log lines are json-encoded
+    (see ``presets.nice.Section.configure_logging_json()``).
+    Introduced as a function to support embedded mode.
+
+    """
+    return environ.get(ENV_LOG_ENCODED, "0") != "0"
+
+
 def get_skip_task(task_name: str, *, env_var: str = ENV_SKIP_TASK) -> bool:
     """Returns a flag from env indicating whether a task should be skipped.
 
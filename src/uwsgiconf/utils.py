@@ -1,16 +1,14 @@
-import logging
 import os
 import sys
 from contextlib import contextmanager
-from importlib import import_module
-from inspect import currentframe
 from io import StringIO
 from pathlib import Path
 from subprocess import PIPE, STDOUT, Popen
+from time import perf_counter
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, NamedTuple
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
 
-from .exceptions import UwsgiconfException
+from .exceptions import ConfigurationError, UwsgiconfException
 from .settings import CONFIGS_MODULE_ATTR
 from .typehints import Strlist, Strpath
 
@@ -20,6 +18,8 @@ if TYPE_CHECKING:
 
 def run_uwsgi():
     """Allows running uwsgi right from uwsgiconf.py in if __name__ == '__main_'."""
+    from inspect import currentframe  # noqa: PLC0415
+
     caller = currentframe().f_back
     filepath = caller.f_locals['__file__']
     ConfModule(filepath).spawn_uwsgi()
@@ -32,6 +32,8 @@ class EmbeddedPlugins(NamedTuple):
 
 def get_logger(name: str):
     # Here to mitigate module name clashing.
+    import logging  # noqa: PLC0415
+
     return logging.getLogger(name)
 
 
@@ -105,7 +107,7 @@ class ConfModule:
         self.fpath: Path = fpath
         self._confs = None
 
-    def spawn_uwsgi(self, *, only: str | None = None) -> list[tuple[str, int]]:
+    def spawn_uwsgi(self, *, only: str | None = None, cached: bool = False) -> list[tuple[str, int]]:
         """Spawns uWSGI process(es) which will use configuration(s) from the module.
 
         Returns list of tuples:
@@ -117,6 +119,8 @@ class ConfModule:
         :param only: Configuration alias to run from the module.
             If not set uWSGI will be spawned for every configuration found in the module.
 
+        :param cached: Use compiled configuration cache on uWSGI (re)starts. See ``confcache``.
+
         """
         spawned = []
         configs = self.configurations
@@ -124,7 +128,7 @@ class ConfModule:
         if len(configs) == 1:
 
             alias = configs[0].alias
-            UwsgiRunner().spawn(configs[0], replace=True, filepath=self.fpath)
+            UwsgiRunner().spawn(configs[0], replace=True, filepath=self.fpath, cached=cached)
             spawned.append((alias, os.getpid()))
 
         else:
@@ -132,11 +136,88 @@ class ConfModule:
                 alias = config.alias
 
                 if only is None or alias == only:
-                    pid = UwsgiRunner().spawn(config, filepath=self.fpath)
+                    pid = UwsgiRunner().spawn(config, filepath=self.fpath, cached=cached)
                     spawned.append((alias, pid))
 
         return spawned
 
+    def compile(self, target_dir: Strpath | None = None) -> tuple[list[Path], list[Path]]:
+        """Compiles configurations from the module into .ini files.
+
+        Returns a tuple with lists of written and unchanged files.
+
+        Files are named after ``get_basename()`` if the module contains
+        just one configuration, and after the base name and configuration alias
+        (``uwsgicfg.py`` -> ``uwsgicfg_myalias.ini``) otherwise.
+
+        .. note:: Stamps are not added to configurations, so that the files
+            are only rewritten if configuration really changes.
+
+        :param target_dir: Directory to put files into. Defaults to module directory.
+
+        """
+        stem = self.get_basename(target_dir)
+        target_dir = Path(target_dir or self.fpath.parent)
+        configs = self.configurations
+
+        written = []
+        unchanged = []
+
+        for config in configs:
+            name = stem if len(configs) == 1 else f'{stem}_{config.alias}'
+            fpath = target_dir / f'{name}.ini'
+
+            if write_if_changed(fpath, config.format(stamp=False)):
+                written.append(fpath)
+
+            else:
+                unchanged.append(fpath)
+
+        return written, unchanged
+
+    def get_basename(self, target_dir: Strpath | None = None) -> str:
+        """Returns a base name (no alias and extension) for files compiled from the module.
+
+        Files put into the module directory are named after the module (``uwsgicfg.py`` -> ``uwsgicfg``).
+        Files put into a target directory are named after the module directory
+        (``apps/one/uwsgicfg.py`` -> ``one``, ``apps/one/other.py`` -> ``one_other``),
+        so that modules from different directories don't overwrite each other.
+
+        :param target_dir: Directory to put files into. Defaults to module directory.
+
+        """
+        fpath = self.fpath
+        stem = fpath.stem
+
+        if target_dir is None or Path(target_dir).absolute() == fpath.parent:
+            return stem
+
+        dirname = fpath.parent.name
+
+        return dirname if fpath.name == self.default_name else f'{dirname}_{stem}'
+
+    @classmethod
+    def find(cls, path: Strpath) -> list['ConfModule']:
+        """Returns configuration modules found using the given
+        directory or glob pattern (e.g. ``vassals/*/uwsgicfg.py``).
+
+        :param path: Directory or glob pattern.
+
+        """
+        path = Path(path)
+
+        if path.is_dir():
+            fpaths = path.glob('*.py')
+
+        elif path.is_file():
+            fpaths = [path]
+
+        else:
+            anchor = Path(path.anchor or '.')
+            fpaths = anchor.glob(f'{path.relative_to(anchor)}')
+
+        return [cls(fpath) for fpath in sorted(fpaths) if fpath.name != '__init__.py']
+
     @property
     def configurations(self) -> list['Configuration']:
         """Configurations from uwsgiconf module."""
@@ -160,11 +241,25 @@ class ConfModule:
         :param fpath:
 
         """
-        module_name = fpath.stem
+        from importlib.util import module_from_spec, spec_from_file_location  # noqa: PLC0415
+        from zlib import crc32  # noqa: PLC0415
+
+        # Module is loaded afresh under a name unique for its path, so that same named modules
+        # from different directories (e.g. vassals/*/uwsgicfg.py) are not mixed up
+        # and modules already imported (e.g. `settings`) are not shadowed.
+        module_name = f'_uwsgiconf_{crc32(f"{fpath}".encode()):08x}_{fpath.stem}'
+
+        spec = spec_from_file_location(module_name, fpath)
+        module = module_from_spec(spec)
+        sys.modules[module_name] = module
 
         sys.path.insert(0, f"{fpath.parent}")
         try:
-            module = import_module(module_name)
+            spec.loader.exec_module(module)
+
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
 
         finally:
             sys.path = sys.path[1:]
@@ -172,6 +267,404 @@ class ConfModule:
         return module
 
 
+class CompileResult(NamedTuple):
+    module: Path
+    written: list[Path]
+    unchanged: list[Path]
+    duration: float
+    error: str = ''
+
+
+def compile_module(module: ConfModule, *, target_dir: Strpath | None = None) -> CompileResult:
+    """Compiles configurations from the given module into .ini files.
+    Errors are not raised but reported in result.
+
+    :param module:
+
+    :param target_dir: Directory to put files into. Defaults to module directory.
+
+    """
+    written, unchanged, error = [], [], ''
+    started = perf_counter()
+
+    try:
+        written, unchanged = module.compile(target_dir)
+
+    except Exception as e:  # noqa: BLE001
+        error = f'{e.__class__.__name__}: {e}'
+
+    return CompileResult(
+        module=module.fpath,
+        written=written,
+        unchanged=unchanged,
+        duration=perf_counter() - started,
+        error=error,
+    )
+
+
+def compile_modules(
+        modules: list[ConfModule],
+        *,
+        target_dir: Strpath | None = None,
+        jobs: int | None = None
+) -> list[CompileResult]:
+    """Compiles configurations from the given modules into .ini files
+    using a pool of processes. Returns results in the order of modules.
+
+    A failure to compile one module doesn't affect others.
+    Files are written atomically and only if their contents changed,
+    so that Emperor won't reload vassals that stayed the same.
+
+    Modules which would write into the same files (see ``ConfModule.get_basename()``)
+    are not compiled and reported as failed.
+
+    :param modules:
+
+    :param target_dir: Directory to put files into. Defaults to module directory.
+
+    :param jobs: Number of processes to use. Defaults to CPU count.
+        If ``1`` compilation is done in current process.
+
+    """
+    def fail(module: ConfModule, error: str) -> CompileResult:
+        return CompileResult(module=module.fpath, written=[], unchanged=[], duration=0, error=error)
+
+    targets = {}
+
+    for module in modules:
+        target = Path(target_dir or module.fpath.parent).absolute() / module.get_basename(target_dir)
+        targets.setdefault(target, []).append(module)
+
+    results = {}
+
+    for target, clashing in targets.items():
+        if len(clashing) > 1:
+            for module in clashing:
+                results[module.fpath] = fail(module, f'Target {target}.ini clashes with {len(clashing) - 1} module(s)')
+
+    pending = [module for module in modules if module.fpath not in results]
+
+    if jobs == 1 or len(pending) < 2:
+        for module in pending:
+            results[module.fpath] = compile_module(module, target_dir=target_dir)
+
+    else:
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(compile_module, module, target_dir=target_dir) for module in pending]
+
+            for module, future in zip(pending, futures, strict=True):
+                if e := future.exception():
+                    # E.g. worker process died.
+                    results[module.fpath] = fail(module, f'{e.__class__.__name__}: {e}')
+
+                else:
+                    results[module.fpath] = future.result()
+
+    return [results[module.fpath] for module in modules]
+
+
+def write_if_changed(fpath: Strpath, content: str | bytes, *, mtime: float | None = None) -> bool:
+    """Atomically writes the given contents into a file
+    unless the file already has the same contents.
+
+    Returns ``True`` if the file was written.
+
+    :param fpath:
+    :param content:
+
+    :param mtime: Modification time (timestamp) to set for the written file.
+
+    """
+    fpath = Path(fpath)
+
+    try:
+        if (fpath.read_bytes() if isinstance(content, bytes) else fpath.read_text()) == content:
+            return False
+
+    except OSError:
+        pass
+
+    write_atomic(fpath, content, mtime=mtime)
+
+    return True
+
+
+def write_atomic(fpath: Strpath, content: str | bytes, *, mtime: float | None = None):
+    """Atomically writes the given contents into a file
+    (through renaming a temporary file).
+
+    :param fpath:
+    :param content:
+
+    :param mtime: Modification time (timestamp) to set for the written file.
+
+    """
+    fpath = Path(fpath)
+    binary = isinstance(content, bytes)
+
+    # Temporary file name doesn't end with .ini to prevent Emperor from picking it up.
+    fpath_tmp = fpath.with_name(f'.{fpath.name}.{os.getpid()}.tmp')
+
+    try:
+        if binary:
+            fpath_tmp.write_bytes(content)
+        else:
+            fpath_tmp.write_text(content)
+
+        if mtime is not None:
+            os.utime(fpath_tmp, (mtime, mtime))
+
+        fpath_tmp.replace(fpath)
+
+    finally:
+        fpath_tmp.unlink(missing_ok=True)
+
+
+PRECOMPRESS_EXTENSIONS = {
+    '.css', '.js', '.mjs', '.map', '.json', '.html', '.htm', '.txt', '.xml', '.svg', '.ico',
+    '.eot', '.otf', '.ttf', '.wasm',
+}
+"""Extensions of files worth compressing."""
+
+PRECOMPRESS_MANIFEST = '.uwsgiconf-precompress.json'
+"""Name of a file (in a static directory or a cache directory) with hashes of precompressed files."""
+
+
+class PrecompressResult(NamedTuple):
+
+    written: list[Path]
+    """Compressed files written."""
+
+    unchanged: int
+    """Number of source files unchanged since the previous run."""
+
+    removed: list[Path]
+    """Stale compressed files removed."""
+
+
+def precompress_file(
+        fpath: Path,
+        *,
+        brotli: bool = False,
+        digest: str = '',
+        cache_dir: Path | None = None,
+) -> tuple[str, list[Path]]:
+    """Writes compressed versions (``.gz`` and optionally ``.br``) of the given file.
+    Returns a tuple (source file digest, compressed files written).
+
+    Compressed versions not smaller than the source are not written (stale ones are removed).
+
+    :param fpath:
+
+    :param brotli: Also write Brotli compressed version. Requires ``brotli`` package.
+
+    :param digest: Source file digest from the previous run. If the same nothing is written
+        (unless ``cache_dir`` is set).
+
+    :param cache_dir: Directory to keep compressed contents in (by source file hash).
+        Compressed versions missing (e.g. removed with the source directory clearing)
+        are restored from there instead of compressing again.
+
+    """
+    import gzip  # noqa: PLC0415
+    import hashlib  # noqa: PLC0415
+
+    data = fpath.read_bytes()
+    suffixes = {'.gz': lambda: gzip.compress(data, compresslevel=9, mtime=0)}
+
+    if brotli:
+        try:
+            import brotli as brotli_  # noqa: PLC0415
+
+        except ImportError:
+            raise ConfigurationError('Brotli compression requires `brotli` package to be installed.') from None
+
+        suffixes['.br'] = lambda: brotli_.compress(data)
+
+    data_hash = hashlib.sha256(data).hexdigest()
+
+    # Compression settings are a part of the digest.
+    digest_new = f"{data_hash}|{','.join(suffixes)}"
+
+    if digest == digest_new and cache_dir is None:
+        return digest_new, []
+
+    written = []
+    mtime = fpath.stat().st_mtime
+
+    for suffix, compress in suffixes.items():
+        fpath_compressed = fpath.with_name(f'{fpath.name}{suffix}')
+
+        if cache_dir is None:
+            compressed = compress()
+
+        else:
+            fpath_cached = cache_dir / f'{data_hash}{suffix}'
+
+            try:
+                compressed = fpath_cached.read_bytes()
+
+            except OSError:
+                compressed = compress()
+                write_atomic(fpath_cached, compressed)
+
+        if len(compressed) >= len(data):
+            fpath_compressed.unlink(missing_ok=True)
+            continue
+
+        # The same modification time for clients to get the same Last-Modified.
+        if write_if_changed(fpath_compressed, compressed, mtime=mtime):
+            written.append(fpath_compressed)
+
+    return digest_new, written
+
+
+def _read_precompress_manifest(fpath: Path) -> dict[str, str]:
+    import json  # noqa: PLC0415
+
+    try:
+        return json.loads(fpath.read_text())
+
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_precompressible(fpath: Path, extensions: set[str], min_size: int) -> bool:
+    return (
+        fpath.name != PRECOMPRESS_MANIFEST and
+        fpath.suffix.lower() in extensions and
+        fpath.stat().st_size >= min_size
+    )
+
+
+def _find_precompressible(path: Path, extensions: set[str], min_size: int) -> list[Path]:
+    # Walks the directory recursively collecting files worth compressing.
+    found = []
+
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            fpath = Path(dirpath, filename)
+
+            if _is_precompressible(fpath, extensions, min_size):
+                found.append(fpath)
+
+    return found
+
+
+def precompress_statics(
+        dirs: Strlist,
+        *,
+        brotli: bool = False,
+        extensions: set[str] | None = None,
+        min_size: int = 256,
+        jobs: int | None = None,
+        cache_dir: Strpath | None = None,
+) -> PrecompressResult:
+    """Writes compressed versions of static files for uWSGI to serve them
+    instead of compressing on the fly. See ``Statics.set_gzip_params()``.
+
+    Only files changed (by content hash) since the previous run are compressed.
+    Hashes are kept in a manifest file in every directory (or in ``cache_dir``).
+
+    :param dirs: Static files directories.
+
+    :param brotli: Also write Brotli (``.br``) compressed versions.
+
+        .. note:: uWSGI itself serves only gzipped versions,
+            Brotli ones could be served by a web server in front of it.
+
+    :param extensions: Extensions of files to compress. Default: ``PRECOMPRESS_EXTENSIONS``.
+
+    :param min_size: Minimum size (bytes) of a file to compress.
+
+    :param jobs: Number of threads to compress with. Defaults to CPU count.
+
+    :param cache_dir: Directory outside of static directories to keep manifests
+        and compressed contents in. Allows static directories to be cleared
+        between runs (e.g. ``collectstatic --clear``) without compressing all the files again.
+
+    """
+    import json  # noqa: PLC0415
+    from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+    from zlib import crc32  # noqa: PLC0415
+
+    extensions = extensions or PRECOMPRESS_EXTENSIONS
+    written, removed, unchanged = [], [], 0
+
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # Compression (zlib) and file system calls release GIL so threads are enough.
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+
+        for dir_ in listify(dirs):
+            dir_ = Path(dir_)
+
+            if cache_dir is None:
+                fpath_manifest = dir_ / PRECOMPRESS_MANIFEST
+
+            else:
+                fpath_manifest = cache_dir / f'{crc32(f"{dir_.absolute()}".encode()):08x}{PRECOMPRESS_MANIFEST}'
+
+            manifest = _read_precompress_manifest(fpath_manifest)
+
+            fpaths, scans = [], []
+
+            if dir_.is_dir():
+                # Top level subdirectories are walked in parallel.
+                for entry in os.scandir(dir_):
+                    if entry.is_dir():
+                        scans.append(executor.submit(_find_precompressible, Path(entry.path), extensions, min_size))
+
+                    elif entry.is_file() and _is_precompressible(fpath := Path(entry.path), extensions, min_size):
+                        fpaths.append(fpath)
+
+            for scan in scans:
+                fpaths.extend(scan.result())
+
+            futures = {}
+
+            for fpath in fpaths:
+                name = fpath.relative_to(dir_).as_posix()
+                futures[name] = executor.submit(
+                    precompress_file, fpath, brotli=brotli, digest=manifest.get(name, ''), cache_dir=cache_dir)
+
+            manifest_new = {}
+
+            for name, future in futures.items():
+                manifest_new[name], written_file = future.result()
+                written.extend(written_file)
+                unchanged += manifest_new[name] == manifest.get(name)
+
+            for name in manifest.keys() - manifest_new.keys():
+                # Source file is gone.
+                for suffix in ('.gz', '.br'):
+                    fpath_compressed = dir_ / f'{name}{suffix}'
+
+                    if fpath_compressed.exists():
+                        fpath_compressed.unlink()
+                        removed.append(fpath_compressed)
+
+            if manifest_new != manifest and dir_.exists():
+                write_if_changed(fpath_manifest, json.dumps(manifest_new, indent=0, sort_keys=True))
+
+    if cache_dir is not None:
+        # Drop compressed contents no manifest refers to.
+        hashes = set()
+
+        for fpath_manifest in cache_dir.glob(f'*{PRECOMPRESS_MANIFEST}'):
+            hashes.update(digest.partition('|')[0] for digest in _read_precompress_manifest(fpath_manifest).values())
+
+        for fpath_cached in cache_dir.iterdir():
+            if fpath_cached.suffix in {'.gz', '.br'} and fpath_cached.stem not in hashes:
+                fpath_cached.unlink(missing_ok=True)
+
+    return PrecompressResult(written=written, unchanged=unchanged, removed=removed)
+
+
 def listify(src: Any) -> list:
     """Make a list with source object if not already a list.
 
@@ -374,6 +867,11 @@ class Fifo:
 class UwsgiRunner:
     """Exposes methods to run uWSGI."""
 
+    plugins_cache_name: str = 'plugins.json'
+    """File name for embedded plugins probe cache. See ``get_plugins()``."""
+
+    _plugins_cache: ClassVar[dict[str, EmbeddedPlugins]] = {}
+
     def __init__(self, binary_path: str | None = None):
         self.binary_uwsgi = binary_path or 'uwsgi'
         self.binary_python = self.prepare_env()
@@ -386,10 +884,86 @@ class UwsgiRunner:
         """
         return get_output(self.binary_uwsgi, args=command_args)
 
-    def get_plugins(self) -> EmbeddedPlugins:
-        """Returns ``EmbeddedPlugins`` object with."""
-        out = self.get_output('--plugin-list')
-        return parse_command_plugins_output(out)
+    def get_plugins(self, *, cached: bool = False) -> EmbeddedPlugins:
+        """Returns ``EmbeddedPlugins`` object with.
+
+        :param cached: Use probe results cache to not to run uWSGI binary every time.
+            Results are cached both in-process and on disk (see ``confcache.get_cache_dir()``),
+            keyed by uWSGI binary path, size and modification time.
+
+        """
+        cache_key = self.get_plugins_cache_key() if cached else ''
+
+        if not cache_key:
+            return parse_command_plugins_output(self.get_output('--plugin-list'))
+
+        plugins = self._plugins_cache.get(cache_key)
+
+        if plugins is not None:
+            return plugins
+
+        import json  # noqa: PLC0415
+
+        from .confcache import get_cache_dir  # noqa: PLC0415
+
+        cache_path = get_cache_dir() / self.plugins_cache_name
+
+        try:
+            cache = json.loads(cache_path.read_text())
+
+        except (OSError, ValueError):
+            cache = {}
+
+        entry = cache.get(cache_key)
+
+        if entry:
+            plugins = EmbeddedPlugins(generic=entry['generic'], request=entry['request'])
+
+        else:
+            out = self.get_output('--plugin-list')
+            plugins = parse_command_plugins_output(out)
+
+            # Keep only one entry per binary.
+            binary = cache_key.partition('|')[0]
+            cache = {key: val for key, val in cache.items() if key.partition('|')[0] != binary}
+            cache[cache_key] = {
+                'version': parse_command_version_output(out),
+                **plugins._asdict(),
+            }
+
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                write_if_changed(cache_path, json.dumps(cache))
+
+            except OSError:
+                # Cache is an optimization. Unwritable cache directory should not break probing.
+                pass
+
+        self._plugins_cache[cache_key] = plugins
+
+        return plugins
+
+    def get_plugins_cache_key(self) -> str:
+        """Returns embedded plugins cache key for uWSGI binary.
+        Empty string is returned if binary is not found.
+
+        """
+        from shutil import which  # noqa: PLC0415
+
+        binary = which(self.binary_uwsgi)
+
+        if not binary:
+            return ''
+
+        binary = Path(binary).resolve()
+
+        try:
+            stat = binary.stat()
+
+        except OSError:
+            return ''
+
+        return f'{binary}|{stat.st_size}|{stat.st_mtime_ns}'
 
     @classmethod
     def get_env_path(cls) -> str:
@@ -415,7 +989,8 @@ class UwsgiRunner:
             *,
             replace: bool = False,
             filepath: str | Path | None = None,
-            embedded: bool = False
+            embedded: bool = False,
+            cached: bool = False
     ):
         """Spawns uWSGI using the given configuration module.
 
@@ -441,6 +1016,10 @@ class UwsgiRunner:
             translate all config parameters into command line arguments and
             pass it to ``pyuwsgi``.
 
+        :param cached: Flag. Load configuration from .py file through compiled configuration
+            cache loader, so that configuration module is not imported on every uWSGI (re)start
+            unless it (or its imports, or relevant env) has changed. See ``confcache``.
+
         """
         args = ['uwsgi']
 
@@ -461,7 +1040,8 @@ class UwsgiRunner:
                 # Consider it to be a python script (uwsgicfg.py).
                 # Pass --conf as an argument to have a chance to use
                 # touch reloading form .py configuration file change.
-                args.append(f'exec://{self.binary_python} {filepath} --conf {config.alias}')
+                loader = '-m uwsgiconf.confcache ' if cached else ''
+                args.append(f'exec://{self.binary_python} {loader}{filepath} --conf {config.alias}')
 
         if replace:
 
@@ -510,6 +1090,15 @@ def parse_command_plugins_output(out: str) -> EmbeddedPlugins:
     return plugins
 
 
+def parse_command_version_output(out: str) -> str:
+    """Parses uWSGI output and returns its version or empty string.
+
+    :param out:
+
+    """
+    return out.partition('Starting uWSGI ')[2].partition(' ')[0]
+
+
 def get_uwsgi_stub_attrs_diff() -> tuple[list[str], list[str]]:
     """Returns attributes difference two elements tuple between
     real uwsgi module and its stub.
@@ -1,20 +1,32 @@
 from collections.abc import Callable
 
+from .emulator import (
+    asynced as __asynced,
+)
 from .emulator import (
     caching as __caching,
 )
+from .emulator import (
+    legion as __legion,
+)
 from .emulator import (
     locking as __locking,
 )
 from .emulator import (
     mules as __mules,
 )
+from .emulator import (
+    queue as __queue,
+)
 from .emulator import (
     rpc as __rpc,
 )
 from .emulator import (
     scheduling as __scheduling,
 )
+from .emulator import (
+    sharedarea as __sharedarea,
+)
 from .emulator import (
     signals as __signals,
 )
@@ -101,6 +113,13 @@ opt: dict[bytes, bytes] = {}
 post_fork_hook: Callable = lambda: None
 """Function to be called after process fork (spawning a new worker/mule)."""
 
+queue_size: int = __queue.SIZE
+"""Number of slots in the shared queue.
+
+* http://uwsgi.readthedocs.io/en/latest/Queue.html
+
+"""
+
 spooler: Callable = lambda: None
 """Function to be called for spooler messages processing."""
 
@@ -248,6 +267,7 @@ def async_connect(socket: str) -> int:
     :param socket:
 
     """
+    return __asynced.connect(address=socket)
 
 
 def async_sleep(seconds: int) -> bytes:
@@ -258,6 +278,8 @@ def async_sleep(seconds: int) -> bytes:
     :param seconds: Sleep time, in seconds.
 
     """
+    __asynced.sleep(seconds=seconds)
+    return b''
 
 
 def cache_clear(cache: str):
@@ -395,7 +417,7 @@ def cache_num(key: str, cache: str | None = None) -> int | None:
 
 
 def cache_set(key: str, value: bytes, expires: int | None = None, cache: str | None = None) -> bool:
-    """Sets the specified key value.
+    """Sets the specified key value if the key does not exist.
 
     :param key:
 
@@ -406,7 +428,7 @@ def cache_set(key: str, value: bytes, expires: int | None = None, cache: str | N
     :param cache: Cache name with optional address (if @-syntax is used).
 
     """
-    return __caching.set_value(key=key, value=value, expires=expires, cache=cache)
+    return __caching.set_value(key=key, value=value, expires=expires, cache=cache, update=False)
 
 
 def cache_update(key: str, value: bytes, expires: int | None = None, cache: str | None = None) -> bool:
@@ -471,6 +493,7 @@ def close(fd: int):
     :param fd: File descriptor.
 
     """
+    __asynced.close(fd=fd)
 
 
 def connect(socket: str, timeout: int = 0) -> int:
@@ -579,7 +602,7 @@ def is_connected(fd: int) -> bool:
     :param fd: File descriptor
 
     """
-    return False
+    return __asynced.is_connected(fd=fd)
 
 
 def is_locked(lock_num: int = 0) -> bool:
@@ -804,14 +827,81 @@ def parsefile(fpath: str):
     """
 
 
+def queue_get(index: int) -> bytes | None:
+    """Returns a message from the given queue slot.
+
+    * http://uwsgi.readthedocs.io/en/latest/Queue.html
+
+    :param index: Slot number.
+
+    """
+    return __queue.get(index=index)
+
+
+def queue_last(num: int = 0) -> bytes | list[bytes] | None:
+    """Returns the last message pushed to the queue.
+    If ``num`` is set, returns a list of up to ``num`` last messages (the newest first).
+
+    :param num:
+
+    """
+    if not num:
+        return (__queue.get_last(count=1) or [None])[0]
+
+    return __queue.get_last(count=num)
+
+
+def queue_pop() -> bytes | None:
+    """Removes and returns the last pushed message (LIFO)."""
+    return __queue.pop()
+
+
+def queue_pull() -> bytes | None:
+    """Removes and returns the first pushed message (FIFO)."""
+    return __queue.pull()
+
+
+def queue_pull_slot() -> int:
+    """Returns the slot number to be pulled next (FIFO position)."""
+    return __queue.get_pull_slot()
+
+
+def queue_push(message: bytes) -> bool:
+    """Pushes a message into the queue.
+
+    .. note:: When the queue is full the oldest message is overwritten.
+
+    :param message:
+
+    """
+    return __queue.push(value=message)
+
+
+def queue_set(index: int, message: bytes) -> bool:
+    """Puts a message into the given queue slot.
+
+    :param index: Slot number.
+
+    :param message:
+
+    """
+    return __queue.set_value(index=index, value=message)
+
+
+def queue_slot() -> int:
+    """Returns the slot number to be pushed into next (LIFO position)."""
+    return __queue.get_slot()
+
+
 def ready() -> bool:
     """Returns flag indicating whether we are ready to handle requests."""
     return False
 
 
-def ready_fd() -> bool:
-    """Returns flag indicating whether file description related to request is ready."""
-    return False
+def ready_fd() -> int:
+    """Returns file descriptor which is ready after suspension (see ``wait_fd_read``)
+    or -1 if waiting timed out."""
+    return __asynced.get_ready_fd()
 
 
 def recv(fd: int, maxsize: int = 4096) -> bytes:
@@ -1021,6 +1111,224 @@ def setprocname(name: str):
     """
 
 
+def sharedarea_read(id: int, pos: int, length: int = 0) -> bytes:
+    """Reads bytes from the shared area.
+
+    * http://uwsgi.readthedocs.io/en/latest/SharedArea.html
+
+    :param id: Area ID (number in order of definition, starting with 0).
+
+    :param pos: Position (offset) to read from.
+
+    :param length: Number of bytes to read. Default: up to the end of the area.
+
+    :raises ValueError: If the area or position is invalid.
+
+    """
+    return __sharedarea.read(area_id=id, pos=pos, length=length)
+
+
+def sharedarea_write(id: int, pos: int, data: bytes) -> int:
+    """Writes bytes into the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset) to write to.
+
+    :param data:
+
+    :raises ValueError: If the area or position is invalid.
+
+    """
+    return __sharedarea.write(area_id=id, pos=pos, data=data)
+
+
+def sharedarea_read8(id: int, pos: int) -> int:
+    """Reads signed 8-bit integer from the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    """
+    return __sharedarea.read_int(area_id=id, pos=pos, bits=8)
+
+
+def sharedarea_write8(id: int, pos: int, value: int) -> bool:
+    """Writes signed 8-bit integer into the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    :param value:
+
+    """
+    return __sharedarea.write_int(area_id=id, pos=pos, value=value, bits=8)
+
+
+def sharedarea_read16(id: int, pos: int) -> int:
+    """Reads signed 16-bit integer from the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    """
+    return __sharedarea.read_int(area_id=id, pos=pos, bits=16)
+
+
+def sharedarea_write16(id: int, pos: int, value: int) -> bool:
+    """Writes signed 16-bit integer into the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    :param value:
+
+    """
+    return __sharedarea.write_int(area_id=id, pos=pos, value=value, bits=16)
+
+
+def sharedarea_read32(id: int, pos: int) -> int:
+    """Reads signed 32-bit integer from the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    """
+    return __sharedarea.read_int(area_id=id, pos=pos, bits=32)
+
+
+def sharedarea_write32(id: int, pos: int, value: int) -> bool:
+    """Writes signed 32-bit integer into the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    :param value:
+
+    """
+    return __sharedarea.write_int(area_id=id, pos=pos, value=value, bits=32)
+
+
+def sharedarea_inc32(id: int, pos: int, value: int = 1) -> bool:
+    """Atomically increments signed 32-bit integer in the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    :param value:
+
+    """
+    return __sharedarea.add_int(area_id=id, pos=pos, value=value, bits=32)
+
+
+def sharedarea_dec32(id: int, pos: int, value: int = 1) -> bool:
+    """Atomically decrements signed 32-bit integer in the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    :param value:
+
+    """
+    return __sharedarea.add_int(area_id=id, pos=pos, value=-value, bits=32)
+
+
+def sharedarea_read64(id: int, pos: int) -> int:
+    """Reads signed 64-bit integer from the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    """
+    return __sharedarea.read_int(area_id=id, pos=pos, bits=64)
+
+
+def sharedarea_write64(id: int, pos: int, value: int) -> bool:
+    """Writes signed 64-bit integer into the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    :param value:
+
+    """
+    return __sharedarea.write_int(area_id=id, pos=pos, value=value, bits=64)
+
+
+def sharedarea_inc64(id: int, pos: int, value: int = 1) -> bool:
+    """Atomically increments signed 64-bit integer in the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    :param value:
+
+    """
+    return __sharedarea.add_int(area_id=id, pos=pos, value=value, bits=64)
+
+
+def sharedarea_dec64(id: int, pos: int, value: int = 1) -> bool:
+    """Atomically decrements signed 64-bit integer in the shared area.
+
+    :param id: Area ID.
+
+    :param pos: Position (offset).
+
+    :param value:
+
+    """
+    return __sharedarea.add_int(area_id=id, pos=pos, value=-value, bits=64)
+
+
+def sharedarea_rlock(id: int):
+    """Acquires the shared area read lock.
+
+    :param id: Area ID.
+
+    """
+    __sharedarea.lock(area_id=id)
+
+
+def sharedarea_wlock(id: int):
+    """Acquires the shared area write lock.
+
+    :param id: Area ID.
+
+    """
+    __sharedarea.lock(area_id=id)
+
+
+def sharedarea_unlock(id: int):
+    """Releases the shared area lock.
+
+    :param id: Area ID.
+
+    """
+    __sharedarea.unlock(area_id=id)
+
+
+def sharedarea_memoryview(id: int) -> memoryview:
+    """Returns a writable memoryview of the whole shared area (no copying).
+
+    .. note:: Access through memoryview is not guarded by the area lock.
+
+    :param id: Area ID.
+
+    """
+    return __sharedarea.get_memoryview(area_id=id)
+
+
 def signal(num: int, remote: str = ''):
     """Sends the signal to master or remote.
 
@@ -1108,7 +1416,7 @@ def suspend() -> bool:
     * http://uwsgi.readthedocs.io/en/latest/Async.html#suspend-resume
 
     """
-    return False
+    return __asynced.suspend()
 
 
 def total_requests() -> int:
@@ -1145,6 +1453,8 @@ def wait_fd_read(fd: int, timeout: int | None = None) -> bytes:
     :raises OSError: If unable to read.
 
     """
+    __asynced.wait_fd(fd=fd, timeout=timeout)
+    return b''
 
 
 def wait_fd_write(fd: int, timeout: int | None = None) -> bytes:
@@ -1162,6 +1472,8 @@ def wait_fd_write(fd: int, timeout: int | None = None) -> bytes:
     :raises OSError: If unable to read.
 
     """
+    __asynced.wait_fd(fd=fd, timeout=timeout, write=True)
+    return b''
 
 
 def websocket_handshake(security_key: str | None = None, origin: str | None = None, proto: str | None = None):
@@ -1254,10 +1566,10 @@ def i_am_the_lord(legion_name: str) -> bool:
     :param legion_name:
 
     """
-    return False
+    return __legion.is_lord(legion=legion_name)
 
 
-def lord_scroll(legion_name: str) -> bool:
+def lord_scroll(legion_name: str) -> bytes | None:
     """Returns a Lord scroll for the Legion.
 
     * http://uwsgi.readthedocs.io/en/latest/Legion.html#lord-scroll-coming-soon
@@ -1265,13 +1577,13 @@ def lord_scroll(legion_name: str) -> bool:
     :param legion_name:
 
     """
-    return False
+    return (__legion.get_scrolls(legion=legion_name) or [None])[0]
 
 
-def scrolls(legion_name: str) -> list[str]:
+def scrolls(legion_name: str) -> list[bytes]:
     """Returns a list of Legion scrolls defined on cluster.
 
     :param legion_name:
 
     """
-    return []
+    return __legion.get_scrolls(legion=legion_name)
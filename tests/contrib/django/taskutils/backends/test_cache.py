@@ -3,6 +3,7 @@ from django.core.cache.backends.base import InvalidCacheBackendError
 
 from uwsgiconf.contrib.django.uwsgify.taskutils.backends import CacheBackend
 from uwsgiconf.contrib.django.uwsgify.taskutils.decorators import task
+from uwsgiconf.runtime.task_utils import TaskContext
 
 
 def mytask():
@@ -24,3 +25,21 @@ def test_cache():
     # unknown backend silenced
     task_3 = task(backend=CacheBackend(cache_name='unknown', strict=False))(mytask)
     assert task_3() is None
+
+
+def test_cache_lock():
+    from django.core.cache import cache
+
+    backend = CacheBackend(cache_name='default')
+
+    @task(backend=backend)
+    def locked(*, ctx: TaskContext):
+        assert ctx.obj.extend()
+        # concurrent run is skipped
+        assert locked() is None
+        return ctx.token
+
+    token = locked()
+    assert token
+    assert locked() == token + 1
+    assert not cache.has_key('lock_locked')
@@ -0,0 +1,71 @@
+from uwsgiconf.contrib.django.uwsgify.models import Task
+from uwsgiconf.contrib.django.uwsgify.taskutils.backends import LeaseDbBackend
+from uwsgiconf.contrib.django.uwsgify.taskutils.decorators import task
+from uwsgiconf.runtime.task_utils import TaskContext
+
+
+def leasedtask(*, ctx: TaskContext):
+    assert ctx.obj.heartbeat()
+    ctx.result = {'d': 'f'}
+    return f'{ctx.params}-{ctx.last_result}'
+
+
+def test_lease():
+    backend = LeaseDbBackend(lease=60)
+
+    # unregistered task
+    task_1 = task(backend=backend)(leasedtask)
+    assert task_1() is None
+
+    task_obj = Task.register('leasedtask', params={'a': 'b'}, result={'r': 't'})
+
+    assert task_1() == "{'a': 'b'}-{'r': 't'}"
+
+    task_obj.refresh_from_db()
+    assert task_obj.released
+    assert task_obj.dt_released
+    assert task_obj.dt_lease is None
+    assert task_obj.result == {'d': 'f'}
+
+
+def test_lease_batch():
+    backend = LeaseDbBackend(batch=3)
+    task_1 = task(backend=backend)(leasedtask)
+
+    task_obj = Task.register('leasedtask')
+
+    assert task_1()
+
+    # release is pending
+    task_obj.refresh_from_db()
+    assert not task_obj.released
+
+    # pending release is written before acquirement
+    assert task_1()
+    task_obj.refresh_from_db()
+    assert not task_obj.released
+    assert task_obj.result == {'d': 'f'}
+
+    assert backend.flush() == 1
+    assert backend.flush() == 0
+
+    task_obj.refresh_from_db()
+    assert task_obj.released
+
+
+def test_lease_batch_atexit(monkeypatch):
+    registered = []
+    monkeypatch.setattr('atexit.register', registered.append)
+
+    backend = LeaseDbBackend(batch=3)
+    task_1 = task(backend=backend)(leasedtask)
+    task_obj = Task.register('leasedtask')
+
+    assert task_1()
+    assert task_1()
+    assert len(registered) == 1
+
+    # pending release is written on exit
+    registered[0]()
+    task_obj.refresh_from_db()
+    assert task_obj.released
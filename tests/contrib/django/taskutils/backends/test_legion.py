@@ -0,0 +1,21 @@
+from uwsgiconf.contrib.django.uwsgify.taskutils.backends import LegionBackend
+from uwsgiconf.contrib.django.uwsgify.taskutils.decorators import task
+from uwsgiconf.emulator.legion import cleanup, set_state
+
+
+def mytask():
+    return 'some'
+
+
+def test_legion():
+    cleanup()
+
+    task_1 = task(backend=LegionBackend(legion='mylegion'))(mytask)
+
+    # not a lord
+    assert task_1() is None
+
+    set_state(legion='mylegion')
+    assert task_1() == 'some'
+
+    cleanup()
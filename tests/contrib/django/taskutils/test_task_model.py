@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from freezegun import freeze_time
 
 from tests.testapp.models import Task
@@ -65,3 +67,79 @@ def test_reset_stale():
     Task.reset_stale()
     task.refresh_from_db()
     assert task.released
+
+
+def test_lease():
+    assert Task.acquire_lease('leased') is None
+
+    with freeze_time('2025-02-05 15:00:00'):
+        Task.register('leased', params={'a': 'b'})
+
+        task = Task.acquire_lease('leased', lease=60)
+        assert task.lease == 60
+        assert not task.released
+        assert task.owner
+        assert task.dt_lease
+        assert task.params == {'a': 'b'}
+
+        # unable to reacquire while leased
+        assert Task.acquire_lease('leased') is None
+        assert Task.acquire('leased') is None
+
+    with freeze_time('2025-02-05 15:00:20'):
+        # more than a half of the lease remains: no renewal
+        dt_lease = task.dt_lease
+        assert task.heartbeat()
+        assert task.dt_lease == dt_lease
+
+    with freeze_time('2025-02-05 15:00:40'):
+        assert task.heartbeat()
+        assert task.dt_lease > dt_lease
+
+    with freeze_time('2025-02-05 15:02:00'):
+        # lease expired: acquired by another
+        task_other = Task.acquire_lease('leased')
+        assert task_other
+
+        # the lease is lost for the first one
+        assert not task.heartbeat()
+        assert not task.release_lease(result={'c': 'd'})
+
+        assert task_other.release_lease(result={'e': 'f'})
+
+    task.refresh_from_db()
+    assert task.released
+    assert task.dt_lease is None
+    assert task.result == {'e': 'f'}
+
+
+def test_release_leases(db_queries):
+    Task.register('one')
+    Task.register('two')
+
+    task_one = Task.acquire_lease('one')
+    task_two = Task.acquire_lease('two')
+
+    assert Task.release_leases([(task_one, {'a': 'b'}), (task_two, None)]) == 2
+
+    task_one.refresh_from_db()
+    task_two.refresh_from_db()
+    assert task_one.released
+    assert task_one.result == {'a': 'b'}
+    assert task_two.released
+    assert task_two.result == {}
+
+    # One query per result.
+    Task.register('three')
+    tasks = [Task.acquire_lease(name) for name in ('one', 'two', 'three')]
+
+    with db_queries.scope(expect=2):
+        released = Task.release_leases([(tasks[0], {'x': 1}), (tasks[1], None), (tasks[2], {'x': 1})])
+
+    assert released == 3
+    assert [task.result for task in Task.objects.order_by('name')] == [{'x': 1}, {'x': 1}, {}]
+
+    # Lost leases are not released.
+    task = Task.acquire_lease('one')
+    task.dt_acquired -= timedelta(seconds=1)
+    assert Task.release_leases([(task, None)]) == 0
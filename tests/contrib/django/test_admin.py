@@ -1,3 +1,4 @@
+import os
 from datetime import timedelta
 
 from django.utils import timezone
@@ -67,12 +68,22 @@ def test_task(admin_client, user_create):
     assert 'is not registered within' in data
 
 
-def test_workers(request_client, user_create):
+def test_workers(request_client, user_create, monkeypatch):
 
     client = request_client(user=user_create(superuser=True))
     data = client.get('/admin/uwsgify/workers/').content.decode()
     assert 'This site is not served by uWSGI.' in data
 
+    monkeypatch.setattr('uwsgiconf.uwsgi.workers', lambda: ({'id': 1, 'pid': os.getpid(), 'rss': 10},))
+    monkeypatch.setattr(
+        'uwsgiconf.runtime.platform.uwsgi.get_memory_details',
+        lambda pid: {'rss': 20, 'pss': 2048, 'uss': 1024, 'shared': 3072})
+
+    data = client.get('/admin/uwsgify/workers/').content.decode()
+    assert 'PSS:' in data
+    assert '2.0\xa0KB' in data
+    assert '3.0\xa0KB' in data
+
 
 def test_maintenance(request_client, user_create, monkeypatch, tmpdir):
 
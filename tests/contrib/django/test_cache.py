@@ -1,6 +1,7 @@
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from freezegun import freeze_time
 
-from uwsgiconf.contrib.django.uwsgify.cache import UwsgiCache
+from uwsgiconf.contrib.django.uwsgify.cache import CacheLock, UwsgiCache
 
 
 def test_cache():
@@ -15,7 +16,9 @@ def test_cache():
     cache.incr("some", delta=2)
     assert cache.get("some") == 3
 
-    cache.add("other", [1, 2, 3])
+    assert cache.add("other", [1, 2, 3])
+    assert cache.get("other") == [1, 2, 3]
+    assert not cache.add("other", [4])
     assert cache.get("other") == [1, 2, 3]
 
     assert cache.has_key("other")
@@ -37,3 +40,58 @@ def test_cache_none_timeout_never_expires():
 
     assert cache._resolve_uwsgi_timeout(DEFAULT_TIMEOUT) == 0
     assert cache._resolve_uwsgi_timeout(None) == 0
+
+
+def test_cache_lock():
+    from django.core.cache import cache
+
+    lock = CacheLock('mylock', timeout=60)
+
+    with lock as acquired:
+        assert acquired
+        assert lock.is_acquired
+        assert lock.token == 1
+
+        # contender fails
+        other = CacheLock('mylock')
+        assert not other.acquire()
+        assert not other.release()
+
+        assert lock.extend()
+
+    assert not lock.owner
+    assert not cache.has_key('mylock')
+
+    # fencing token increases
+    assert lock.acquire()
+    assert lock.token == 2
+
+    # lock is taken over by another (e.g. expired)
+    cache.delete('mylock')
+    other = CacheLock('mylock', fencing=False)
+    assert other.acquire()
+    assert other.token is None
+
+    # not deleted by a stale owner
+    assert not lock.extend()
+    assert not lock.release()
+    assert cache.has_key('mylock')
+
+    assert other.release()
+
+
+def test_cache_lock_margin():
+    from django.core.cache import cache
+
+    with freeze_time('2025-02-05 15:00:00') as frozen:
+        lock = CacheLock('mylock', timeout=10)
+        assert lock.acquire()
+
+        frozen.tick(9.5)
+
+        # the lease is about to expire: the lock is considered lost
+        assert not lock.is_acquired
+        assert not lock.release()
+
+    assert cache.has_key('mylock')
+    cache.delete('mylock')
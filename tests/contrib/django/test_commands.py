@@ -44,6 +44,7 @@ def test_uwsgi_run(monkeypatch, patch_project_dir, command_run, settings, tmpdir
     out, __ = capsys.readouterr()
     assert tmpdir.join('admin').exists()
     assert tmpdir.join('uwsgify').exists()
+    assert tmpdir.join('admin', 'css', 'base.css.gz').exists()
     assert 'static files copied' in out
 
     command_run('uwsgi_run', options={'compile': True})
@@ -97,3 +98,37 @@ def test_uwsgi_sysinit_upstart(patch_base_command, capsys, command_run):
     assert 'bin/python' in out
     assert 'dummy/manage.py uwsgi_run' in out
 
+
+
+def test_uwsgi_profile(monkeypatch, patch_project_dir, command_run, tmpdir, capsys):
+    from django.core.management import CommandError
+
+    trigger = Path(f'{tmpdir}') / 'uwsgi.profile'
+
+    monkeypatch.setattr(
+        'uwsgiconf.contrib.django.uwsgify.toolbox.SectionMutator.get_profile_filepath',
+        lambda mutator: trigger)
+
+    with pytest.raises(CommandError, match='Unable to find'):
+        command_run('uwsgi_profile')
+
+    trigger.write_text('')
+
+    def work(seconds):
+        # Emulate workers writing profiles.
+        if trigger.read_text() == '3.0':
+            (trigger.parent / 'profile-1-100.collapsed').write_text('a;b 3\na;c 1\n')
+            (trigger.parent / 'profile-2-101.collapsed').write_text('a;b 2\n')
+
+    monkeypatch.setattr('uwsgiconf.contrib.django.uwsgify.management.commands.uwsgi_profile.sleep', work)
+
+    command_run('uwsgi_profile', options={'duration': 3, 'wait': 1, 'output': ''})
+    assert capsys.readouterr().out == 'a;b 5\na;c 1\n'
+
+    output = Path(f'{tmpdir}') / 'merged.collapsed'
+    command_run('uwsgi_profile', options={'duration': 3, 'wait': 1, 'output': f'{output}'})
+    assert output.read_text() == 'a;b 5\na;c 1\n'
+
+    # no profiles
+    with pytest.raises(CommandError, match='No profiles'):
+        command_run('uwsgi_profile', options={'duration': 1, 'wait': 0, 'output': ''})
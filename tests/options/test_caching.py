@@ -37,3 +37,47 @@ def test_cache_registration(assert_lines):
     assert_lines([
         'cache2 = name=mycache,maxitems=20,no_expire=1',
     ], Section().caching.add_cache('mycache', max_items=20, no_expire=True))
+
+
+def test_caching_preload_directory(tmp_path):
+    from uwsgiconf.options.routing_evaluator import RoutingEvaluator
+
+    (tmp_path / 'css').mkdir()
+    (tmp_path / 'css' / 'app.css').write_text('a' * 500)
+    (tmp_path / 'app.js').write_text('b' * 100)
+    (tmp_path / 'big.js').write_text('c' * 2000)
+    (tmp_path / 'image.png').write_text('d')
+
+    manifest = tmp_path / 'manifest.json'
+
+    def preload(**kwargs):
+        section = Section()
+        section.caching.preload_directory(
+            tmp_path, '*.*s', max_file_size=1000, mountpoint='/static/', manifest=manifest, **kwargs)
+        return section
+
+    section = preload()
+    assert section.as_configuration().format(stamp=False).splitlines()[2:] == [
+        'cache2 = name=statics,maxitems=5,blocksize=4096,blocks=5,bitmap=1',
+        f'load-file-in-cache = statics {tmp_path}/app.js',
+        f'load-file-in-cache = statics {tmp_path}/css/app.css',
+        'static-cache-paths = 60',
+        'static-cache-paths-name = statics',
+        'plugin = router_cache',
+        f'route = ^/static/(.*) cache:key={tmp_path}/$1,name=statics,mime=1',
+        f'touch-reload = {manifest}',
+    ]
+    mtime = manifest.stat().st_mtime_ns
+
+    # Manifest is not rewritten if files are the same.
+    section = preload(gzip=True, paths_cache_timeout=None)
+    assert manifest.stat().st_mtime_ns == mtime
+    assert section.as_configuration().format(stamp=False).splitlines()[2:4] == [
+        'cache2 = name=statics,maxitems=3,blocksize=4096,blocks=3,bitmap=1',
+        f'load-file-in-cache-gzip = statics {tmp_path}/app.js',
+    ]
+
+    evaluator = RoutingEvaluator(section)
+    assert evaluator.evaluate({'PATH_INFO': '/static/app.js', 'HTTP_ACCEPT_ENCODING': 'deflate, gzip'}).actions == [
+        f'cache:key={tmp_path}/app.js,name=statics,mime=1,content_encoding=gzip']
+    assert evaluator.evaluate({'PATH_INFO': '/static/app.js'}).actions == []
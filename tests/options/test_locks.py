@@ -15,3 +15,9 @@ def test_locks_basics(assert_lines):
         'flock2 = /here',
     ], Section().locks.lock_file('/here', after_setup=True))
 
+
+    assert_lines([
+        'enable-metrics = true',
+        'metric = name=lock.3.wait,type=counter',
+        'metric = name=lock.3.hold,type=counter',
+    ], Section().locks.register_metrics(3))
@@ -165,3 +165,20 @@ def test_logging_add_logger_encoder(assert_lines):
     ], logging.add_logger_encoder([
         enc_format(f'> {enc_format.vars.MESSAGE} <'),
     ], logger=logging.loggers.file('/home/here.log', alias='myfile')))
+
+
+def test_logging_requests_sampling(assert_lines):
+
+    logging = Section().logging
+
+    assert_lines([
+        'disable-logging = true',
+        'log-slow = 500',
+        'log-4xx = true',
+        'log-5xx = true',
+        'enable-metrics = true',
+        'metric = name=log_sample_rate,initial_value=20,type=absolute',
+        'log-format = %(uri) %(var.UWSGICONF_LOG_SAMPLE)',
+
+    ], logging.set_requests_sampling(20, slower=500).logging.set_basic_params(
+        template=f'{logging.vars.REQ_URI} {logging.vars.SAMPLE_RATE}'))
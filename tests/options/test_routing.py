@@ -456,3 +456,204 @@ def test_routing_goto_label(assert_lines):
             ], label=label)
     )
 
+
+
+def test_routing_cache(assert_lines):
+
+    rule = Section.routing.route_rule
+
+    assert_lines([
+        'plugin = router_cache',
+        'route-run = cache:key=${REQUEST_URI},name=pages,mime=1',
+        'route-run = cache-continue:key=${REQUEST_URI}',
+        'route-run = cachestore:key=${REQUEST_URI},name=pages,expires=30',
+        'route-run = cacheset:key=hits,value=0',
+        'route-run = cacheinc:key=hits,expires=60',
+
+    ], Section().routing.register_route([
+        rule(rule.actions.cache('${REQUEST_URI}', cache_name='pages', mime=True), subject=None),
+        rule(rule.actions.cache('${REQUEST_URI}', do_continue=True), subject=None),
+        rule(rule.actions.cache_store('${REQUEST_URI}', cache_name='pages', expires=30), subject=None),
+        rule(rule.actions.cache_set('hits', 0), subject=None),
+        rule(rule.actions.cache_increment('hits', expires=60), subject=None),
+    ]))
+
+
+def test_routing_order():
+    rule = Section.routing.route_rule
+
+    section = Section()
+    section.routing.register_route([
+        rule(rule.actions.do_goto('skip'), subject='^/a'),
+        rule(rule.actions.log('b'), subject=None),
+    ])
+    section.routing.register_route(rule(rule.actions.log('c'), subject='^/c'), label='skip')
+
+    assert section.as_configuration().format(stamp=False).splitlines()[2:] == [
+        'route = ^/a goto:skip',
+        'route-run = log:b',
+        'route-label = skip',
+        'route = ^/c log:c',
+    ]
+
+
+def test_routing_response_cache():
+
+    section = Section().routing.configure_response_cache(
+        expires=5, bypass_cookies=['sessionid', 'csrftoken'], subject='^/blog/')
+
+    assert section.as_configuration().format(stamp=False).splitlines()[2:] == [
+        'cache2 = name=responses,maxitems=1000',
+        'route-if-not = regexp:${REQUEST_METHOD};^(GET|HEAD)$ goto:responses-bypass',
+        'route-if-not = empty:${cookie[sessionid]} goto:responses-bypass',
+        'route-if-not = empty:${cookie[csrftoken]} goto:responses-bypass',
+        'plugin = router_cache',
+        'route = ^/blog/ cache:key=${REQUEST_METHOD}|${HTTP_HOST}|${REQUEST_URI},name=responses',
+        'route = ^/blog/ cachestore:key=${REQUEST_METHOD}|${HTTP_HOST}|${REQUEST_URI},name=responses,expires=5',
+        'route-label = responses-bypass',
+    ]
+
+    # Custom key.
+    section = Section().routing.configure_response_cache(name='pages', key_vars=['REQUEST_URI'])
+    lines = section.as_configuration().format(stamp=False).splitlines()
+    assert 'route-run = cache:key=${REQUEST_URI},name=pages' in lines
+
+
+def test_routing_evaluator():
+    from uwsgiconf.options.routing_evaluator import RoutingEvaluator
+
+    rule = Section.routing.route_rule
+    actions = rule.actions
+    subj = rule.subjects
+
+    section = Section()
+    section.routing.register_route([
+        rule(actions.do_goto('anon'), subj.custom(rule.vars.cookie('sessionid')).isempty()),
+        rule(actions.set_var_script_name('/private'), subject='^/private/'),
+        rule(actions.do_break(403), subject=None),
+    ])
+    section.routing.register_route(rule(actions.redirect('/login/?next=$1'), subject='^(/private/.*)'), label='anon')
+
+    evaluator = RoutingEvaluator(section)
+
+    evaluation = evaluator.evaluate({'PATH_INFO': '/private/a/', 'HTTP_COOKIE': 'sessionid=1'})
+    assert evaluation.actions == ['setscriptname:/private', 'break:403']
+    assert evaluation.result == 'break'
+    assert evaluation.env['SCRIPT_NAME'] == '/private'
+
+    evaluation = evaluator.evaluate({'PATH_INFO': '/private/a/'})
+    assert evaluation.actions == ['goto:anon', 'redirect-302:/login/?next=/private/a/']
+
+    evaluation = evaluator.evaluate({'PATH_INFO': '/public/'})
+    assert evaluation.actions == ['goto:anon']
+    assert evaluation.result == 'next'
+
+
+def test_routing_optimize():
+    from uwsgiconf.options.routing_evaluator import RoutingEvaluator, get_rules
+    from uwsgiconf.options.routing_optimizer import verify
+
+    rule = Section.routing.route_rule
+    actions = rule.actions
+
+    def make_section():
+        section = Section()
+        section.routing.register_route([
+            rule(actions.do_break(404), subject=r'^/api/v1/users/\d+/x/'),
+            rule(actions.do_break(404), subject=r'^/api/v1/groups/\d+/x/'),
+            rule(actions.do_break(404), subject=r'^/api/v1/users/\d+/x/'),  # duplicate
+            rule(actions.redirect('/api/v2/'), subject=r'^/api/v1/legacy/'),
+            rule(actions.do_break(410), subject='^/about/$'),  # exact
+            rule(actions.redirect('/new/$1'), subject='^/old/(.*)'),
+            rule(actions.do_break(403), subject=r'\.php$'),
+            rule(actions.do_break(403), subject=r'\.asp$'),
+        ])
+        return section
+
+    paths = [
+        '/', '/about/', '/about/us/', '/old/page', '/index.php', '/x.asp',
+        '/api/v1/users/1/x/', '/api/v1/groups/2/x/', '/api/v1/legacy/', '/api/v1/other/', '/api/v2/',
+    ]
+    samples = [{'PATH_INFO': path, 'REQUEST_URI': path} for path in paths]
+
+    section = make_section()
+    rules_before = get_rules(section)
+    section.routing.optimize_rules(samples=samples)
+
+    assert section.as_configuration().format(stamp=False).splitlines()[2:] == [
+        'route = ^/about/$ break:410',
+        'route-if-not = startswith:${PATH_INFO};/api/v1/ goto:skip-1',
+        r'route = ^/api/v1/users/\d+/x/|^/api/v1/groups/\d+/x/ break:404',
+        'route = ^/api/v1/legacy/ redirect-302:/api/v2/',
+        'route-label = skip-1',
+        'route = ^/old/(.*) redirect-302:/new/$1',
+        r'route = \.php$|\.asp$ break:403',
+        'plugin = router_redirect',
+    ]
+
+    evaluator = RoutingEvaluator(section)
+    assert evaluator.evaluate({'PATH_INFO': '/about/'}).actions == ['break:410']
+    assert evaluator.evaluate({'PATH_INFO': '/api/v1/groups/1/x/'}).actions == ['break:404']
+    assert evaluator.evaluate({'PATH_INFO': '/old/x'}).actions == ['goto:skip-1', 'redirect-302:/new/x']
+
+    verify(rules_before, get_rules(section), samples=samples)
+
+    # Semantics change is detected.
+    section = Section()
+    section.routing.register_route([
+        rule(actions.do_break(403), subject='^/a'),
+        rule(actions.do_break(404), subject='^/a/$'),
+    ])
+    with pytest.raises(ConfigurationError):
+        verify(get_rules(section), list(reversed(get_rules(section))), samples=[{'PATH_INFO': '/a/'}])
+
+
+def test_routing_benchmark():
+    from uwsgiconf.options.routing_evaluator import RoutingBenchmark, get_request_env
+
+    assert get_request_env('127.0.0.1 - - [01/Jan/2024:00:00:00] "POST /a/?b=c HTTP/1.1" 200 12') == {
+        'REQUEST_METHOD': 'POST', 'REQUEST_URI': '/a/?b=c', 'PATH_INFO': '/a/', 'QUERY_STRING': 'b=c'}
+    assert get_request_env('[pid: 1|app: 0|req: 1/1] 127.0.0.1 () {30 vars in 300 bytes} GET /b/ => generated')[
+        'PATH_INFO'] == '/b/'
+    assert get_request_env('*** Starting uWSGI ***') is None
+
+    rule = Section.routing.route_rule
+    actions = rule.actions
+
+    section = Section()
+    section.routing.register_route([
+        rule(actions.log('${REQUEST_URI}'), subject=None),
+        rule(actions.do_break(403), subject='^/admin/'),
+        rule(actions.do_break(404), subject='^/a'),
+        rule(actions.do_break(410), subject='^/static/'),
+        rule(actions.redirect('/static/new/'), subject='^/static/old/$'),
+    ])
+
+    benchmark = RoutingBenchmark(section)
+    replayed = benchmark.replay([
+        *(['GET /static/x.css HTTP/1.1'] * 5),
+        *(['GET /about/ HTTP/1.1'] * 2),
+        'GET /admin/ HTTP/1.1',
+        {'PATH_INFO': '/static/old/'},
+        'garbage',
+    ])
+    assert replayed == 9
+    assert benchmark.requests == 9
+
+    (hot_rule, hot_stats), *_ = benchmark.get_hot()
+    assert hot_rule.action == 'log:${REQUEST_URI}'
+    assert hot_stats.matches == 9
+    assert benchmark.stats[3].matches == 6
+    assert benchmark.stats[3].checks == 6
+    assert benchmark.stats[3].time > 0
+
+    assert 'Requests: 9' in benchmark.format_report()
+
+    # ^/static/ is the hottest. ^/a overlaps with ^/admin/ so stays after it.
+    assert [f'{rule}' for rule in benchmark.recommend_order()] == [
+        'route-run = log:${REQUEST_URI}',
+        'route = ^/static/ break:410',
+        'route = ^/admin/ break:403',
+        'route = ^/a break:404',
+        'route = ^/static/old/$ redirect-302:/static/new/',
+    ]
@@ -0,0 +1,9 @@
+from uwsgiconf.config import Section
+
+
+def test_sharedarea_basics(assert_lines):
+
+    assert_lines([
+        'sharedarea = 10',
+        'sharedarea = size=4096,file=/tmp/area',
+    ], Section().shared_area.add_area(pages=10).shared_area.add_area(size=4096, file='/tmp/area'))
@@ -46,3 +46,21 @@ def test_statics_expiration(assert_lines):
 
     ))
 
+
+
+def test_statics_gzip(assert_lines):
+
+    assert_lines([
+        'static-gzip-all = true',
+        'static-gzip-dir = /var/www/static/',
+        'static-gzip-ext = .css',
+        'static-gzip-ext = .js',
+        'static-gzip = \\.svg$',
+    ], Section().statics.set_gzip_params(
+        all_files=True, dirs='/var/www/static/', extensions=['.css', '.js'], regexps=r'\.svg$'))
+
+    statics = Section().statics
+
+    assert_lines([
+        'static-expires = \\.[0-9a-f]{8,32}\\.\\w+(\\.gz)?$ 31536000',
+    ], statics.add_expiration_rule(statics.expiration_criteria.FILENAME, statics.FILENAME_HASHED, timeout=31536000))
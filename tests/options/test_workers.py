@@ -15,6 +15,12 @@ def test_workers_basics(assert_lines):
         'min-worker-lifetime = 10',
     ], Section().workers.set_reload_params(min_lifetime=10))
 
+    assert_lines([
+        'enable-metrics = true',
+        'metric = name=memwatch.1.leak,type=gauge',
+        'metric = name=memwatch.2.recycled,type=counter',
+    ], Section().workers.register_memory_metrics(2))
+
     assert_lines([
         'reload-on-exception = true',
     ], Section().workers.set_reload_on_exception_params(do_reload=True))
@@ -1,5 +1,5 @@
 from uwsgiconf.config import Section
-from uwsgiconf.presets.empire import Broodlord
+from uwsgiconf.presets.empire import Broodlord, VassalsHome
 
 
 def test_broodlord(assert_lines):
@@ -43,3 +43,40 @@ def test_broodlord(assert_lines):
         'idle = 30',
         'die-on-idle = true',
     ], zerg)
+
+
+def test_vassals_home(tmp_path):
+
+    def get_confs(*apps):
+        return [Section().env('APP', app).as_configuration(alias=alias) for alias, app in apps]
+
+    home = VassalsHome(tmp_path / 'vassals')
+
+    result = home.sync(get_confs(('one', '1'), ('two', '2'), ('three', '3')))
+    assert [fpath.name for fpath in result.created] == ['one.ini', 'two.ini', 'three.ini']
+    assert not result.updated
+    assert not result.removed
+    assert not result.unchanged
+    assert 'env = APP=2' in (home.path / 'two.ini').read_text()
+
+    (home.path / 'alien.txt').write_text('')
+    mtime_one = (home.path / 'one.ini').stat().st_mtime
+    mtime_two = (home.path / 'two.ini').stat().st_mtime
+
+    result = home.sync(get_confs(('one', '1'), ('two', '22')))
+    assert [fpath.name for fpath in result.unchanged] == ['one.ini']
+    assert [fpath.name for fpath in result.updated] == ['two.ini']
+    assert [fpath.name for fpath in result.removed] == ['three.ini']
+    assert not result.created
+
+    assert (home.path / 'one.ini').stat().st_mtime == mtime_one
+    assert (home.path / 'two.ini').stat().st_mtime >= mtime_two + 1
+    assert 'env = APP=22' in (home.path / 'two.ini').read_text()
+    assert not (home.path / 'three.ini').exists()
+    assert (home.path / 'alien.txt').exists()
+    assert sorted(fpath.name for fpath in home.path.iterdir()) == ['alien.txt', 'one.ini', 'two.ini']
+
+    result = home.sync(get_confs(('one', '11')), remove=False, mtime=100)
+    assert [fpath.name for fpath in result.updated] == ['one.ini']
+    assert not result.removed
+    assert (home.path / 'one.ini').stat().st_mtime == 100
@@ -113,7 +113,7 @@ def test_configure_logging_json(assert_lines):
 
     assert_lines([
         'logger-req = stdio:',
-        'log-format = %(method) %(uri) -> %(status)',
+        'log-format = %(method) %(uri) -> %(status) in %(msecs) msecs',
         'log-req-encoder = json {"dt": "${strftime:%%Y-%%m-%%dT%%H:%%M:%%S%%z}", "src": "uwsgi.req"',
         'log-req-encoder = nl',
         '"src": "uwsgi.out"',
@@ -190,3 +190,16 @@ def test_nice_python(assert_lines):
 
     # Embedded plugins = True
     assert_lines('plugin = python', PythonSection(wsgi_module='somepackage.module'), assert_in=False)
+
+
+def test_configure_copy_on_write(assert_lines):
+
+    section = PythonSection(wsgi_module='somepackage.module').configure_copy_on_write(warmup=['myproject.settings'])
+
+    # Garbage collection is disabled before warmup imports.
+    assert_lines([
+        'shared-python-import = uwsgiconf.runtime.prefork\nshared-python-import = myproject.settings',
+    ], section)
+
+    # No hooks unsupported by uWSGI 2.0.
+    assert_lines(['hook-'], section, assert_in=False)
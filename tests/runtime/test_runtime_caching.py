@@ -13,6 +13,17 @@ def test_caching():
     assert cache.keys == ['mystr']
     assert cache['mystr'] == 'val'
 
+    # overwrite
+    cache['mystr'] = 'new'
+    assert cache['mystr'] == 'new'
+
+    # add only missing
+    assert not cache.add('mystr', 'other')
+    assert cache['mystr'] == 'new'
+    assert cache.add('myadded', 'other')
+    assert cache['myadded'] == 'other'
+    cache.delete('myadded')
+
     # deletion
     cache.delete('mystr')
     assert cache.keys == []
@@ -0,0 +1,102 @@
+import os
+import socket
+from time import perf_counter
+
+import pytest
+
+from uwsgiconf import uwsgi
+from uwsgiconf.runtime import coroutines
+
+
+def test_coroutines():
+    fd_read, fd_write = os.pipe()
+
+    # timeout
+    with pytest.raises(TimeoutError):
+        coroutines.run(coroutines.wait_for_fd_read(fd_read, timeout=0.01))
+
+    # ready
+    os.write(fd_write, b'x')
+    coroutines.run(coroutines.wait_for_fd_read(fd_read, timeout=1))
+    coroutines.run(coroutines.wait_for_fd_write(fd_write))
+
+    os.close(fd_read)
+    os.close(fd_write)
+
+    started = perf_counter()
+    coroutines.run(coroutines.sleep(0.05))
+    assert perf_counter() - started >= 0.05
+
+    # unsupported awaitable
+    class Foreign:
+        def __await__(self):
+            yield 'other'
+
+    async def foreign():
+        await Foreign()
+
+    with pytest.raises(RuntimeError, match='Unsupported'):
+        coroutines.run(foreign())
+
+
+def test_coroutines_connect():
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen()
+    host, port = server.getsockname()
+    address = f'{host}:{port}'
+
+    async def query():
+        fd = await coroutines.connect(address, timeout=1)
+        os.write(fd, b'ping')
+        await coroutines.wait_for_fd_read(fd, timeout=1)
+        return os.read(fd, 4)
+
+    @coroutines.wsgi
+    async def application(environ, start_response):
+        start_response('200 OK', [])
+        return [await query(), 'ok']
+
+    app = application({}, lambda *args: None)
+    assert next(app) == b''  # waiting for connection
+
+    conn, _ = server.accept()
+    conn.sendall(b'pong')
+    uwsgi.suspend()
+
+    chunks = []
+
+    for chunk in app:
+        if chunk:
+            chunks.append(chunk)
+
+        else:
+            # Emulate uWSGI async loop.
+            uwsgi.suspend()
+
+    assert chunks == [b'pong', b'ok']
+    assert conn.recv(4) == b'ping'
+
+    conn.close()
+    server.close()
+
+    with pytest.raises(ConnectionError):
+        coroutines.run(coroutines.connect(address, timeout=1))
+
+
+def test_coroutines_wsgi_start_response():
+    calls = []
+
+    @coroutines.wsgi
+    async def application(environ, start_response):
+        await coroutines.sleep(0)
+        start_response('200 OK', [])
+        await coroutines.sleep(0)
+        return 'ok'
+
+    app = application({}, lambda *args: calls.append('start_response'))
+
+    # Nothing is yielded before start_response is called.
+    assert next(app) == b''
+    assert calls == ['start_response']
+    assert list(app) == [b'ok']
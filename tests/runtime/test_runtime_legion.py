@@ -0,0 +1,32 @@
+from uwsgiconf.emulator.legion import cleanup, set_state
+from uwsgiconf.runtime.legion import Legion
+from uwsgiconf.runtime.task_utils import TaskChecker
+
+
+def test_legion():
+    cleanup()
+
+    legion = Legion('mylegion')
+    assert str(legion) == 'mylegion'
+    assert not legion.is_lord
+    assert legion.lord_scroll is None
+    assert legion.scrolls == []
+
+    @legion.lord_only
+    def func():
+        return 'done'
+
+    checker = TaskChecker(legion='mylegion', maintenance=False, env=False)
+
+    assert func() is None
+    assert checker.needs_skip('some')
+
+    set_state(legion='mylegion', scrolls=[b'lord', b'other'])
+
+    assert legion.is_lord
+    assert legion.lord_scroll == 'lord'
+    assert legion.scrolls == ['lord', 'other']
+    assert func() == 'done'
+    assert not checker.needs_skip('some')
+
+    cleanup()
@@ -1,4 +1,9 @@
-from uwsgiconf.runtime.locking import lock
+import os
+from time import perf_counter, sleep
+
+from uwsgiconf import uwsgi
+from uwsgiconf.emulator.sharedarea import cleanup
+from uwsgiconf.runtime.locking import Lock, RWLock, StripedLock, lock
 
 
 def test_locking():
@@ -16,3 +21,89 @@ def test_locking():
 
     assert int(my_lock) == 10
     assert not my_lock.is_set
+
+
+def test_locking_timeout(monkeypatch):
+    metrics = {}
+
+    def metric_inc(key, value=1):
+        metrics[key] = metrics.get(key, 0) + value
+
+    monkeypatch.setattr(uwsgi, 'metric_inc', metric_inc)
+
+    my_lock = Lock(5, metrics=True)
+    assert my_lock.try_acquire()
+    assert my_lock.is_set
+    assert not my_lock.try_acquire()
+
+    started = perf_counter()
+    assert not my_lock.acquire(timeout=0.05)
+    assert perf_counter() - started >= 0.05
+
+    my_lock.release()
+    assert my_lock.acquire(timeout=0.05)
+    my_lock.release()
+
+    assert metrics['lock.5.acquired'] == 2
+    assert set(metrics) == {'lock.5.acquired', 'lock.5.wait', 'lock.5.hold'}
+
+
+def test_striped_lock():
+
+    locks = StripedLock(range(1, 5))
+    assert len(locks) == 4
+    assert locks['user-1'] is locks.get('user-1')
+    assert {int(locks[f'user-{idx}']) for idx in range(100)} == {1, 2, 3, 4}
+
+    with locks[10]:
+        assert locks[10].is_set
+
+
+def test_rwlock():
+    cleanup()
+
+    rwlock = RWLock(6, starvation=0.05)
+
+    with rwlock.read:
+        assert rwlock.acquire_read(timeout=0.1)
+        assert rwlock.readers == 2
+        # writer waits for readers
+        assert not rwlock.acquire_write(timeout=0.05)
+        assert rwlock.writers == 0
+        assert not rwlock.lock.is_set
+        rwlock.release_read()
+
+    assert rwlock.readers == 0
+
+    @rwlock.write
+    def update():
+        assert rwlock.lock.is_set
+        assert not rwlock.acquire_read(timeout=0.05)
+        return 'done'
+
+    assert update() == 'done'
+
+    # a writer is waiting: a reader lets it go first, but not for too long
+    rwlock.area.inc(rwlock.pos_writers)
+    started = perf_counter()
+    assert rwlock.acquire_read()
+    assert perf_counter() - started >= 0.05
+    rwlock.release_read()
+    rwlock.area.dec(rwlock.pos_writers)
+
+    # processes
+    rwlock.acquire_write()
+
+    pid = os.fork()
+
+    if not pid:  # pragma: nocover
+        with rwlock.read:
+            rwlock.area.set_int(64, 1)
+        os._exit(0)
+
+    sleep(0.05)
+    assert rwlock.area.get_int(64) == 0  # reader waits for the writer
+    rwlock.release_write()
+    os.waitpid(pid, 0)
+    assert rwlock.area.get_int(64) == 1
+    assert rwlock.readers == 0
@@ -0,0 +1,190 @@
+import json
+import logging
+import re
+from time import sleep
+
+import pytest
+
+from uwsgiconf.presets.nice import Section
+from uwsgiconf.runtime.logging import BatchedHandler, JsonFormatter
+
+
+@pytest.fixture
+def written(monkeypatch):
+    messages = []
+    monkeypatch.setattr('uwsgiconf.runtime.logging.log_message', messages.append)
+    return messages
+
+
+@pytest.fixture
+def get_logger():
+    handlers = []
+
+    def get_logger_(handler: BatchedHandler) -> logging.Logger:
+        logger = logging.getLogger('uwsgiconf.tests.batched')
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+        handlers.append(handler)
+        return logger
+
+    yield get_logger_
+
+    logger = logging.getLogger('uwsgiconf.tests.batched')
+    for handler in handlers:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_json_formatter():
+    record = logging.makeLogRecord({
+        'name': 'mine', 'levelname': 'INFO', 'msg': 'hi %s', 'args': ('there',), 'created': 1749224823.443,
+        'user': 'me',
+    })
+    data = json.loads(JsonFormatter().format(record))
+
+    assert list(data) == ['dt', 'src', 'msg', 'ctx', 'ms']
+    assert data['dt'].startswith('2025-06-0')
+    assert data['src'] == 'python'
+    assert data['msg'] == 'hi there'
+    assert data['ctx'] == {'logger': 'mine', 'level': 'INFO', 'user': 'me'}
+    assert data['ms'] == 1749224823443
+
+
+def test_json_formatter_encoded(monkeypatch):
+    section = Section().configure_logging_json()
+    encoder = next(
+        line.partition(' json ')[2] for line in section.as_configuration().format(stamp=False).splitlines()
+        if line.startswith('log-encoder = json')
+    )
+
+    def encode(message: str) -> str:
+        # Emulates uWSGI json log encoder: ${msg} is escaped, other variables are replaced.
+        line = encoder.replace('${msg}', json.dumps(message)[1:-1])
+        return re.sub(r'\$\{[^}]+}', '1', line)
+
+    monkeypatch.setenv('UWSGICONF_LOG_ENCODED', '1')
+
+    record = logging.makeLogRecord({'name': 'mine', 'levelname': 'INFO', 'msg': 'hi', 'user': 'me'})
+    data = json.loads(encode(JsonFormatter().format(record)))
+
+    assert data['src'] == 'uwsgi.out'
+    assert data['msg'] == 'hi [logger=mine level=INFO user=me]'
+
+    # Not encoded by uWSGI.
+    monkeypatch.delenv('UWSGICONF_LOG_ENCODED')
+    assert json.loads(JsonFormatter().format(record))['msg'] == 'hi'
+    assert JsonFormatter(encoded=True).format(record) == 'hi [logger=mine level=INFO user=me]'
+
+
+def test_batched_handler(written, get_logger):
+    handler = BatchedHandler(capacity=3, interval=60_000)
+    logger = get_logger(handler)
+
+    logger.info('one')
+    logger.info('two')
+    assert written == []
+
+    handler.flush()
+    assert written == ['one', 'two']
+    written.clear()
+
+    # drop new
+    for idx in range(5):
+        logger.info('%s', idx)
+
+    logger.error('important')
+    handler.flush()
+    assert written == ['0', '1', '2', 'important', '2 log record(s) dropped: buffer is full']
+
+
+def test_batched_handler_policies(written, get_logger):
+    handler = BatchedHandler(capacity=2, interval=60_000, policy=BatchedHandler.POLICY_DROP_OLD, joined=True)
+    logger = get_logger(handler)
+
+    for idx in range(4):
+        logger.info('%s', idx)
+
+    handler.flush()
+    assert written == ['2\n3\n2 log record(s) dropped: buffer is full']
+    written.clear()
+
+    handler.policy = BatchedHandler.POLICY_SAMPLE
+    handler.sample_rate = 2
+
+    for idx in range(6):
+        logger.info('%s', idx)
+
+    handler.flush()
+    # 0 1 fill the buffer, then every second (3, 5) replaces the oldest.
+    assert written == ['3\n5\n4 log record(s) dropped: buffer is full']
+
+
+def test_batched_handler_thread(written, get_logger):
+    handler = BatchedHandler(interval=1)
+    logger = get_logger(handler)
+    logger.info('threaded')
+
+    for _ in range(100):
+        if written:
+            break
+        sleep(0.01)
+
+    assert written == ['threaded']
+
+
+def test_request_log_sampler(monkeypatch):
+    from uwsgiconf import uwsgi
+    from uwsgiconf.runtime.logging import RequestLogSampler
+
+    logged = []
+    request_vars = {}
+    metrics = {}
+
+    monkeypatch.setattr(uwsgi, 'log_this_request', lambda: logged.append(request_vars.copy()))
+    monkeypatch.setattr(uwsgi, 'add_var', request_vars.__setitem__)
+    monkeypatch.setattr(uwsgi, 'metric_get', metrics.get)
+    monkeypatch.setattr(uwsgi, 'metric_set', metrics.__setitem__)
+
+    closed = []
+    delay = []
+
+    class Response(list):
+        def close(self):
+            closed.append(True)
+
+    def app(environ, start_response):
+        start_response(environ['STATUS'], [])
+        if delay:
+            sleep(delay[0])
+        return Response([b'ok'])
+
+    sampler = RequestLogSampler(app, rate=3, slower=50)
+
+    def request(status='200 OK'):
+        response = sampler({'STATUS': status}, lambda *args: None)
+        assert list(response) == [b'ok']
+        response.close()
+
+    for _ in range(6):
+        request()
+
+    assert len(closed) == 6
+    assert logged == [{'UWSGICONF_LOG_SAMPLE': '3'}] * 2
+    logged.clear()
+
+    request('404 Not Found')
+    assert logged == [{'UWSGICONF_LOG_SAMPLE': '1'}]
+    logged.clear()
+
+    delay.append(0.06)
+    request()
+    assert logged == [{'UWSGICONF_LOG_SAMPLE': '1'}]
+    logged.clear()
+    delay.clear()
+
+    # tuned at runtime
+    RequestLogSampler.set_rate(1)
+    request()
+    request()
+    assert logged == [{'UWSGICONF_LOG_SAMPLE': '1'}] * 2
@@ -1,4 +1,9 @@
-from uwsgiconf.runtime.monitoring import Metric, register_file_monitor
+import os
+import signal
+
+from uwsgiconf import uwsgi
+from uwsgiconf.runtime import monitoring
+from uwsgiconf.runtime.monitoring import MemoryWatchdog, Metric, register_file_monitor
 
 
 def test_metric():
@@ -22,3 +27,74 @@ def test_file_monitor():
     @register_file_monitor('/here/there.file')
     def handle_file_modification(sig_num):
         pass
+
+
+def test_memory_watchdog(monkeypatch):
+    from uwsgiconf.emulator.caching import clear
+
+    metrics = {}
+    monkeypatch.setattr(uwsgi, 'metric_set', metrics.__setitem__)
+    monkeypatch.setattr(uwsgi, 'metric_inc', lambda key, value=1: metrics.__setitem__(key, metrics.get(key, 0) + value))
+    monkeypatch.setattr(uwsgi, 'worker_id', lambda: 1)
+
+    killed = []
+    monkeypatch.setattr(os, 'kill', lambda pid, sig: killed.append(sig))
+
+    rss = [100 * 1024 * 1024]
+
+    def mem():
+        rss[0] += 1024 * 1024  # 1 MB per sample
+        return rss[0], 0
+
+    monkeypatch.setattr(uwsgi, 'mem', mem)
+
+    clock = iter(range(120, 10000, 30))
+    monkeypatch.setattr(monitoring, 'monotonic', lambda: next(clock))
+
+    watchdog = MemoryWatchdog(limit=200, window=4, horizon=600, cache='memwatch', metrics=True)
+    watchdog.register()
+
+    # no trend yet
+    assert watchdog.leak_rate == 0
+    assert watchdog.get_eta() is None
+
+    for at in range(4):
+        watchdog.sample(at=at * 30)
+
+    assert watchdog.leak_rate == 1024 * 1024 / 30
+    assert watchdog.get_eta() == 96 * 30
+
+    # the limit is far
+    assert not watchdog.check()
+    assert metrics['memwatch.1.leak'] == 120 * 1024 * 1024
+    assert not killed
+
+    # the limit is close
+    rss[0] = 199 * 1024 * 1024
+    assert watchdog.check()
+    assert killed == [signal.SIGHUP]
+    assert metrics['memwatch.1.recycled'] == 1
+    assert not watchdog.samples
+
+    # cooldown: another worker is not recycled
+    for at in range(4):
+        watchdog.sample(198 * 1024 * 1024 + at * 1024 * 1024, at=at * 30)
+
+    assert not watchdog.recycle()
+    assert len(killed) == 1
+
+    clear(cache='memwatch')
+
+
+def test_memory_watchdog_horizon():
+    watchdog = MemoryWatchdog(limit=100, horizon=100, jitter=0.5)
+    horizons = {watchdog.get_horizon(worker_id) for worker_id in range(1, 9)}
+    assert len(horizons) == 8
+    assert all(50 <= horizon <= 100 for horizon in horizons)
+
+    # memory is not growing
+    for at in range(3):
+        watchdog.sample(10, at=at)
+
+    assert watchdog.leak_rate == 0
+    assert watchdog.get_eta() is None
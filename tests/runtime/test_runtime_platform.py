@@ -1,3 +1,8 @@
+import gc
+import os
+import sys
+
+from uwsgiconf.runtime import platform as platform_module
 from uwsgiconf.runtime.platform import uwsgi
 
 
@@ -26,3 +31,70 @@ def test_platform_stub():
     uwsgi.postfork_hooks.run()
     assert len(hooked) == 1
     assert hooked[0] == 'yes'
+
+
+def test_memory_details(monkeypatch):
+    import sys
+
+    details = uwsgi.get_memory_details()
+
+    if sys.platform == 'linux':
+        assert details['rss'] > 0
+        assert details['pss'] > 0
+        assert details['uss'] + details['shared'] == details['rss']
+
+    assert uwsgi.get_memory_details(-1) == {}
+
+    workers = ({'id': 1, 'pid': os.getpid()}, {'id': 2, 'pid': -1})
+    monkeypatch.setattr(platform_module._uwsgi, 'workers', lambda: workers)
+    assert uwsgi.workers_memory == ({1: details} if details else {})
+
+
+def test_freeze_gc_on_fork(monkeypatch):
+    hooks = list(uwsgi.postfork_hooks.funcs)
+
+    try:
+        sys.modules.pop('uwsgiconf.runtime.prefork', None)
+        import uwsgiconf.runtime.prefork  # noqa: F401
+
+        assert not gc.isenabled()
+        assert not gc.get_freeze_count()
+
+        # after fork
+        uwsgi.postfork_hooks.run()
+        assert gc.get_freeze_count()
+        assert gc.isenabled()
+
+        # lazy mode: in a worker
+        monkeypatch.setattr(platform_module._uwsgi, 'worker_id', lambda: 1)
+        platform_module.freeze_gc_on_fork()
+        assert gc.isenabled()
+
+    finally:
+        gc.unfreeze()
+        gc.enable()
+        uwsgi.postfork_hooks.funcs[:] = hooks
+
+
+def test_freeze_gc(monkeypatch):
+    hooks = list(uwsgi.postfork_hooks.funcs)
+
+    try:
+        gc.disable()
+        platform_module.freeze_gc()
+        assert gc.get_freeze_count()
+        assert not gc.isenabled()
+
+        uwsgi.postfork_hooks.run()
+        assert gc.isenabled()
+
+        # lazy mode: in a worker
+        gc.disable()
+        monkeypatch.setattr(platform_module._uwsgi, 'worker_id', lambda: 1)
+        platform_module.freeze_gc()
+        assert gc.isenabled()
+
+    finally:
+        gc.unfreeze()
+        gc.enable()
+        uwsgi.postfork_hooks.funcs[:] = hooks
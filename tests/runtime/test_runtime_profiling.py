@@ -0,0 +1,85 @@
+from pathlib import Path
+from time import sleep
+
+from uwsgiconf.runtime.profiling import Profiler, format_profile, merge_profiles, read_profile
+from uwsgiconf.runtime.signals import REGISTERED_SIGNALS
+
+
+def busy_loop(seconds: float):
+    sleep(seconds)
+
+
+def test_profiler(tmp_path):
+    profiler = Profiler(dir=tmp_path, interval=0.001, duration=0.1)
+    assert not profiler.is_running
+
+    assert profiler.start()
+    assert profiler.is_running
+    assert not profiler.start()  # already running
+
+    busy_loop(0.2)
+    profiler.join()
+    assert not profiler.is_running
+
+    paths = list(tmp_path.glob('profile-0-*.collapsed'))
+    assert len(paths) == 1
+
+    stacks = read_profile(paths[0])
+    stack, count = stacks.most_common(1)[0]
+    assert 'test_profiler' in stack
+    assert stack.split(';')[-1].startswith('busy_loop (')
+    assert count > 10
+
+    # merge
+    merged = merge_profiles([paths[0], paths[0]])
+    assert merged[stack] == count * 2
+    assert format_profile(merged).startswith(f'{stack} {count * 2}\n')
+
+
+def test_profiler_trigger(tmp_path):
+    trigger = tmp_path / 'uwsgi.profile'
+
+    profiler = Profiler(interval=0.001)
+    profiler.register(trigger)
+
+    assert trigger.exists()
+    assert profiler.dir == tmp_path
+
+    signal = REGISTERED_SIGNALS[max(REGISTERED_SIGNALS)]
+    assert signal.target == 'workers'
+
+    trigger.write_text('0.05')
+    signal.func()
+    assert profiler.is_running
+    profiler.join()
+
+    assert list(tmp_path.glob('profile-*.collapsed'))
+
+
+def test_profiler_on_slow(tmp_path):
+    profiler = Profiler(dir=tmp_path, interval=0.001)
+
+    @profiler.on_slow(1)
+    def fast():
+        return 'fast'
+
+    assert fast() == 'fast'
+    assert fast.__name__ == 'fast'
+    assert not profiler._slow  # deregistered on exit
+
+    # One watcher thread serves all the calls.
+    watcher = profiler._slow_watcher
+    assert watcher.is_alive()
+    assert fast() == 'fast'
+    assert profiler._slow_watcher is watcher
+
+    sleep(0.05)
+    assert not profiler.is_running
+
+    with profiler.on_slow(0.01, duration=0.05):
+        sleep(0.05)
+
+    assert profiler.is_running
+    profiler.join()
+
+    assert Path(next(tmp_path.glob('profile-*.collapsed'))).read_text()
@@ -0,0 +1,65 @@
+import os
+from time import sleep
+
+import pytest
+
+from uwsgiconf.emulator.queue import cleanup
+from uwsgiconf.runtime.queue import Queue
+
+
+@pytest.fixture
+def queue():
+    cleanup()
+    yield Queue(poll_interval=0.01)
+    cleanup()
+
+
+def test_queue(queue):
+
+    assert queue.size == 100
+    assert queue.pull() is None
+    assert queue.pop() is None
+    assert queue.pull(timeout=0.02) is None
+
+    assert not queue.push(b'')
+    assert not queue.push(b'x' * 8192)
+
+    assert queue.push('one')
+    assert queue.push_many([b'two', 'three', b'', b'four']) == 2
+    assert queue.slot == 3
+    assert queue.pull_slot == 0
+    assert queue.get_last(2) == [b'three', b'two']
+    assert queue[1] == b'two'
+
+    # FIFO
+    assert queue.pull() == b'one'
+    assert queue.pull_slot == 1
+
+    # LIFO
+    assert queue.pop() == b'three'
+    assert queue.slot == 2
+
+    assert queue.pull_many(10) == [b'two']
+    assert queue.pull_many(10) == []
+
+    queue[50] = 'fifty'
+    assert queue.get(50) == b'fifty'
+    assert queue.get(500) is None
+
+    # ring
+    queue.push_many(f'{idx}' for idx in range(150))
+    assert queue.get_last(1) == [b'149']
+
+
+def test_queue_processes(queue):
+
+    pid = os.fork()
+
+    if not pid:  # pragma: nocover
+        sleep(0.05)
+        queue.push_many([b'from', b'child'])
+        os._exit(0)
+
+    assert queue.pull(timeout=5) == b'from'
+    os.waitpid(pid, 0)
+    assert queue.pull_many(2) == [b'child']
@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+from uwsgiconf.emulator.sharedarea import cleanup
+from uwsgiconf.runtime.sharedarea import SharedArea
+
+
+@pytest.fixture
+def area():
+    cleanup()
+    yield SharedArea()
+    cleanup()
+
+
+def test_sharedarea(area):
+
+    area.write(0, b'abc')
+    assert area.read(0, 3) == b'abc'
+    assert area.read(1, 2) == b'bc'
+
+    with pytest.raises(ValueError, match='Invalid position'):
+        area.read(65535, 10)
+
+    area.set_int(8, 10)
+    area.inc(8, 5)
+    area.dec(8)
+    assert area.get_int(8) == 14
+
+    # integers are signed as in uWSGI
+    area.set_int(16, 255, bits=8)
+    assert area.get_int(16, bits=8) == -1
+
+    area.set_int(16, 2 ** 31 - 1, bits=32)
+    area.inc(16, bits=32)
+    assert area.get_int(16, bits=32) == -2 ** 31
+    area.set_int(16, 0, bits=32)
+
+    with pytest.raises(ValueError, match='Unsupported integer size'):
+        area.inc(16, bits=8)
+
+    with pytest.raises(ValueError, match='Unsupported integer size'):
+        area.get_int(16, bits=12)
+
+    # typed view shares memory
+    view = area.get_view('Q', offset=8, count=2)
+    assert view.tolist() == [14, 0]
+    view[0] += 1
+    assert area.get_int(8) == 15
+    assert len(area.get_view('d')) == 8192
+
+    table = area.get_table('?I', offset=64, count=3)
+    assert len(table) == 3
+    assert table.size == 24
+
+    with area.writing():
+        table[1] = (True, 42)
+
+    with area.reading():
+        assert table[1] == (True, 42)
+        assert list(table) == [(False, 0), (True, 42), (False, 0)]
+
+    with pytest.raises(IndexError):
+        table[3]
+
+    with pytest.raises(ValueError, match='does not fit'):
+        area.get_table('Q', offset=65536, count=1)
+
+
+def test_sharedarea_processes(area):
+
+    area.set_int(0, 1)
+
+    pid = os.fork()
+
+    if not pid:  # pragma: nocover
+        area.inc(0, 10)
+        area.get_view('Q')[1] = 7
+        os._exit(0)
+
+    os.waitpid(pid, 0)
+
+    assert area.get_int(0) == 11
+    assert area.get_int(8) == 7
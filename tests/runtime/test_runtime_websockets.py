@@ -0,0 +1,39 @@
+from uwsgiconf.runtime.websockets import Broadcast
+
+
+def test_broadcast():
+
+    broadcast = Broadcast('news', cache='bcast', size=3, backlog=4).register()
+
+    assert broadcast.publish('one', b'two') == 2
+    assert broadcast.read(0) == (2, ['one', b'two'])
+    assert broadcast.read(1) == (2, [b'two'])
+
+    # ring overflow: the oldest are lost
+    broadcast.publish('three', 'four', notify=False)
+    assert broadcast.read(0) == (4, [b'two', 'three', 'four'])
+
+    # nobody listens
+    assert broadcast.dispatch() == 0
+
+    sub1 = broadcast.subscribe()
+    sub2 = broadcast.subscribe()
+    assert sub1.drain() == []
+
+    # signal delivered to workers dispatches messages
+    broadcast.publish('five')
+    broadcast.publish('six', 'seven')
+    assert sub1.drain() == ['five', 'six', 'seven']
+    assert sub1.drain() == []
+
+    # slow client
+    broadcast.publish('eight', 'nine')
+    assert sub2.drain() == ['six', 'seven', 'eight', 'nine']
+    assert sub2.dropped == 1
+
+    sub1.close()
+    sub2.close()
+    assert not broadcast.subscribers
+
+    broadcast.publish('ten')
+    assert broadcast.dispatch() == 0
@@ -0,0 +1,97 @@
+import os
+import sys
+
+import pytest
+
+from uwsgiconf.confcache import ConfCache, main
+from uwsgiconf.config import Section
+from uwsgiconf.settings import ENV_CONF_CACHE_DIR, ENV_CONF_READY
+from uwsgiconf.utils import UwsgiRunner
+
+CONF_MODULE = '''
+from pathlib import Path
+
+from uwsgiconf.config import Section, configure_uwsgi
+
+import confcache_helper
+
+with (Path(__file__).parent / 'runs.log').open('a') as f:
+    f.write('run\\n')
+
+
+configure_uwsgi(lambda: Section(name='cached').env('A', confcache_helper.VALUE).as_configuration(alias='mine'))
+'''
+
+
+@pytest.fixture
+def conf_module(tmp_path, monkeypatch):
+    monkeypatch.setenv(ENV_CONF_CACHE_DIR, f'{tmp_path / "cache"}')
+
+    (tmp_path / 'confcache_helper.py').write_text("VALUE = 'one'\n")
+    fpath = tmp_path / 'uwsgicfg.py'
+    fpath.write_text(CONF_MODULE)
+
+    yield fpath
+
+    os.environ.pop(ENV_CONF_READY, None)
+    sys.modules.pop('confcache_helper', None)
+
+
+def get_runs(fpath) -> int:
+    return len((fpath.parent / 'runs.log').read_text().splitlines())
+
+
+def load(fpath) -> str:
+    # Simulate a fresh loader process.
+    os.environ.pop(ENV_CONF_READY, None)
+    sys.modules.pop('confcache_helper', None)
+    return ConfCache(fpath, alias='mine').load()
+
+
+def test_confcache(conf_module, monkeypatch):
+
+    ini = load(conf_module)
+    assert '[cached]' in ini
+    assert 'env = A=one' in ini
+    assert get_runs(conf_module) == 1
+
+    # hit
+    assert load(conf_module) == ini
+    assert get_runs(conf_module) == 1
+
+    # touched but unchanged
+    os.utime(conf_module, ns=(1, 1))
+    assert load(conf_module) == ini
+    assert get_runs(conf_module) == 1
+
+    # dependency changed
+    (conf_module.parent / 'confcache_helper.py').write_text("VALUE = 'two'\n")
+    ini = load(conf_module)
+    assert 'env = A=two' in ini
+    assert get_runs(conf_module) == 2
+
+    # relevant env changed
+    monkeypatch.setenv('UWSGICONF_SOME', '1')
+    load(conf_module)
+    assert get_runs(conf_module) == 3
+
+    # irrelevant env changed
+    monkeypatch.setenv('SOME_OTHER', '1')
+    load(conf_module)
+    assert get_runs(conf_module) == 3
+
+
+def test_confcache_main(conf_module, capsys):
+    os.environ.pop(ENV_CONF_READY, None)
+    main([f'{conf_module}', '--conf', 'mine'])
+    out, _ = capsys.readouterr()
+    assert 'env = A=one' in out
+
+
+def test_confcache_spawn(monkeypatch):
+    spawned = []
+    monkeypatch.setattr(os, 'spawnvp', lambda *args: spawned.append(args))
+
+    UwsgiRunner().spawn(Section().as_configuration(alias='mine'), filepath='/here/uwsgicfg.py', cached=True)
+
+    assert spawned[0][2][-1].endswith(' -m uwsgiconf.confcache /here/uwsgicfg.py --conf mine')
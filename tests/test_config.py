@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 from tempfile import NamedTemporaryFile, gettempdir
 
 import pytest
@@ -8,6 +10,39 @@ from uwsgiconf.exceptions import ConfigurationError
 from uwsgiconf.presets.nice import Section as NiceSection
 
 
+def test_import_time():
+    # Budget (microseconds) for `import uwsgiconf.config`. Generous to tolerate slow CI hosts.
+    budget = 300_000
+
+    code = (
+        'import sys, uwsgiconf.config; '
+        'print(",".join(name for name in sys.modules if name.startswith("uwsgiconf.options.")))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True
+    )
+
+    # Options groups modules are imported on first access.
+    assert result.stdout.strip() == ''
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit():
+            timings[name.strip()] = int(cumulative)
+
+    assert timings['uwsgiconf.config'] < budget
+
+    # Heavy modules are imported only when used.
+    assert 'concurrent.futures.process' not in timings
+
+    # Options are still available on access.
+    assert Section.routing.__name__ == 'Routing'
+
+    from uwsgiconf.config import Workers
+    assert Workers is Section.workers
+
+
 def test_section_basics(assert_lines):
 
     assert_lines('set-placeholder = one=two', Section().set_placeholder('one', 'two'))
@@ -0,0 +1,102 @@
+import gzip
+
+import pytest
+
+from uwsgiconf.config import Section
+from uwsgiconf.exceptions import ConfigurationError
+from uwsgiconf.logstat import FORMAT_JSON_MSG, LogParser, LogStat, Sketch
+from uwsgiconf.presets.nice import Section as NiceSection
+
+LINE_DEFAULT = (
+    b'[pid: 10|app: 0|req: 1/2] 127.0.0.1 () {34 vars in 456 bytes} [Mon Jun  6 22:47:03 2025] '
+    b'GET /users/123/?a=b => generated 12 bytes in %d msecs (HTTP/1.1 %d) 2 headers in 64 bytes '
+    b'(1 switches on core 0)\n'
+)
+
+
+def test_log_parser():
+    parsed = LogParser().parse(LINE_DEFAULT % (5, 200))
+    assert parsed['method'] == b'GET'
+    assert parsed['uri'] == b'/users/123/?a=b'
+    assert parsed['msecs'] == b'5'
+    assert parsed['status'] == b'200'
+
+    assert LogParser().parse(b'*** Starting uWSGI ***') is None
+
+    # sendfile
+    assert LogParser().parse(
+        LINE_DEFAULT.replace(b'msecs (', b'msecs (via sendfile) (') % (5, 200))['status'] == b'200'
+
+    parser = LogParser('%(method) %(uri) -> %(status) %(micros)us %(var.SOME)', fields=None)
+    parsed = parser.parse(b'POST /a/ -> 201 1500us x y')
+    assert parsed['micros'] == b'1500'
+    assert parsed['var_SOME'] == b'x y'
+
+    # from section: json
+    section = NiceSection()
+    section.configure_logging_json(tpl_msg='%(method) %(uri) %(status) %(msecs)')
+    parser = LogParser.from_section(section)
+    assert parser.json_src == 'uwsgi.req'
+    assert parser.parse(b'{"src": "uwsgi.req", "msg": "GET /a/ 404 7"}')['msecs'] == b'7'
+    assert parser.parse(b'{"src": "uwsgi.out", "msg": "GET /a/ 404 7"}') is None
+    assert parser.parse(b'plain') is None
+
+    # from section: json default
+    section = NiceSection()
+    section.configure_logging_json()
+    parser = LogParser.from_section(section)
+    assert parser.template == FORMAT_JSON_MSG
+    assert parser.parse(b'{"src": "uwsgi.req", "msg": "GET /a/ -> 200 in 12 msecs"}')['msecs'] == b'12'
+
+    # from section: default
+    assert LogParser.from_section(Section()).template == LogParser().template
+
+
+def test_sketch():
+    sketch = Sketch()
+
+    for value in range(1, 10001):
+        sketch.add(value)
+
+    assert sketch.count == 10000
+    assert abs(sketch.quantile(0.5) - 5000) / 5000 < 0.01
+    assert abs(sketch.quantile(0.99) - 9900) / 9900 < 0.01
+    assert sketch.quantile(1) == 10000
+    assert len(sketch.buckets) < 500
+
+    assert Sketch().quantile(0.5) == 0
+
+
+def test_log_stat(tmp_path):
+    lines = [LINE_DEFAULT % (duration, 200) for duration in range(1, 101)]
+    lines.append(LINE_DEFAULT.replace(b'/users/123/', b'/about/') % (1000, 404))
+    lines.append(b'some other line\n')
+
+    fpath = tmp_path / 'uwsgi.log'
+    fpath.write_bytes(b''.join(lines))
+
+    fpath_gz = tmp_path / 'uwsgi.log.1.gz'
+    fpath_gz.write_bytes(gzip.compress(b''.join(lines)))
+
+    (tmp_path / 'empty.log').write_bytes(b'')
+
+    stat = LogStat(max_routes=1)
+    assert stat.feed_files([fpath, fpath_gz, tmp_path / 'empty.log']) == 202
+    assert stat.lines == 204
+
+    route, other = stat.get_rows()
+    assert route.key == 'GET /users/<id>/'
+    assert route.count == 200
+    assert 49 < route.p50 < 51
+    assert route.max == 100
+    assert other.key == '<other>'
+
+    assert [(row.key, row.count) for row in stat.get_rows(by='status')] == [('200', 200), ('404', 2)]
+
+    # No duration in template.
+    with pytest.raises(ConfigurationError, match='no request duration'):
+        LogStat(LogParser('%(method) %(uri) -> %(status)'))
+
+    report = stat.format_report(by='status')
+    assert 'Requests: 202' in report
+    assert '404' in report
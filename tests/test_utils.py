@@ -1,15 +1,19 @@
 import os
+import sys
 from pathlib import Path
 
 import pytest
 
 from uwsgiconf.exceptions import UwsgiconfException
 from uwsgiconf.utils import (
+    PRECOMPRESS_MANIFEST,
     ConfModule,
     UwsgiRunner,
+    compile_modules,
     filter_locals,
     get_uwsgi_stub_attrs_diff,
     parse_command_plugins_output,
+    precompress_statics,
 )
 
 SAMPLE_OUT_PLUGINS_MANY = b'''
@@ -71,6 +75,46 @@ def test_runner(mock_popen):
     assert len(plugins.request) == 2
 
 
+def test_runner_plugins_cache(mock_popen, tmp_path, monkeypatch):
+    monkeypatch.setenv('UWSGICONF_CONF_CACHE_DIR', f'{tmp_path}')
+    monkeypatch.setattr(UwsgiRunner, '_plugins_cache', {})
+
+    calls = []
+
+    def communicate():
+        calls.append(True)
+        return SAMPLE_OUT_PLUGINS_MANY, ''
+
+    mock_popen(communicate)
+
+    binary = tmp_path / 'uwsgi'
+    binary.write_text('')
+    binary.chmod(0o755)
+
+    def get_plugins():
+        return UwsgiRunner(f'{binary}').get_plugins(cached=True)
+
+    plugins = get_plugins()
+    assert len(plugins.generic) == 3
+    assert get_plugins() == plugins
+    assert len(calls) == 1
+
+    # from disk
+    monkeypatch.setattr(UwsgiRunner, '_plugins_cache', {})
+    assert get_plugins() == plugins
+    assert len(calls) == 1
+    assert '"version": "2.0.15"' in (tmp_path / 'plugins.json').read_text()
+
+    # binary changed
+    binary.write_text('#')
+    assert get_plugins() == plugins
+    assert len(calls) == 2
+
+    # unknown binary
+    UwsgiRunner(f'{tmp_path / "nope"}').get_plugins(cached=True)
+    assert len(calls) == 3
+
+
 def test_conf_module_compile():
     # invalid objects
     module = ConfModule(Path(__file__).parent / 'confs' / 'dummy.py')
@@ -105,6 +149,167 @@ def test_conf_module_run(monkeypatch):
     assert all(executed)
 
 
+def test_compile_modules(tmp_path):
+
+    for idx in range(3):
+        vassal_dir = tmp_path / f'vassal{idx}'
+        vassal_dir.mkdir()
+        (vassal_dir / 'uwsgicfg.py').write_text(
+            'from uwsgiconf.config import Section, configure_uwsgi\n'
+            f"configure_uwsgi(lambda: Section().env('IDX', '{idx}'))\n"
+        )
+
+    (tmp_path / 'vassal2' / 'uwsgicfg.py').write_text('raise ValueError("broken")')
+
+    assert len(ConfModule.find(tmp_path / 'vassal*' / 'uwsgicfg.py')) == 3
+
+    def compile_(jobs):
+        modules = ConfModule.find(tmp_path / 'vassal*' / 'uwsgicfg.py')
+        return {f'{result.module.parent.name}': result for result in compile_modules(modules, jobs=jobs)}
+
+    for jobs in (2, 1):
+        results = compile_(jobs=jobs)
+        assert results['vassal2'].error == 'ValueError: broken'
+        assert results['vassal0'].duration > 0
+
+    ini = tmp_path / 'vassal0' / 'uwsgicfg.ini'
+    assert results['vassal0'].unchanged == [ini]
+
+    # Same named modules from different directories are not mixed.
+    assert 'IDX=0' in ini.read_text()
+    assert 'IDX=1' in (tmp_path / 'vassal1' / 'uwsgicfg.ini').read_text()
+
+    # Unchanged files are not rewritten.
+    mtime = ini.stat().st_mtime_ns
+    (tmp_path / 'vassal1' / 'uwsgicfg.py').write_text(
+        "from uwsgiconf.config import Section, configure_uwsgi\nconfigure_uwsgi(lambda: Section().env('IDX', '5'))\n")
+    results = compile_(jobs=1)
+    assert not results['vassal0'].written
+    assert ini.stat().st_mtime_ns == mtime
+    assert results['vassal1'].written == [tmp_path / 'vassal1' / 'uwsgicfg.ini']
+
+    # Module with several configurations.
+    written, unchanged = ConfModule(Path(__file__).parent / 'confs' / 'dummy.py').compile(tmp_path)
+    assert sorted(fpath.name for fpath in written) == ['confs_dummy_uwsgicfg.ini', 'confs_dummy_uwsgicgf_test1.ini']
+    assert not unchanged
+
+
+def test_conf_module_load(tmp_path):
+    (tmp_path / 'json.py').write_text('VALUE = 1\n')
+
+    module = ConfModule.load(tmp_path / 'json.py')
+    assert module.VALUE == 1
+
+    # Already imported modules of the same name are not shadowed.
+    import json
+    assert sys.modules['json'] is json
+
+
+def test_compile_modules_target(tmp_path):
+    target = tmp_path / 'vassals'
+    target.mkdir()
+
+    for name in ('one', 'two'):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / 'uwsgicfg.py').write_text(
+            'from uwsgiconf.config import Section, configure_uwsgi\n'
+            f"configure_uwsgi(lambda: Section().env('NAME', '{name}'))\n"
+        )
+
+    modules = ConfModule.find(tmp_path / '*' / 'uwsgicfg.py')
+    results = compile_modules(modules, target_dir=target, jobs=2)
+    assert [result.written for result in results] == [[target / 'one.ini'], [target / 'two.ini']]
+    assert 'NAME=one' in (target / 'one.ini').read_text()
+    assert 'NAME=two' in (target / 'two.ini').read_text()
+
+    # Nothing is rewritten on the next run.
+    results = compile_modules(modules, target_dir=target, jobs=1)
+    assert [result.unchanged for result in results] == [[target / 'one.ini'], [target / 'two.ini']]
+
+    # Modules clashing for the same target file fail.
+    (tmp_path / 'deeper' / 'one').mkdir(parents=True)
+    (tmp_path / 'deeper' / 'one' / 'uwsgicfg.py').write_text((tmp_path / 'two' / 'uwsgicfg.py').read_text())
+    modules = [*modules, ConfModule(tmp_path / 'deeper' / 'one' / 'uwsgicfg.py')]
+
+    results = compile_modules(modules, target_dir=target, jobs=2)
+    assert 'clashes' in results[0].error
+    assert 'clashes' in results[2].error
+    assert not results[1].error
+    assert 'NAME=one' in (target / 'one.ini').read_text()
+
+
+def test_precompress_statics(tmp_path):
+    import gzip
+
+    css = b'body {color: red;}\n' * 100
+    (tmp_path / 'sub' / 'deep').mkdir(parents=True)
+    (tmp_path / 'sub' / 'app.css').write_bytes(css)
+    (tmp_path / 'sub' / 'deep' / 'lib.js').write_bytes(b'var c = 3;\n' * 100)
+    (tmp_path / 'small.js').write_bytes(b'var a;')
+    (tmp_path / 'image.png').write_bytes(b'x' * 1000)
+    (tmp_path / 'gone.js').write_bytes(b'var a = 1;\n' * 100)
+
+    result = precompress_statics(tmp_path)
+    assert sorted(fpath.name for fpath in result.written) == ['app.css.gz', 'gone.js.gz', 'lib.js.gz']
+    assert result.unchanged == 0
+    assert gzip.decompress((tmp_path / 'sub' / 'app.css.gz').read_bytes()) == css
+    assert not (tmp_path / 'small.js.gz').exists()
+    assert not (tmp_path / 'image.png.gz').exists()
+
+    mtime = (tmp_path / 'sub' / 'app.css').stat().st_mtime
+    assert (tmp_path / 'sub' / 'app.css.gz').stat().st_mtime == mtime
+
+    # Only changed files are compressed, stale ones are removed.
+    (tmp_path / 'gone.js').unlink()
+    (tmp_path / 'sub' / 'app.css').touch()
+    (tmp_path / 'new.js').write_bytes(b'var b = 2;\n' * 100)
+
+    result = precompress_statics([tmp_path], jobs=1)
+    assert [fpath.name for fpath in result.written] == ['new.js.gz']
+    assert result.unchanged == 2
+    assert [fpath.name for fpath in result.removed] == ['gone.js.gz']
+    assert not list(tmp_path.glob('.uwsgiconf*.gz'))  # Manifest is not compressed.
+    assert not (tmp_path / 'gone.js.gz').exists()
+
+
+def test_precompress_statics_cache(tmp_path, monkeypatch):
+    import shutil
+
+    statics = tmp_path / 'static'
+    cache = tmp_path / 'cache'
+
+    def collect():
+        # Emulates `collectstatic --clear`.
+        shutil.rmtree(statics, ignore_errors=True)
+        (statics / 'sub').mkdir(parents=True)
+        (statics / 'sub' / 'app.css').write_bytes(b'body {color: red;}\n' * 100)
+        (statics / 'app.js').write_bytes(b'var a = 1;\n' * 100)
+
+    collect()
+    result = precompress_statics(statics, cache_dir=cache)
+    assert sorted(fpath.name for fpath in result.written) == ['app.css.gz', 'app.js.gz']
+    assert not (statics / PRECOMPRESS_MANIFEST).exists()
+    assert len(list(cache.glob('*.gz'))) == 2
+
+    # Cleared files are restored from cache without compression.
+    compressed = []
+    monkeypatch.setattr('gzip.compress', lambda data, **kwargs: compressed.append(data) or b'')
+
+    collect()
+    result = precompress_statics(statics, cache_dir=cache)
+    assert sorted(fpath.name for fpath in result.written) == ['app.css.gz', 'app.js.gz']
+    assert result.unchanged == 2
+    assert not compressed
+
+    monkeypatch.undo()
+
+    # Cached contents for gone files are dropped.
+    (statics / 'app.js').write_bytes(b'var b = 2;\n' * 100)
+    result = precompress_statics(statics, cache_dir=cache)
+    assert [fpath.name for fpath in result.written] == ['app.js.gz']
+    assert len(list(cache.glob('*.gz'))) == 2
+
+
 def test_get_uwsgi_stub_attrs_diff():
 
     with pytest.raises(UwsgiconfException):
@@ -0,0 +1,64 @@
+#! /usr/bin/env python
+"""Broadcast fan-out benchmark with emulated websocket connections.
+
+Runs on uWSGI stub: publishing, dispatching and per connection draining
+are measured, while sending to a socket is a no-op.
+
+NOTE: Run from project root: python tools/bench_broadcast.py --connections 5000
+
+"""
+import resource
+from argparse import ArgumentParser
+from time import perf_counter
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument('--connections', type=int, default=5000)
+    parser.add_argument('--messages', type=int, default=1000)
+    parser.add_argument('--batch', type=int, default=10, help='Messages published at once.')
+    args = parser.parse_args()
+
+    import os
+    import sys
+
+    os.environ['UWSGICONF_FORCE_STUB'] = '1'
+    sys.path.insert(0, 'src')
+
+    from uwsgiconf.runtime.websockets import Broadcast, send
+
+    # Every emulated connection holds a file descriptor.
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (max(soft, min(hard, args.connections + 100)), hard))
+
+    broadcast = Broadcast('bench', size=args.messages + 1).register()
+    subscribers = [broadcast.subscribe() for _ in range(args.connections)]
+
+    payload = '{"event": "update", "id": 12345, "data": "%s"}' % ('x' * 100)
+    batch = [payload] * args.batch
+
+    time_publish = 0.0
+    time_fanout = 0.0
+    sent = 0
+
+    for _ in range(args.messages // args.batch):
+        started = perf_counter()
+        # Stub delivers the signal synchronously, so this includes dispatching.
+        broadcast.publish(*batch)
+        time_publish += perf_counter() - started
+
+        started = perf_counter()
+
+        for subscriber in subscribers:
+            for message in subscriber.drain():
+                send(message=message)
+                sent += 1
+
+        time_fanout += perf_counter() - started
+
+    for subscriber in subscribers:
+        subscriber.close()
+
+    print(f'Connections: {args.connections}. Messages: {args.messages} (by {args.batch})')
+    print(f'Publish + dispatch: {time_publish:.3f} s')
+    print(f'Drain + send: {time_fanout:.3f} s')
+    print(f'Delivered: {sent} ({sent / (time_publish + time_fanout):.0f} per second)')
@@ -0,0 +1,64 @@
+#! /usr/bin/env python
+"""Reader-writer lock contention benchmark.
+
+Forks processes doing reads (mostly) and writes under RWLock
+and under an exclusive Lock to compare throughput. Runs on uWSGI stub
+(emulated locks and shared area are shared by forked processes).
+
+NOTE: Run from project root: python tools/bench_rwlock.py --processes 8 --writes 5
+
+"""
+from argparse import ArgumentParser
+from time import perf_counter, sleep
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--operations', type=int, default=2000, help='Operations per process.')
+    parser.add_argument('--writes', type=int, default=5, help='Percent of writes.')
+    parser.add_argument('--work', type=float, default=0.0002, help='Seconds spent under the lock.')
+    args = parser.parse_args()
+
+    import os
+    import sys
+
+    os.environ['UWSGICONF_FORCE_STUB'] = '1'
+    sys.path.insert(0, 'src')
+
+    from uwsgiconf.runtime.locking import Lock, RWLock
+
+    def run(name: str, read, write):
+        started = perf_counter()
+        pids = []
+
+        for proc_idx in range(args.processes):
+            pid = os.fork()
+
+            if not pid:
+                for op_idx in range(args.operations):
+                    side = write if (op_idx + proc_idx) % 100 < args.writes else read
+
+                    with side:
+                        sleep(args.work)
+
+                os._exit(0)
+
+            pids.append(pid)
+
+        for pid in pids:
+            os.waitpid(pid, 0)
+
+        elapsed = perf_counter() - started
+        total = args.processes * args.operations
+        print(f'{name:>10}: {elapsed:.3f} s, {total / elapsed:.0f} operations per second')
+
+    rwlock = RWLock(1)
+    lock = Lock(2)
+
+    # Initialize emulated shared state before forking.
+    with rwlock.write, lock:
+        pass
+
+    print(f'Processes: {args.processes}. Operations: {args.operations}. Writes: {args.writes}%')
+    run('Lock', lock, lock)
+    run('RWLock', rwlock.read, rwlock.write)